@@ -0,0 +1,83 @@
+"""
+Benchmark: Per-call latency with and without the persistent HTTP session
+
+Compares:
+- Per-call connect: a new transport connection around every request
+  (how ``GQLClient.execute`` behaves, and how Client used to work)
+- Pooled session: one keep-alive session opened by ``Client``
+- Pooled session over a Unix domain socket (with ``--uds``)
+
+Requires a running server:
+    uv run --directory rtllib-server rtllib-server --port 9000
+and, for the Unix socket run, a second one:
+    uv run --directory rtllib-server rtllib-server --uds /tmp/rtllib.sock
+"""
+
+import argparse
+import statistics
+import time
+
+from gql import gql, Client as GQLClient
+from gql.transport.httpx import HTTPXTransport
+
+from rtllib import Client
+
+HEALTH_QUERY = """
+    query {
+        health_check {
+            status
+            backend_type
+        }
+    }
+"""
+
+
+def report(label, samples):
+    """Print latency statistics in microseconds."""
+    samples = sorted(samples)
+    p50 = statistics.median(samples) * 1e6
+    p99 = samples[int(len(samples) * 0.99) - 1] * 1e6
+    print(f"{label:<20} p50={p50:9.1f}us  p99={p99:9.1f}us  calls={len(samples)}")
+
+
+def bench_per_call_connect(host, port, iterations):
+    """Connect and close the transport around every request."""
+    transport = HTTPXTransport(url=f"http://{host}:{port}/graphql")
+    gql_client = GQLClient(transport=transport, fetch_schema_from_transport=False)
+    query = gql(HEALTH_QUERY)
+
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        gql_client.execute(query)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_pooled_session(host, port, iterations, uds=None):
+    """Reuse the Client's persistent session for every request."""
+    samples = []
+    with Client(host=host, port=port, auto_start=False, uds=uds) as client:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            client.health_check()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--uds", help="Unix socket path of a second server")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    report("per-call connect", bench_per_call_connect(args.host, args.port, args.iterations))
+    report("pooled session", bench_pooled_session(args.host, args.port, args.iterations))
+    if args.uds:
+        report("pooled session uds", bench_pooled_session(None, None, args.iterations, uds=args.uds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: Per-call client overhead with and without the document cache
+
+Compares, for ``get_ports``:
+- Inline parse: ``gql(...)`` on every call (how Client used to work)
+- Cached document: the compiled document registry in ``rtllib.client``
+
+Requests go to an in-process ``httpx.MockTransport`` so only client-side
+CPU is measured; no server is needed.
+"""
+
+import argparse
+import json
+import time
+
+import httpx
+from gql import gql
+
+from rtllib import Client
+from rtllib.client import _OPERATIONS
+
+PORTS_RESPONSE = json.dumps({
+    "data": {
+        "ports": [
+            {"name": f"p{i}", "direction": "input", "width": 1, "path": None}
+            for i in range(8)
+        ]
+    }
+}).encode()
+
+
+def mock_handler(request):
+    """Return a canned get_ports response."""
+    return httpx.Response(200, content=PORTS_RESPONSE, headers={"Content-Type": "application/json"})
+
+
+def make_client():
+    """Create a Client whose pooled session talks to the mock transport."""
+    client = Client(host="127.0.0.1", port=0, auto_start=False)
+    client._ensure_connection()
+    client._gql_client.transport.client.close()
+    client._gql_client.transport.client = httpx.Client(transport=httpx.MockTransport(mock_handler))
+    return client
+
+
+def bench_inline_parse(client, iterations):
+    """Parse the query text on every call."""
+    variables = {"module": "cpu", "filter": None, "hierarchical": False}
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client._session.execute(gql(_OPERATIONS["get_ports"]), variable_values=variables)
+    return (time.perf_counter() - start) / iterations
+
+
+def bench_cached_document(client, iterations):
+    """Use the Client method backed by the document cache."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        client.get_ports("cpu")
+    return (time.perf_counter() - start) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    client = make_client()
+    try:
+        inline = bench_inline_parse(client, args.iterations)
+        cached = bench_cached_document(client, args.iterations)
+    finally:
+        client.close()
+
+    print(f"{'inline parse':<16} {inline * 1e6:8.1f}us/call")
+    print(f"{'cached document':<16} {cached * 1e6:8.1f}us/call")
+    print(f"{'saved':<16} {(inline - cached) * 1e6:8.1f}us/call ({(1 - cached / inline) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
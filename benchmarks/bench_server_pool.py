@@ -0,0 +1,70 @@
+"""
+Benchmark: Client startup with and without a warm server pool
+
+Measures the time to create a Client and answer its first query with:
+- Cold start: every Client starts its own server
+- Pooled: every Client checks out a pre-started server from a ServerPool
+
+Starts real servers, so ``rtllib-server`` (python mode) or the server
+binary (``--binary``) must be available.
+"""
+
+import argparse
+import statistics
+import time
+
+from rtllib import Client, ServerPool
+
+
+def bench_cold(runs, server_mode, binary_path):
+    """Create ``runs`` clients that each start their own server."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        client = Client(server_mode=server_mode)
+        if binary_path:
+            client._server_manager.binary_path = binary_path
+        client.health_check()
+        samples.append(time.perf_counter() - start)
+        client.close()
+    return samples
+
+
+def bench_pooled(runs, server_mode, binary_path, size):
+    """Create ``runs`` clients that take their server from a warm pool."""
+    samples = []
+    with ServerPool(size=size, server_mode=server_mode, binary_path=binary_path) as pool:
+        # Let the pool fill before measuring
+        while pool.idle_count() < size:
+            time.sleep(0.05)
+
+        for _ in range(runs):
+            start = time.perf_counter()
+            with Client(pool=pool) as client:
+                client.health_check()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(label, samples):
+    """Print client startup statistics in milliseconds."""
+    print(
+        f"{label:<10} median={statistics.median(samples) * 1e3:8.1f}ms  "
+        f"min={min(samples) * 1e3:8.1f}ms  max={max(samples) * 1e3:8.1f}ms  runs={len(samples)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--binary", help="Path to the server binary (binary mode)")
+    args = parser.parse_args()
+
+    server_mode = "binary" if args.binary else "python"
+    report("cold", bench_cold(args.runs, server_mode, args.binary))
+    report("pooled", bench_pooled(args.runs, server_mode, args.binary, args.pool_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: Server startup latency
+
+Measures the time from ``ServerManager.start()`` to a healthy server with:
+- Fixed wait: the old strategy, a 3 second sleep then 1 second polling
+- Event-driven: ready line detection plus exponential-backoff polling
+
+Starts real servers, so ``rtllib-server`` (python mode) or the server
+binary (``--binary``) must be available.
+"""
+
+import argparse
+import statistics
+import time
+
+import httpx
+
+from rtllib import ServerManager
+from rtllib.config import settings
+
+
+class FixedWaitServerManager(ServerManager):
+    """ServerManager with the old fixed-sleep readiness check."""
+
+    def _wait_for_ready(self) -> bool:
+        """Sleep 3 seconds, then poll /health once a second."""
+        start_time = time.time()
+        url = f"http://{self.host}:{self.port}/health"
+        time.sleep(3)
+        while time.time() - start_time < settings.timeouts.startup:
+            if self.process and self.process.poll() is not None:
+                return False
+            try:
+                if httpx.get(url, timeout=2.0).status_code == 200:
+                    return True
+            except (httpx.ConnectError, httpx.TimeoutException):
+                pass
+            time.sleep(1.0)
+        return False
+
+
+def bench(manager_class, runs, server_mode, binary_path):
+    """Start and stop a server ``runs`` times, returning startup times."""
+    samples = []
+    for _ in range(runs):
+        manager = manager_class(server_mode=server_mode, binary_path=binary_path, unix_socket=False)
+        start = time.perf_counter()
+        manager.start()
+        samples.append(time.perf_counter() - start)
+        manager.stop()
+    return samples
+
+
+def report(label, samples):
+    """Print startup statistics in milliseconds."""
+    print(
+        f"{label:<14} median={statistics.median(samples) * 1e3:8.1f}ms  "
+        f"min={min(samples) * 1e3:8.1f}ms  max={max(samples) * 1e3:8.1f}ms  runs={len(samples)}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--binary", help="Path to the server binary (binary mode)")
+    args = parser.parse_args()
+
+    server_mode = "binary" if args.binary else "python"
+    report("fixed wait", bench(FixedWaitServerManager, args.runs, server_mode, args.binary))
+    report("event-driven", bench(ServerManager, args.runs, server_mode, args.binary))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,7 +18,7 @@ def analyze_hierarchy(verilog_file):
         client.elaborate()
 
         # Get hierarchical view
-        modules = client.get_modules(hierarchical=True)
+        modules = client.get_modules(hierarchical=True, include={"instances"})
 
         # Build hierarchy tree
         for mod in modules:
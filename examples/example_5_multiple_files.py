@@ -33,7 +33,7 @@ def main():
             client.compile()
             client.elaborate()
 
-            modules = client.get_modules()
+            modules = client.get_modules(include={"instances"})
             for mod in modules:
                 print(f"  - {mod['name']} ({len(mod['instances'])} instances)")
         else:
@@ -3,6 +3,10 @@
 __version__ = "0.1.0"
 
 from rtllib.client import Client
+from rtllib.async_client import AsyncClient
 from rtllib.server_manager import ServerManager
+from rtllib.server_pool import ServerPool
+from rtllib.sharded_client import ShardedClient
+from rtllib.log_sink import FileLogSink
 
-__all__ = ["Client", "ServerManager"]
+__all__ = ["Client", "AsyncClient", "ServerManager", "ServerPool", "ShardedClient", "FileLogSink"]
@@ -0,0 +1,544 @@
+"""Asyncio RTL Library Client SDK."""
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from contextlib import aclosing
+from typing import AsyncIterator, Iterable, Optional, Callable
+from gql import Client as GQLClient
+from gql.client import AsyncClientSession
+from gql.transport.httpx import HTTPXAsyncTransport
+
+from rtllib.client import Client, _CompiledDocument, _CompiledRequest, _get_document, _modules_document
+from rtllib.server_manager import ServerManager
+from rtllib.server_pool import ServerPool
+from rtllib.config import settings
+from rtllib.types import (
+    ModuleInfo,
+    InstanceInfo,
+    PortInfo,
+    NetInfo,
+    ReadVerilogResult,
+    ReadFilelistResult,
+    AddPortResult,
+    AddNetResult,
+    HealthCheckResult,
+    LogData,
+    LogStreamStats,
+)
+from rtllib.log_stream import LogStreamClient
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient:
+    """Asyncio RTL Library Client with concurrent in-flight queries.
+
+    Provides the core :class:`~rtllib.Client` operations as coroutines:
+    health_check, reading Verilog files and filelists, compile, elaborate,
+    get_modules, the single-module get_ports/get_nets/get_instances,
+    add_port/add_net, and log streaming (including :meth:`logs`). The
+    batched and bulk methods (``get_*_many``, ``batch``, ``add_ports``/
+    ``add_nets``, ``apply_eco``), ``iter_*`` pagination, the response
+    cache, the journal and ``reload`` are only on :class:`~rtllib.Client`;
+    concurrency takes the place of batching here. All calls share one
+    async HTTP session, so many requests can be in flight at once:
+
+    Example:
+        >>> async with AsyncClient(host="127.0.0.1", port=9000) as client:
+        ...     ports = await asyncio.gather(*(client.get_ports(m) for m in modules))
+    """
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        auto_start: Optional[bool] = None,
+        server_mode: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        uds: Optional[str] = None,
+        pool: Optional[ServerPool] = None,
+        start: Optional[str] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            host: Server host (defaults to config)
+            port: Server port, None for auto-assign (defaults to config)
+            auto_start: Auto-start server if True (defaults to config)
+            server_mode: "python" or "binary" (defaults to config)
+            max_concurrency: Maximum number of requests in flight at once
+                (defaults to config)
+            uds: Unix domain socket path of an external server. Auto-started
+                servers use one when ``server.unix_socket`` is enabled.
+            pool: Take a warm server from this pool instead of starting one,
+                and return it on close
+            start: When to start an auto-started server: "lazy" on first use,
+                or "background" right away on a background thread, so it
+                boots while the caller does other work (defaults to config)
+        """
+        self._auto_start = auto_start if auto_start is not None else settings.auto_start
+        self._server_manager: Optional[ServerManager] = None
+        self._pool = pool
+        self._design_modified = False
+        self._gql_client: Optional[GQLClient] = None
+        self._session: Optional[AsyncClientSession] = None
+        self._log_stream_client: Optional[LogStreamClient] = None
+        self._external_server = False
+
+        self.max_concurrency = (
+            max_concurrency
+            if max_concurrency is not None
+            else settings.server.get("max_concurrency", 100)
+        )
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._connect_lock = asyncio.Lock()
+
+        self.uds = uds
+
+        # If host and port (or a socket path) provided, assume external server
+        if uds is not None:
+            self._external_server = True
+            self.host = host or "localhost"
+            self.port = port
+        elif host is not None and port is not None:
+            self._external_server = True
+            self.host = host
+            self.port = port
+        else:
+            # Will be set by server manager
+            self.host = host or settings.server.host
+            self.port = port if port is not None else getattr(settings.server, "port", None)
+
+            if self._auto_start and pool is None:
+                self._server_manager = ServerManager(
+                    server_mode=server_mode,
+                    host=self.host,
+                    port=self.port,
+                )
+
+        self._start_mode = start or settings.startup.get("mode", "lazy")
+        if self._start_mode not in ("lazy", "background"):
+            raise ValueError(f"Unknown start mode: {self._start_mode}")
+        self._start_future: Optional[Future] = None
+        if self._start_mode == "background" and self._server_manager is not None:
+            self._start_future = self._server_manager.start_async()
+
+    async def _ensure_connection(self) -> None:
+        """Ensure connection to server is established."""
+        if self._session is not None:
+            return
+
+        async with self._connect_lock:
+            if self._session is not None:
+                return
+
+            # Wait for a background start (raises its RuntimeError)
+            if self._start_future is not None:
+                future, self._start_future = self._start_future, None
+                self.host, self.port = await asyncio.wrap_future(future)
+                self.uds = self._server_manager.uds
+
+            # Take a warm server from the pool
+            if self._pool is not None and self._server_manager is None:
+                self._server_manager = await asyncio.to_thread(self._pool.checkout)
+                self._design_modified = False
+                self.host, self.port, self.uds = (
+                    self._server_manager.host,
+                    self._server_manager.port,
+                    self._server_manager.uds,
+                )
+
+            # Start server if needed (blocking, so keep it off the event loop)
+            if self._server_manager and not self._server_manager.is_running():
+                self.host, self.port = await asyncio.to_thread(self._server_manager.start)
+                self.uds = self._server_manager.uds
+
+            url = f"{self._base_url()}/graphql"
+            logger.info(f"Connecting to server at {url}" + (f" via {self.uds}" if self.uds else ""))
+
+            # Size the pool so every permitted in-flight request gets a connection
+            transport = HTTPXAsyncTransport(
+                url=url,
+                timeout=settings.timeouts.request,
+                **Client._transport_options(
+                    self.uds, asynchronous=True, min_connections=self.max_concurrency
+                ),
+            )
+            gql_client = GQLClient(transport=transport, fetch_schema_from_transport=False)
+            self._session = await gql_client.connect_async()
+            self._gql_client = gql_client
+
+    def _base_url(self) -> str:
+        """Get the server base URL (host is unused over a Unix socket)."""
+        if self.uds:
+            return "http://localhost"
+        return f"http://{self.host}:{self.port}"
+
+    async def _execute(self, operation: str, variable_values: Optional[dict] = None) -> dict:
+        """Execute a registered operation on the shared async session.
+
+        Args:
+            operation: Operation name in the document registry
+            variable_values: Optional variables for the document
+
+        Returns:
+            dict: The "data" part of the GraphQL response
+        """
+        return await self._execute_document(_get_document(operation), variable_values)
+
+    async def _execute_document(self, compiled: _CompiledDocument, variable_values: Optional[dict] = None) -> dict:
+        """Execute a compiled document on the shared async session.
+
+        Args:
+            compiled: Compiled document
+            variable_values: Optional variables for the document
+
+        Returns:
+            dict: The "data" part of the GraphQL response
+        """
+        await self._ensure_connection()
+
+        request = _CompiledRequest(compiled, variable_values)
+        if compiled.is_mutation:
+            self._design_modified = True
+        async with self._semaphore:
+            return await self._session.execute(request)
+
+    async def health_check(self) -> HealthCheckResult:
+        """Check server health.
+
+        Returns:
+            HealthCheckResult: Health check result
+        """
+        result = await self._execute("health_check")
+        return result["health_check"]
+
+    async def read_verilog(self, path: str) -> ReadVerilogResult:
+        """Read and parse a Verilog file.
+
+        Args:
+            path: Path to the Verilog file
+
+        Returns:
+            ReadVerilogResult: Result of the operation
+        """
+        result = await self._execute("read_verilog", variable_values={"path": path})
+        return result["read_verilog"]
+
+    async def compile(self) -> str:
+        """Compile the loaded Verilog code.
+
+        Returns:
+            str: Result message
+        """
+        result = await self._execute("compile")
+        return result["compile"]
+
+    async def elaborate(self) -> str:
+        """Elaborate the compiled design.
+
+        Returns:
+            str: Result message
+        """
+        result = await self._execute("elaborate")
+        return result["elaborate"]
+
+    async def get_modules(
+        self,
+        filter: Optional[str] = None,
+        hierarchical: bool = False,
+        include: Optional[Iterable[str]] = None,
+    ) -> list[ModuleInfo]:
+        """Get all modules in the design.
+
+        Args:
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include hierarchical instances as flat list with paths
+            include: Nested lists to fetch, any of "ports", "instances" and
+                "nets" (default: all)
+
+        Returns:
+            list[ModuleInfo]: List of module information with nested objects
+        """
+        result = await self._execute_document(_modules_document(include), variable_values={
+            "filter": filter,
+            "hierarchical": hierarchical
+        })
+        return result["modules"]
+
+    async def get_instances(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[InstanceInfo]:
+        """Get all instances in a specific module.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include instances from sub-hierarchy
+
+        Returns:
+            list[InstanceInfo]: List of instance information
+        """
+        result = await self._execute("get_instances", variable_values={
+            "module": module,
+            "filter": filter,
+            "hierarchical": hierarchical
+        })
+        return result["instances"]
+
+    async def get_ports(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[PortInfo]:
+        """Get all ports of a specific module.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include ports from sub-instances
+
+        Returns:
+            list[PortInfo]: List of port information
+        """
+        result = await self._execute("get_ports", variable_values={
+            "module": module,
+            "filter": filter,
+            "hierarchical": hierarchical
+        })
+        return result["ports"]
+
+    async def get_nets(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[NetInfo]:
+        """Get all nets/wires in a specific module.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include nets from sub-instances
+
+        Returns:
+            list[NetInfo]: List of net information
+        """
+        result = await self._execute("get_nets", variable_values={
+            "module": module,
+            "filter": filter,
+            "hierarchical": hierarchical
+        })
+        return result["nets"]
+
+    async def read_verilog_filelist(self, filelist_path: str) -> ReadFilelistResult:
+        """Read multiple Verilog files from a filelist.
+
+        Args:
+            filelist_path: Path to the filelist file
+
+        Returns:
+            ReadFilelistResult: Result of the operation
+        """
+        result = await self._execute(
+            "read_verilog_filelist", variable_values={"filelist_path": filelist_path}
+        )
+        return result["read_verilog_filelist"]
+
+    async def add_port(
+        self,
+        module: str,
+        port_name: str,
+        direction: str,
+        width: int
+    ) -> AddPortResult:
+        """Add a port to a module (session-based modification).
+
+        Args:
+            module: Name of the module
+            port_name: Name of the port to add
+            direction: Port direction ("input", "output", "inout")
+            width: Bit width of the port
+
+        Returns:
+            AddPortResult: Result of the operation
+        """
+        result = await self._execute("add_port", variable_values={
+            "module": module,
+            "port_name": port_name,
+            "direction": direction,
+            "width": width
+        })
+        return result["add_port"]
+
+    async def add_net(
+        self,
+        module: str,
+        net_name: str,
+        width: int,
+        net_type: str = "wire"
+    ) -> AddNetResult:
+        """Add a net/wire to a module (session-based modification).
+
+        Args:
+            module: Name of the module
+            net_name: Name of the net to add
+            width: Bit width of the net
+            net_type: Type of the net ("wire", "reg", "logic")
+
+        Returns:
+            AddNetResult: Result of the operation
+        """
+        result = await self._execute("add_net", variable_values={
+            "module": module,
+            "net_name": net_name,
+            "width": width,
+            "net_type": net_type
+        })
+        return result["add_net"]
+
+    async def start_log_streaming(
+        self,
+        log_callback: Optional[Callable[[dict], None]] = None,
+        batch_callback: Optional[Callable[[list[dict]], None]] = None,
+        min_level: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Start streaming logs from the server in real-time.
+
+        Logs are received and dispatched on LogStreamClient background
+        threads, so the callback runs on a thread rather than on the event loop.
+
+        Args:
+            log_callback: Optional callback function to handle log messages.
+                         If None, logs will be printed to stdout.
+            batch_callback: Optional callback receiving lists of log messages
+                         instead, to handle many messages per call. Pass a
+                         :class:`rtllib.FileLogSink` to archive logs to files.
+            min_level: Only stream messages at this level or above (e.g. "WARNING")
+            include: Only stream messages matching one of these regular expressions
+            exclude: Drop messages matching one of these regular expressions
+        """
+        await self._ensure_connection()
+
+        if self._log_stream_client and self._log_stream_client.is_running():
+            logger.warning("Log streaming is already active")
+            return
+
+        self._log_stream_client = LogStreamClient(
+            host=self.host,
+            port=self.port,
+            log_callback=log_callback,
+            uds=self.uds,
+            batch_callback=batch_callback,
+            min_level=min_level,
+            include=include,
+            exclude=exclude,
+        )
+        self._log_stream_client.start()
+        logger.info("Log streaming started")
+
+    async def stop_log_streaming(self) -> None:
+        """Stop the log streaming."""
+        if self._log_stream_client:
+            await asyncio.to_thread(self._log_stream_client.stop)
+            self._log_stream_client = None
+            logger.info("Log streaming stopped")
+
+    async def logs(
+        self,
+        min_level: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> AsyncIterator[LogData]:
+        """Iterate over the server's log messages as they arrive.
+
+        The subscription runs on the caller's event loop, independent of
+        :meth:`start_log_streaming`. Breaking out of the loop ends it once
+        the generator is finalized; wrap it in ``contextlib.aclosing`` to
+        end it right away.
+
+        Args:
+            min_level: Only stream messages at this level or above (e.g. "WARNING")
+            include: Only stream messages matching one of these regular expressions
+            exclude: Drop messages matching one of these regular expressions
+
+        Yields:
+            LogData: Log records, in order
+
+        Example:
+            >>> async for record in client.logs(min_level="WARNING"):
+            ...     print(f"[{record['level']}] {record['message']}")
+        """
+        await self._ensure_connection()
+
+        stream = LogStreamClient(
+            host=self.host,
+            port=self.port,
+            uds=self.uds,
+            min_level=min_level,
+            include=include,
+            exclude=exclude,
+        )
+        async with aclosing(stream.records()) as records:
+            async for log_data in records:
+                yield log_data
+
+    def log_stream_stats(self) -> Optional[LogStreamStats]:
+        """Get counters of received, delivered and dropped log records and reconnects.
+
+        Returns:
+            Optional[LogStreamStats]: Counters of the active log stream,
+                None if log streaming is not active
+        """
+        return self._log_stream_client.stats() if self._log_stream_client is not None else None
+
+    def is_log_streaming_active(self) -> bool:
+        """Check if log streaming is currently active.
+
+        Returns:
+            bool: True if log streaming is running
+        """
+        return self._log_stream_client is not None and self._log_stream_client.is_running()
+
+    async def close(self) -> None:
+        """Close the client and stop the server if managed."""
+        # Stop log streaming if active, closing sinks such as FileLogSink
+        if self._log_stream_client:
+            await asyncio.to_thread(self._log_stream_client.stop, close_callbacks=True)
+            self._log_stream_client = None
+
+        if self._gql_client:
+            if self._session is not None:
+                await self._gql_client.close_async()
+                self._session = None
+            self._gql_client = None
+
+        if self._pool is not None and self._server_manager is not None:
+            # Hand the server back, recycling it if this client changed the design
+            await asyncio.to_thread(
+                self._pool.checkin, self._server_manager, recycle=self._design_modified
+            )
+            self._server_manager = None
+        elif self._server_manager:
+            await asyncio.to_thread(self._server_manager.stop)
+
+    async def __aenter__(self):
+        """Async context manager entry.
+
+        Connects right away, unless the server is starting in the
+        background, in which case the first call waits for it.
+        """
+        if self._start_future is None:
+            await self._ensure_connection()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
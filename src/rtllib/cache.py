@@ -0,0 +1,104 @@
+"""Client-side response cache."""
+
+import json
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from rtllib.types import CacheInfo
+
+
+class ResponseCache:
+    """LRU cache of query responses, bounded in bytes.
+
+    Responses are stored as compact JSON text, so every hit returns a fresh
+    copy the caller is free to modify. The size bound applies to that text.
+
+    Entries belong to a design epoch. Any change to the design must call
+    :meth:`invalidate`, which drops every entry and starts a new epoch.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached responses
+        """
+        self.max_bytes = max_bytes
+        self.design_epoch = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key (operation and variables)
+
+        Returns:
+            Optional[Any]: A copy of the cached response, None on a miss
+        """
+        text = self._entries.get(key)
+        if text is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return json.loads(text)
+
+    def put(self, key: Hashable, value: Any, epoch: Optional[int] = None) -> None:
+        """Store a response, evicting least recently used entries as needed.
+
+        Responses larger than the whole cache are not stored.
+
+        Args:
+            key: Cache key (operation and variables)
+            value: JSON-serializable response
+            epoch: Design epoch the response was requested in. The response
+                is dropped if the design changed since then.
+        """
+        if epoch is not None and epoch != self.design_epoch:
+            return
+
+        text = json.dumps(value, separators=(",", ":"))
+        size = len(text)
+        if size > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+
+        while self._entries and self._size + size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+        self._entries[key] = text
+        self._size += size
+
+    def invalidate(self) -> None:
+        """Drop all entries and start a new design epoch."""
+        self._entries.clear()
+        self._size = 0
+        self.design_epoch += 1
+
+    def info(self) -> CacheInfo:
+        """Get cache statistics.
+
+        Returns:
+            CacheInfo: Hit/miss counters and current size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "design_epoch": self.design_epoch,
+        }
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
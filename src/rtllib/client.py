@@ -1,11 +1,19 @@
 """RTL Library Client SDK."""
 
+import importlib.util
 import logging
-from typing import Optional, Callable
-from gql import gql, Client as GQLClient
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Hashable, Iterable, Iterator, Optional, Callable, Union
+import httpx
+from graphql import OperationType, parse, print_ast
+from gql import Client as GQLClient, GraphQLRequest
+from gql.client import SyncClientSession
+from gql.transport.exceptions import TransportConnectionFailed, TransportQueryError
 from gql.transport.httpx import HTTPXTransport
 
 from rtllib.server_manager import ServerManager
+from rtllib.server_pool import ServerPool
 from rtllib.config import settings
 from rtllib.types import (
     ModuleInfo,
@@ -17,12 +25,560 @@ from rtllib.types import (
     AddPortResult,
     AddNetResult,
     HealthCheckResult,
+    PortSpec,
+    NetSpec,
+    EcoSpec,
+    EcoResult,
+    CacheInfo,
+    LogStreamStats,
+    ReloadResult,
 )
-from rtllib.log_stream import LogStreamClient
+from rtllib.cache import ResponseCache
+from rtllib.eco import load_eco
+from rtllib.journal import MutationJournal
+from rtllib.log_stream import LogIterator, LogStreamClient
+from rtllib.sources import SourceTracker
 
 logger = logging.getLogger(__name__)
 
 
+# GraphQL documents for every Client operation, keyed by operation name.
+# Each one is parsed once, on first use, and cached in _DOCUMENT_CACHE.
+_OPERATIONS: dict[str, str] = {
+    "health_check": """
+    query {
+        health_check {
+            status
+            backend_type
+        }
+    }
+    """,
+    "read_verilog": """
+    mutation ReadVerilog($path: String!) {
+        read_verilog(path: $path) {
+            status
+            file
+            modules_found
+        }
+    }
+    """,
+    "compile": """
+    mutation {
+        compile
+    }
+    """,
+    "elaborate": """
+    mutation {
+        elaborate
+    }
+    """,
+    "get_modules": """
+    query GetModules($filter: String, $hierarchical: Boolean!) {
+        modules(filter: $filter, hierarchical: $hierarchical) {
+            name
+            file
+            path
+            ports {
+                name
+                direction
+                width
+                path
+            }
+            instances {
+                name
+                module
+                parent
+                path
+            }
+            nets {
+                name
+                width
+                net_type
+                path
+            }
+        }
+    }
+    """,
+    "get_instances": """
+    query GetInstances($module: String!, $filter: String, $hierarchical: Boolean!) {
+        instances(module: $module, filter: $filter, hierarchical: $hierarchical) {
+            name
+            module
+            parent
+            path
+        }
+    }
+    """,
+    "get_ports": """
+    query GetPorts($module: String!, $filter: String, $hierarchical: Boolean!) {
+        ports(module: $module, filter: $filter, hierarchical: $hierarchical) {
+            name
+            direction
+            width
+            path
+        }
+    }
+    """,
+    "get_nets": """
+    query GetNets($module: String!, $filter: String, $hierarchical: Boolean!) {
+        nets(module: $module, filter: $filter, hierarchical: $hierarchical) {
+            name
+            width
+            net_type
+            path
+        }
+    }
+    """,
+    "read_verilog_filelist": """
+    mutation ReadVerilogFilelist($filelist_path: String!) {
+        read_verilog_filelist(filelist_path: $filelist_path) {
+            success
+            files_read
+            modules_found
+            message
+        }
+    }
+    """,
+    "add_port": """
+    mutation AddPort($module: String!, $port_name: String!, $direction: String!, $width: Int!) {
+        add_port(module: $module, port_name: $port_name, direction: $direction, width: $width) {
+            success
+            module
+            port_name
+            message
+        }
+    }
+    """,
+    "add_net": """
+    mutation AddNet($module: String!, $net_name: String!, $width: Int!, $net_type: String!) {
+        add_net(module: $module, net_name: $net_name, width: $width, net_type: $net_type) {
+            success
+            module
+            net_name
+            message
+        }
+    }
+    """,
+}
+
+_DOCUMENT_CACHE: dict[Hashable, "_CompiledDocument"] = {}
+
+# Selection sets of the per-module queries, used to build batched documents
+_SELECTIONS: dict[str, str] = {
+    "ports": "name direction width path",
+    "instances": "name module parent path",
+    "nets": "name width net_type path",
+}
+
+
+class _CompiledDocument:
+    """A GraphQL document parsed once, together with its printed query text."""
+
+    __slots__ = ("document", "query", "is_mutation")
+
+    def __init__(self, source: str):
+        """Parse a GraphQL document.
+
+        Args:
+            source: GraphQL document text
+        """
+        self.document = parse(source)
+        self.query = print_ast(self.document)
+        self.is_mutation = any(
+            getattr(definition, "operation", None) is OperationType.MUTATION
+            for definition in self.document.definitions
+        )
+
+
+class _CompiledRequest(GraphQLRequest):
+    """GraphQLRequest built from a compiled document.
+
+    Skips both the parse done by ``gql()`` and the ``print_ast`` done by
+    ``GraphQLRequest.payload`` on every request.
+    """
+
+    def __init__(self, compiled: _CompiledDocument, variable_values: Optional[dict] = None):
+        """Create a request for a compiled document.
+
+        Args:
+            compiled: Compiled document from the registry
+            variable_values: Optional variables for the document
+        """
+        super().__init__(compiled.document, variable_values=variable_values)
+        self._query = compiled.query
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """Request payload using the cached query text."""
+        payload: dict[str, Any] = {"query": self._query}
+        if self.variable_values:
+            payload["variables"] = self.variable_values
+        return payload
+
+
+def _get_document(operation: str) -> _CompiledDocument:
+    """Get the compiled document for an operation, parsing it on first use.
+
+    Args:
+        operation: Operation name (a key of the document registry)
+
+    Returns:
+        _CompiledDocument: Cached compiled document
+
+    Raises:
+        KeyError: If the operation is unknown
+    """
+    compiled = _DOCUMENT_CACHE.get(operation)
+    if compiled is None:
+        compiled = _DOCUMENT_CACHE[operation] = _CompiledDocument(_OPERATIONS[operation])
+    return compiled
+
+
+def _get_generated_document(key: Hashable, build: Callable[[], str]) -> _CompiledDocument:
+    """Get the compiled document for a generated query, building it on first use.
+
+    Args:
+        key: Cache key identifying the generated document
+        build: Callable returning the document text
+
+    Returns:
+        _CompiledDocument: Cached compiled document
+    """
+    compiled = _DOCUMENT_CACHE.get(key)
+    if compiled is None:
+        compiled = _DOCUMENT_CACHE[key] = _CompiledDocument(build())
+    return compiled
+
+
+def _module_fields(include: Optional[Iterable[str]]) -> tuple[str, ...]:
+    """Validate and normalize the nested lists selected on modules.
+
+    Args:
+        include: Nested lists to select ("ports", "instances", "nets"),
+            None for all of them
+
+    Returns:
+        tuple: Sorted field names
+
+    Raises:
+        ValueError: If include names an unknown field
+    """
+    if include is None:
+        return tuple(sorted(_SELECTIONS))
+
+    fields = tuple(sorted(set(include)))
+    unknown = set(fields) - set(_SELECTIONS)
+    if unknown:
+        raise ValueError(
+            f"Unknown get_modules fields: {', '.join(sorted(unknown))} "
+            f"(expected some of {', '.join(sorted(_SELECTIONS))})"
+        )
+    return fields
+
+
+def _module_selection(fields: tuple[str, ...]) -> str:
+    """Build the selection set of a module with the given nested lists."""
+    nested = " ".join(f"{field} {{ {_SELECTIONS[field]} }}" for field in fields)
+    return f"name file path {nested}"
+
+
+def _modules_document(include: Optional[Iterable[str]]) -> _CompiledDocument:
+    """Get the get_modules document selecting only the given nested lists.
+
+    Args:
+        include: Nested lists to select ("ports", "instances", "nets"),
+            None for all of them
+
+    Returns:
+        _CompiledDocument: Cached compiled document for this field set
+
+    Raises:
+        ValueError: If include names an unknown field
+    """
+    if include is None:
+        return _get_document("get_modules")
+
+    fields = _module_fields(include)
+
+    def build() -> str:
+        return (
+            "query GetModules($filter: String, $hierarchical: Boolean!) { "
+            f"modules(filter: $filter, hierarchical: $hierarchical) {{ {_module_selection(fields)} }} }}"
+        )
+
+    return _get_generated_document(("get_modules", fields), build)
+
+
+def _page_document(field: str, include: Optional[Iterable[str]] = None) -> _CompiledDocument:
+    """Get the document fetching one page of modules, instances or nets.
+
+    Pages are requested with ``offset`` and ``limit`` arguments on the
+    root field.
+
+    Args:
+        field: Root query field ("modules", "instances" or "nets")
+        include: Nested lists to select on modules, None for all of them
+
+    Returns:
+        _CompiledDocument: Cached compiled document
+    """
+    if field == "modules":
+        fields = _module_fields(include)
+        params = "$filter: String, $hierarchical: Boolean!"
+        args = "filter: $filter, hierarchical: $hierarchical"
+        selection = _module_selection(fields)
+    else:
+        fields = ()
+        params = "$module: String!, $filter: String, $hierarchical: Boolean!"
+        args = "module: $module, filter: $filter, hierarchical: $hierarchical"
+        selection = _SELECTIONS[field]
+
+    def build() -> str:
+        return (
+            f"query Page({params}, $offset: Int!, $limit: Int!) {{ "
+            f"{field}({args}, offset: $offset, limit: $limit) {{ {selection} }} }}"
+        )
+
+    return _get_generated_document(("page", field, fields), build)
+
+
+def _is_unknown_argument_error(error: TransportQueryError) -> bool:
+    """Check if a query failed because the server lacks an argument."""
+    return any("Unknown argument" in str(err.get("message", "")) for err in error.errors or [])
+
+
+# Argument types and selection sets of the mutations that can be sent in bulk
+_BULK_MUTATIONS: dict[str, tuple[dict[str, str], str]] = {
+    "read_verilog": ({"path": "String!"}, "status file modules_found"),
+    "read_verilog_filelist": ({"filelist_path": "String!"}, "success files_read modules_found message"),
+    "add_port": (
+        {"module": "String!", "port_name": "String!", "direction": "String!", "width": "Int!"},
+        "success module port_name message",
+    ),
+    "add_net": (
+        {"module": "String!", "net_name": "String!", "width": "Int!", "net_type": "String!"},
+        "success module net_name message",
+    ),
+}
+
+
+def _build_bulk_mutation(field: str, count: int) -> str:
+    """Build one mutation document applying the same mutation ``count`` times.
+
+    Mutation ``i`` is aliased ``m{i}`` and takes its arguments from the
+    variables ``<argument>_{i}``. The server runs them in order.
+
+    Args:
+        field: Mutation field in _BULK_MUTATIONS
+        count: Number of aliased mutations
+
+    Returns:
+        str: GraphQL document text
+    """
+    arg_types, selection = _BULK_MUTATIONS[field]
+    params = []
+    selections = []
+    for i in range(count):
+        params.extend(f"${name}_{i}: {type_}" for name, type_ in arg_types.items())
+        args = ", ".join(f"{name}: ${name}_{i}" for name in arg_types)
+        selections.append(f"m{i}: {field}({args}) {{ {selection} }}")
+    return f"mutation Bulk({', '.join(params)}) {{ {' '.join(selections)} }}"
+
+
+def _build_batch_query(fields: tuple[str, ...]) -> str:
+    """Build one query document with an aliased selection per batched call.
+
+    Call ``i`` is aliased ``q{i}`` and takes its arguments from the
+    variables ``module_{i}``, ``filter_{i}`` and ``hierarchical_{i}``.
+
+    Args:
+        fields: Root query field of each call ("ports", "instances" or "nets")
+
+    Returns:
+        str: GraphQL document text
+    """
+    params = []
+    selections = []
+    for i, field in enumerate(fields):
+        params.append(f"$module_{i}: String!, $filter_{i}: String, $hierarchical_{i}: Boolean!")
+        selections.append(
+            f"q{i}: {field}(module: $module_{i}, filter: $filter_{i}, "
+            f"hierarchical: $hierarchical_{i}) {{ {_SELECTIONS[field]} }}"
+        )
+    return f"query Batch({', '.join(params)}) {{ {' '.join(selections)} }}"
+
+
+def _query_error(error: dict) -> TransportQueryError:
+    """Wrap a single GraphQL error from a batched response."""
+    return TransportQueryError(str(error.get("message", error)), errors=[error])
+
+
+class BatchResult:
+    """Placeholder for the result of a call queued on a :class:`QueryBatch`."""
+
+    __slots__ = ("_done", "_value", "_error")
+
+    def __init__(self):
+        """Initialize an unresolved result."""
+        self._done = False
+        self._value: Any = None
+        self._error: Optional[Exception] = None
+
+    def _set(self, value: Any = None, error: Optional[Exception] = None) -> None:
+        """Resolve the result with a value or an error."""
+        self._done = True
+        self._value = value
+        self._error = error
+
+    def done(self) -> bool:
+        """Check if the batch holding this call has been executed.
+
+        Returns:
+            bool: True if the result is available
+        """
+        return self._done
+
+    def result(self) -> Any:
+        """Get the value of the call.
+
+        Returns:
+            Any: Same value the equivalent Client method would return
+
+        Raises:
+            RuntimeError: If the batch has not been executed yet
+            TransportQueryError: If the server reported an error for this call
+        """
+        if not self._done:
+            raise RuntimeError("Batch has not been executed yet")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+
+class QueryBatch:
+    """Collects per-module queries and sends them as aliased GraphQL documents.
+
+    Queued calls are merged into as few documents as possible, each holding
+    at most ``max_size`` calls, and the response is split back out per call.
+
+    Example:
+        >>> with client.batch() as batch:
+        ...     ports = batch.get_ports("cpu")
+        ...     nets = batch.get_nets("cpu")
+        >>> ports.result()
+    """
+
+    def __init__(self, client: "Client", max_size: Optional[int] = None):
+        """Initialize the batch.
+
+        Args:
+            client: Client used to execute the batch
+            max_size: Maximum calls per document (defaults to config)
+        """
+        self._client = client
+        self.max_size = max_size or settings.batch.max_size
+        self._pending: list[tuple[str, dict, BatchResult]] = []
+
+    def _queue(self, field: str, module: str, filter: Optional[str], hierarchical: bool) -> BatchResult:
+        """Queue a per-module query."""
+        result = BatchResult()
+        self._pending.append((field, {
+            "module": module,
+            "filter": filter,
+            "hierarchical": hierarchical,
+        }, result))
+        return result
+
+    def get_instances(self, module: str, filter: Optional[str] = None, hierarchical: bool = False) -> BatchResult:
+        """Queue :meth:`Client.get_instances`.
+
+        Returns:
+            BatchResult: Resolves to list[InstanceInfo]
+        """
+        return self._queue("instances", module, filter, hierarchical)
+
+    def get_ports(self, module: str, filter: Optional[str] = None, hierarchical: bool = False) -> BatchResult:
+        """Queue :meth:`Client.get_ports`.
+
+        Returns:
+            BatchResult: Resolves to list[PortInfo]
+        """
+        return self._queue("ports", module, filter, hierarchical)
+
+    def get_nets(self, module: str, filter: Optional[str] = None, hierarchical: bool = False) -> BatchResult:
+        """Queue :meth:`Client.get_nets`.
+
+        Returns:
+            BatchResult: Resolves to list[NetInfo]
+        """
+        return self._queue("nets", module, filter, hierarchical)
+
+    def execute(self) -> None:
+        """Send all queued calls and resolve their results."""
+        pending, self._pending = self._pending, []
+
+        for start in range(0, len(pending), self.max_size):
+            chunk = pending[start:start + self.max_size]
+            while chunk:
+                chunk = self._execute_chunk(chunk)
+
+    def _execute_chunk(self, chunk: list[tuple[str, dict, BatchResult]]) -> list[tuple[str, dict, BatchResult]]:
+        """Send one aliased document and resolve the results it carries.
+
+        An error in a non-null root field nulls the whole response, so calls
+        without an error of their own may come back without data. Those are
+        returned to be sent again without the failing calls.
+
+        Returns:
+            list: Calls that must be retried
+        """
+        # Grouped by field, so mixes of the same calls in any order share one
+        # cached document (each call keeps its BatchResult, wherever it goes)
+        chunk = sorted(chunk, key=lambda call: call[0])
+        fields = tuple(field for field, _, _ in chunk)
+        compiled = _get_generated_document(("batch", fields), lambda: _build_batch_query(fields))
+
+        variables = {}
+        for i, (_, args, _) in enumerate(chunk):
+            for name, value in args.items():
+                variables[f"{name}_{i}"] = value
+
+        try:
+            data = self._client._execute_document(compiled, variables)
+            errors: list[dict] = []
+        except TransportQueryError as e:
+            data = e.data or {}
+            errors = e.errors or []
+
+        retry = []
+        for i, call in enumerate(chunk):
+            alias = f"q{i}"
+            alias_errors = [err for err in errors if (err.get("path") or [None])[0] == alias]
+            if alias_errors:
+                call[2]._set(error=_query_error(alias_errors[0]))
+            elif alias in data:
+                call[2]._set(value=data[alias])
+            else:
+                retry.append(call)
+
+        if len(retry) == len(chunk):
+            # No error could be tied to a single call, so fail them all
+            error = errors[0] if errors else {"message": "Batch returned no data"}
+            for call in retry:
+                call[2]._set(error=_query_error(error))
+            return []
+        return retry
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit, executes the batch unless an error was raised."""
+        if exc_type is None:
+            self.execute()
+
+
 class Client:
     """RTL Library Client for communicating with the server."""
 
@@ -32,6 +588,11 @@ class Client:
         port: Optional[int] = None,
         auto_start: Optional[bool] = None,
         server_mode: Optional[str] = None,
+        cache_max_bytes: Optional[int] = None,
+        uds: Optional[str] = None,
+        pool: Optional[ServerPool] = None,
+        start: Optional[str] = None,
+        journal: Optional[bool] = None,
     ):
         """Initialize the client.
 
@@ -40,15 +601,56 @@ class Client:
             port: Server port, None for auto-assign (defaults to config)
             auto_start: Auto-start server if True (defaults to config)
             server_mode: "python" or "binary" (defaults to config)
+            cache_max_bytes: Size bound of the query response cache,
+                0 to disable it (defaults to config)
+            uds: Unix domain socket path of an external server. Auto-started
+                servers use one when ``server.unix_socket`` is enabled.
+            pool: Take a warm server from this pool instead of starting one,
+                and return it on close
+            start: When to start an auto-started server: "lazy" on first use,
+                or "background" right away on a background thread, so it
+                boots while the caller does other work (defaults to config)
+            journal: Record design-changing calls and replay them when a
+                managed server has to be restarted (defaults to config)
         """
         self._auto_start = auto_start if auto_start is not None else settings.auto_start
         self._server_manager: Optional[ServerManager] = None
+        self._pool = pool
+        self._design_modified = False
+        if journal is None:
+            journal = settings.journal.enabled
+        self.journal: Optional[MutationJournal] = MutationJournal() if journal else None
+        self._replaying = False
+        # Set while _replace_server runs, and when the rebuilt design alone
+        # exceeds the memory budget (until the design changes again)
+        self._replacing = False
+        self._budget_exceeded_by_design = False
+
+        # Loaded sources and the last compile/elaborate results, for reload()
+        self._sources = SourceTracker()
+        self._last_compile: Optional[str] = None
+        self._last_elaborate: Optional[str] = None
+        self._read_since_compile = False
+
         self._gql_client: Optional[GQLClient] = None
+        self._session: Optional[SyncClientSession] = None
+        self._pagination_supported: Optional[bool] = None
+
+        # Opt-in response cache, cleared whenever the design changes
+        if cache_max_bytes is None:
+            cache_max_bytes = settings.cache.max_bytes
+        self._cache: Optional[ResponseCache] = ResponseCache(cache_max_bytes) if cache_max_bytes > 0 else None
         self._log_stream_client: Optional[LogStreamClient] = None
         self._external_server = False
 
-        # If host and port provided, assume external server
-        if host is not None and port is not None:
+        self.uds = uds
+
+        # If host and port (or a socket path) provided, assume external server
+        if uds is not None:
+            self._external_server = True
+            self.host = host or "localhost"
+            self.port = port
+        elif host is not None and port is not None:
             self._external_server = True
             self.host = host
             self.port = port
@@ -57,29 +659,340 @@ class Client:
             self.host = host or settings.server.host
             self.port = port if port is not None else getattr(settings.server, "port", None)
 
-            if self._auto_start:
+            if self._auto_start and pool is None:
                 self._server_manager = ServerManager(
                     server_mode=server_mode,
                     host=self.host,
                     port=self.port,
                 )
 
+        self._start_mode = start or settings.startup.get("mode", "lazy")
+        if self._start_mode not in ("lazy", "background"):
+            raise ValueError(f"Unknown start mode: {self._start_mode}")
+        self._start_future: Optional[Future] = None
+        if self._start_mode == "background" and self._server_manager is not None:
+            self._start_future = self._server_manager.start_async()
+
     def _ensure_connection(self) -> None:
-        """Ensure connection to server is established."""
+        """Ensure connection to server is established.
+
+        Called at the start of every operation, which is also where a
+        server over its memory budget is restarted.
+        """
         if self._gql_client is not None:
+            if self._server_manager is not None and not self._replaying and not self._replacing:
+                if not self._server_manager.is_running():
+                    self._replace_server("Server process exited")
+                elif not self._budget_exceeded_by_design and self._server_manager.over_budget():
+                    stats = self._server_manager.stats()
+                    self._replace_server(
+                        f"Server RSS {stats['rss_bytes'] / 2**20:.0f} MiB exceeds budget of "
+                        f"{self._server_manager.max_rss / 2**20:.0f} MiB"
+                    )
             return
 
+        # Wait for a background start (raises its RuntimeError)
+        if self._start_future is not None:
+            future, self._start_future = self._start_future, None
+            self.host, self.port = future.result()
+            self.uds = self._server_manager.uds
+
+        # Take a warm server from the pool
+        if self._pool is not None and self._server_manager is None:
+            self._server_manager = self._pool.checkout()
+            self._design_modified = False
+            self.host, self.port, self.uds = (
+                self._server_manager.host,
+                self._server_manager.port,
+                self._server_manager.uds,
+            )
+
         # Start server if needed
         if self._server_manager and not self._server_manager.is_running():
             self.host, self.port = self._server_manager.start()
+            self.uds = self._server_manager.uds
 
         # Create GraphQL client
-        url = f"http://{self.host}:{self.port}/graphql"
-        logger.info(f"Connecting to server at {url}")
+        url = f"{self._base_url()}/graphql"
+        logger.info(f"Connecting to server at {url}" + (f" via {self.uds}" if self.uds else ""))
 
-        transport = HTTPXTransport(url=url, timeout=settings.timeouts.request)
+        transport = HTTPXTransport(
+            url=url,
+            timeout=settings.timeouts.request,
+            **self._transport_options(self.uds),
+        )
         self._gql_client = GQLClient(transport=transport, fetch_schema_from_transport=False)
 
+        # Keep one session (and its httpx connection pool) open for the
+        # lifetime of the client. GQLClient.execute() would otherwise
+        # connect and close the transport around every single request.
+        self._session = self._gql_client.connect_sync()
+
+    def _replace_server(self, reason: str) -> None:
+        """Replace the managed server with a fresh one and rebuild its design.
+
+        The journal, if enabled, is replayed onto the new server. If the
+        rebuilt design alone exceeds the memory budget, budget restarts are
+        suspended until the next design-changing call.
+
+        Args:
+            reason: Why the server is replaced, for the log
+        """
+        logger.warning(f"{reason}, restarting it")
+        self._replacing = True
+        try:
+            self._restart_and_rebuild()
+        finally:
+            self._replacing = False
+
+    def _restart_and_rebuild(self) -> None:
+        """Restart the server, replay the journal and resume log streaming."""
+        log_stream = self._log_stream_client
+        if log_stream is not None:
+            self.stop_log_streaming()
+
+        if self._session is not None:
+            self._gql_client.close_sync()
+            self._session = None
+        self._gql_client = None
+
+        if self._pool is not None:
+            # Hand the broken server back, _ensure_connection takes a new one
+            self._pool.checkin(self._server_manager, recycle=True)
+            self._server_manager = None
+        else:
+            self.host, self.port = self._server_manager.restart()
+            self.uds = self._server_manager.uds
+        self._pagination_supported = None
+        self.invalidate()
+        self._ensure_connection()
+
+        if self.journal is not None:
+            self.replay()
+        else:
+            logger.warning("Journal disabled, the new server starts with an empty design")
+
+        # Restarting again would only rebuild the same design
+        manager = self._server_manager
+        if manager is not None and manager.over_budget():
+            stats = manager.stats()
+            logger.error(
+                f"Server RSS {stats['rss_bytes'] / 2**20:.0f} MiB right after rebuilding the design "
+                f"exceeds the budget of {manager.max_rss / 2**20:.0f} MiB, not restarting for the "
+                f"budget until the design changes"
+            )
+            self._budget_exceeded_by_design = True
+
+        if log_stream is not None:
+            self.start_log_streaming(
+                log_stream.log_callback,
+                log_stream.batch_callback,
+                log_stream.min_level,
+                log_stream.include,
+                log_stream.exclude,
+            )
+
+    def replay(self) -> None:
+        """Replay the journal onto the current server.
+
+        Done automatically when a managed server is restarted. Runs of the
+        same call are sent as one batched request.
+
+        Raises:
+            RuntimeError: If the journal is disabled or a call fails
+        """
+        if self.journal is None:
+            raise RuntimeError("Journal is disabled")
+
+        self._ensure_connection()
+        logger.info(f"Replaying {len(self.journal)} journaled calls")
+
+        self._replaying = True
+        try:
+            for operation, calls in self.journal.groups():
+                if operation in _BULK_MUTATIONS:
+                    self._replay_bulk(operation, calls)
+                else:
+                    self._execute(operation)
+        except TransportQueryError as e:
+            raise RuntimeError(f"Journal replay failed: {e}") from e
+        finally:
+            self._replaying = False
+
+    def _replay_bulk(self, field: str, calls: list[dict]) -> None:
+        """Replay a run of one journaled mutation in batched requests.
+
+        Args:
+            field: Mutation field in _BULK_MUTATIONS
+            calls: Arguments of each call
+
+        Raises:
+            RuntimeError: If a call did not succeed
+        """
+        arg_types, _ = _BULK_MUTATIONS[field]
+        max_size = settings.batch.max_size
+
+        for start in range(0, len(calls), max_size):
+            chunk = calls[start:start + max_size]
+            compiled = _get_generated_document(
+                ("bulk", field, len(chunk)), lambda: _build_bulk_mutation(field, len(chunk))
+            )
+            variables = {
+                f"{name}_{i}": call[name] for i, call in enumerate(chunk) for name in arg_types
+            }
+
+            data = self._execute_document(compiled, variables)
+            for i, call in enumerate(chunk):
+                result = data[f"m{i}"]
+                if not result.get("success", result.get("status") == "success"):
+                    raise RuntimeError(f"Journal replay of {field}({call}) failed: {result}")
+
+    def _record(self, operation: str, variables: Optional[dict] = None) -> None:
+        """Add a successful design-changing call to the journal."""
+        if not self._replaying:
+            self._budget_exceeded_by_design = False
+        if self.journal is not None and not self._replaying:
+            self.journal.record(operation, variables or {})
+
+    @staticmethod
+    def _transport_options(
+        uds: Optional[str] = None,
+        asynchronous: bool = False,
+        min_connections: int = 0,
+    ) -> dict[str, Any]:
+        """Build httpx client options for the pooled session from config.
+
+        Args:
+            uds: Unix domain socket path to connect through, None for TCP
+            asynchronous: Build options for ``httpx.AsyncClient``
+            min_connections: Lower bound for the connection pool size
+
+        Returns:
+            dict: Keyword arguments passed through to ``httpx.Client``
+        """
+        server = settings.server
+        limits = httpx.Limits(
+            max_connections=max(server.get("max_connections", 10), min_connections),
+            max_keepalive_connections=max(server.get("max_keepalive_connections", 10), min_connections),
+            keepalive_expiry=server.get("keepalive_expiry", 30),
+        )
+
+        http2 = bool(server.get("http2", False))
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("http2 enabled but 'h2' is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+        # The server only speaks plain HTTP, so skip loading the CA bundle
+        # (about 100ms per client, most of a warm pooled client's startup).
+        # Without TLS there is no ALPN to negotiate h2, so HTTP/2 means
+        # cleartext h2c with prior knowledge: HTTP/1.1 is turned off.
+        transport_class = httpx.AsyncHTTPTransport if asynchronous else httpx.HTTPTransport
+        return {
+            "transport": transport_class(uds=uds, limits=limits, http1=not http2, http2=http2, verify=False)
+        }
+
+    def _base_url(self) -> str:
+        """Get the server base URL (host is unused over a Unix socket)."""
+        if self.uds:
+            return "http://localhost"
+        return f"http://{self.host}:{self.port}"
+
+    def _execute(self, operation: str, variable_values: Optional[dict] = None, cache: bool = True) -> dict:
+        """Execute a registered operation on the persistent session.
+
+        Args:
+            operation: Operation name in the document registry
+            variable_values: Optional variables for the document
+            cache: If False, never answer this query from the response cache
+
+        Returns:
+            dict: The "data" part of the GraphQL response
+        """
+        return self._execute_document(_get_document(operation), variable_values, cache=cache)
+
+    def _execute_document(
+        self,
+        compiled: _CompiledDocument,
+        variable_values: Optional[dict] = None,
+        cache: bool = True,
+    ) -> dict:
+        """Execute a compiled document on the persistent session.
+
+        Queries are answered from the response cache when it is enabled.
+        Mutations always go to the server and invalidate the cache.
+
+        Args:
+            compiled: Compiled document
+            variable_values: Optional variables for the document
+            cache: If False, never answer this query from the response cache
+
+        Returns:
+            dict: The "data" part of the GraphQL response
+        """
+        request = _CompiledRequest(compiled, variable_values)
+        if compiled.is_mutation:
+            self._design_modified = True
+
+        if self._cache is None:
+            return self._send(request)
+
+        if compiled.is_mutation:
+            try:
+                return self._send(request)
+            finally:
+                # Even a failed mutation may have changed the design
+                self._cache.invalidate()
+
+        if not cache:
+            return self._send(request)
+
+        key = (compiled.query, tuple(sorted((variable_values or {}).items())))
+        result = self._cache.get(key)
+        if result is None:
+            epoch = self._cache.design_epoch
+            result = self._send(request)
+            self._cache.put(key, result, epoch)
+        return result
+
+    def _send(self, request: GraphQLRequest) -> dict:
+        """Send a request, recovering once from a crashed managed server.
+
+        If the connection fails because the managed server died, the server
+        is restarted, the journal replayed and the request sent again.
+
+        Args:
+            request: GraphQL request
+
+        Returns:
+            dict: The "data" part of the GraphQL response
+        """
+        try:
+            return self._session.execute(request)
+        except TransportConnectionFailed:
+            # A dying server may not have been reaped yet, give it a moment
+            manager = self._server_manager
+            if manager is None or self._replaying or not manager.wait_exited(1.0):
+                raise
+            self._replace_server("Server process died")
+            return self._session.execute(request)
+
+    def invalidate(self) -> None:
+        """Clear the response cache.
+
+        Mutations made through this client do this automatically. Call it
+        after the design was changed some other way, e.g. by another client.
+        """
+        if self._cache is not None:
+            self._cache.invalidate()
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """Get response cache statistics.
+
+        Returns:
+            Optional[CacheInfo]: Cache statistics, None if the cache is disabled
+        """
+        return self._cache.info() if self._cache is not None else None
+
     def health_check(self) -> HealthCheckResult:
         """Check server health.
 
@@ -88,16 +1001,7 @@ class Client:
         """
         self._ensure_connection()
 
-        query = gql("""
-            query {
-                health_check {
-                    status
-                    backend_type
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(query)
+        result = self._execute("health_check", cache=False)
         return result["health_check"]
 
     def read_verilog(self, path: str) -> ReadVerilogResult:
@@ -111,17 +1015,11 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation ReadVerilog($path: String!) {
-                read_verilog(path: $path) {
-                    status
-                    file
-                    modules_found
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(mutation, variable_values={"path": path})
+        result = self._execute("read_verilog", variable_values={"path": path})
+        if result["read_verilog"]["status"] == "success":
+            self._record("read_verilog", {"path": path})
+            self._sources.track(path)
+            self._read_since_compile = True
         return result["read_verilog"]
 
     def compile(self) -> str:
@@ -132,13 +1030,11 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation {
-                compile
-            }
-        """)
-
-        result = self._gql_client.execute(mutation)
+        result = self._execute("compile")
+        self._record("compile")
+        self._last_compile = result["compile"]
+        self._last_elaborate = None
+        self._read_since_compile = False
         return result["compile"]
 
     def elaborate(self) -> str:
@@ -149,60 +1045,102 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation {
-                elaborate
+        result = self._execute("elaborate")
+        self._record("elaborate")
+        self._last_elaborate = result["elaborate"]
+        return result["elaborate"]
+
+    def reload(self) -> ReloadResult:
+        """Re-read the loaded sources that changed on disk and rebuild the design.
+
+        Files loaded with :meth:`read_verilog` or :meth:`read_verilog_filelist`
+        are tracked by content hash (rehashed only when their mtime or size
+        changed). Only edited files are sent through ``read_verilog``; an
+        edited filelist is read again as a whole; deleted files and
+        filelists are forgotten with a warning. If anything was read, the
+        design is compiled again, and elaborated again if it was elaborated
+        before.
+
+        When nothing changed, the server is not contacted and the last
+        compile and elaborate results are returned.
+
+        Returns:
+            ReloadResult: Re-read files and the compile/elaborate results
+
+        Raises:
+            RuntimeError: If re-reading a file or filelist fails
+        """
+        filelists, deleted_filelists = self._sources.changed_filelists()
+        for path in deleted_filelists:
+            logger.warning(f"Filelist {path} was deleted, its files stay loaded and tracked")
+            self._sources.forget(path)
+
+        changed, deleted = self._sources.changed_files()
+        for path in deleted:
+            logger.warning(f"{path} was deleted, its modules stay loaded until the design is rebuilt")
+            self._sources.forget(path)
+
+        stale = self._read_since_compile and self._last_compile is not None
+        if not filelists and not changed and not stale:
+            return {
+                "changed": False,
+                "files": [],
+                "compile": self._last_compile,
+                "elaborate": self._last_elaborate,
             }
-        """)
 
-        result = self._gql_client.execute(mutation)
-        return result["elaborate"]
+        elaborated = self._last_elaborate is not None
+        for filelist_path in filelists:
+            logger.info(f"Filelist {filelist_path} changed, reading it again")
+            if not self.read_verilog_filelist(filelist_path)["success"]:
+                raise RuntimeError(f"Reloading {filelist_path} failed")
+
+        # Files of a filelist read again above are current now
+        if filelists:
+            changed, _ = self._sources.changed_files()
+        for path in changed:
+            logger.info(f"{path} changed, reading it again")
+            if self.read_verilog(path)["status"] != "success":
+                raise RuntimeError(f"Reloading {path} failed")
+
+        compile_result = elaborate_result = None
+        if self._last_compile is not None:
+            compile_result = self.compile()
+            if elaborated:
+                elaborate_result = self.elaborate()
+
+        return {
+            "changed": True,
+            "files": filelists + changed,
+            "compile": compile_result,
+            "elaborate": elaborate_result,
+        }
 
     def get_modules(
         self,
         filter: Optional[str] = None,
-        hierarchical: bool = False
+        hierarchical: bool = False,
+        include: Optional[Iterable[str]] = None,
     ) -> list[ModuleInfo]:
         """Get all modules in the design.
 
         Args:
             filter: Optional filter expression (backend-specific)
             hierarchical: If True, include hierarchical instances as flat list with paths
+            include: Nested lists to fetch, any of "ports", "instances" and
+                "nets" (default: all). Omitted lists are not sent by the
+                server and are missing from the returned dicts.
 
         Returns:
             list[ModuleInfo]: List of module information with nested objects
+
+        Example:
+            >>> # Names and instance counts only, without ports and nets
+            >>> modules = client.get_modules(include={"instances"})
         """
         self._ensure_connection()
 
-        query = gql("""
-            query GetModules($filter: String, $hierarchical: Boolean!) {
-                modules(filter: $filter, hierarchical: $hierarchical) {
-                    name
-                    file
-                    path
-                    ports {
-                        name
-                        direction
-                        width
-                        path
-                    }
-                    instances {
-                        name
-                        module
-                        parent
-                        path
-                    }
-                    nets {
-                        name
-                        width
-                        net_type
-                        path
-                    }
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(query, variable_values={
+        result = self._execute_document(_modules_document(include), variable_values={
             "filter": filter,
             "hierarchical": hierarchical
         })
@@ -226,18 +1164,7 @@ class Client:
         """
         self._ensure_connection()
 
-        query = gql("""
-            query GetInstances($module: String!, $filter: String, $hierarchical: Boolean!) {
-                instances(module: $module, filter: $filter, hierarchical: $hierarchical) {
-                    name
-                    module
-                    parent
-                    path
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(query, variable_values={
+        result = self._execute("get_instances", variable_values={
             "module": module,
             "filter": filter,
             "hierarchical": hierarchical
@@ -262,18 +1189,7 @@ class Client:
         """
         self._ensure_connection()
 
-        query = gql("""
-            query GetPorts($module: String!, $filter: String, $hierarchical: Boolean!) {
-                ports(module: $module, filter: $filter, hierarchical: $hierarchical) {
-                    name
-                    direction
-                    width
-                    path
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(query, variable_values={
+        result = self._execute("get_ports", variable_values={
             "module": module,
             "filter": filter,
             "hierarchical": hierarchical
@@ -298,24 +1214,225 @@ class Client:
         """
         self._ensure_connection()
 
-        query = gql("""
-            query GetNets($module: String!, $filter: String, $hierarchical: Boolean!) {
-                nets(module: $module, filter: $filter, hierarchical: $hierarchical) {
-                    name
-                    width
-                    net_type
-                    path
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(query, variable_values={
+        result = self._execute("get_nets", variable_values={
             "module": module,
             "filter": filter,
             "hierarchical": hierarchical
         })
         return result["nets"]
 
+    def _iter_pages(
+        self,
+        field: str,
+        variables: dict,
+        page_size: Optional[int],
+        include: Optional[Iterable[str]],
+        fetch_all: Callable[[], list],
+    ) -> Iterator[Any]:
+        """Yield the items of a list query, fetching them page by page.
+
+        Falls back to one unpaginated request (``fetch_all``) if the server
+        does not support the ``offset``/``limit`` arguments.
+        """
+        self._ensure_connection()
+
+        page_size = page_size or settings.pagination.page_size
+        compiled = _page_document(field, include)
+
+        if self._pagination_supported is not False:
+            offset = 0
+            while True:
+                try:
+                    page = self._execute_document(
+                        compiled, {**variables, "offset": offset, "limit": page_size}
+                    )[field]
+                except TransportQueryError as e:
+                    if offset == 0 and _is_unknown_argument_error(e):
+                        logger.info("Server does not support pagination, fetching in one request")
+                        self._pagination_supported = False
+                        break
+                    raise
+
+                self._pagination_supported = True
+                yield from page
+                if len(page) < page_size:
+                    return
+                offset += len(page)
+
+        yield from fetch_all()
+
+    def iter_modules(
+        self,
+        filter: Optional[str] = None,
+        hierarchical: bool = False,
+        include: Optional[Iterable[str]] = None,
+        page_size: Optional[int] = None,
+    ) -> Iterator[ModuleInfo]:
+        """Iterate over the modules in the design, fetching them in pages.
+
+        Only one page is held in memory at a time, and the first modules are
+        yielded as soon as the first page arrives.
+
+        Args:
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include hierarchical instances as flat list with paths
+            include: Nested lists to fetch (see :meth:`get_modules`)
+            page_size: Modules per request (defaults to config)
+
+        Yields:
+            ModuleInfo: Module information with nested objects
+        """
+        return self._iter_pages(
+            "modules",
+            {"filter": filter, "hierarchical": hierarchical},
+            page_size,
+            include,
+            lambda: self.get_modules(filter, hierarchical, include=include),
+        )
+
+    def iter_instances(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False,
+        page_size: Optional[int] = None,
+    ) -> Iterator[InstanceInfo]:
+        """Iterate over the instances in a module, fetching them in pages.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include instances from sub-hierarchy
+            page_size: Instances per request (defaults to config)
+
+        Yields:
+            InstanceInfo: Instance information
+        """
+        return self._iter_pages(
+            "instances",
+            {"module": module, "filter": filter, "hierarchical": hierarchical},
+            page_size,
+            None,
+            lambda: self.get_instances(module, filter, hierarchical),
+        )
+
+    def iter_nets(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False,
+        page_size: Optional[int] = None,
+    ) -> Iterator[NetInfo]:
+        """Iterate over the nets in a module, fetching them in pages.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include nets from sub-instances
+            page_size: Nets per request (defaults to config)
+
+        Yields:
+            NetInfo: Net information
+        """
+        return self._iter_pages(
+            "nets",
+            {"module": module, "filter": filter, "hierarchical": hierarchical},
+            page_size,
+            None,
+            lambda: self.get_nets(module, filter, hierarchical),
+        )
+
+    def batch(self, max_size: Optional[int] = None) -> QueryBatch:
+        """Create a batch that merges per-module queries into few round trips.
+
+        Queued calls are sent when the ``with`` block exits (or on
+        :meth:`QueryBatch.execute`), as aliased documents of at most
+        ``max_size`` calls each.
+
+        Args:
+            max_size: Maximum calls per document (defaults to config)
+
+        Returns:
+            QueryBatch: New batch bound to this client
+
+        Example:
+            >>> with client.batch() as batch:
+            ...     ports = {m: batch.get_ports(m) for m in modules}
+            >>> ports["cpu"].result()
+        """
+        self._ensure_connection()
+        return QueryBatch(self, max_size=max_size)
+
+    def _get_many(
+        self,
+        field: str,
+        modules: Iterable[str],
+        filter: Optional[str],
+        hierarchical: bool,
+    ) -> dict[str, Any]:
+        """Run one per-module query for many modules in a batch.
+
+        Raises:
+            TransportQueryError: If the query failed for any module
+        """
+        with self.batch() as batch:
+            results = {module: batch._queue(field, module, filter, hierarchical) for module in modules}
+        return {module: result.result() for module, result in results.items()}
+
+    def get_instances_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[InstanceInfo]]:
+        """Get the instances of many modules in as few round trips as possible.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include instances from sub-hierarchy
+
+        Returns:
+            dict[str, list[InstanceInfo]]: Instance information per module
+        """
+        return self._get_many("instances", modules, filter, hierarchical)
+
+    def get_ports_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[PortInfo]]:
+        """Get the ports of many modules in as few round trips as possible.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include ports from sub-instances
+
+        Returns:
+            dict[str, list[PortInfo]]: Port information per module
+        """
+        return self._get_many("ports", modules, filter, hierarchical)
+
+    def get_nets_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[NetInfo]]:
+        """Get the nets of many modules in as few round trips as possible.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include nets from sub-instances
+
+        Returns:
+            dict[str, list[NetInfo]]: Net information per module
+        """
+        return self._get_many("nets", modules, filter, hierarchical)
+
     def read_verilog_filelist(self, filelist_path: str) -> ReadFilelistResult:
         """Read multiple Verilog files from a filelist.
 
@@ -332,18 +1449,11 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation ReadVerilogFilelist($filelist_path: String!) {
-                read_verilog_filelist(filelist_path: $filelist_path) {
-                    success
-                    files_read
-                    modules_found
-                    message
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(mutation, variable_values={"filelist_path": filelist_path})
+        result = self._execute("read_verilog_filelist", variable_values={"filelist_path": filelist_path})
+        if result["read_verilog_filelist"]["success"]:
+            self._record("read_verilog_filelist", {"filelist_path": filelist_path})
+            self._sources.track_filelist(filelist_path)
+            self._read_since_compile = True
         return result["read_verilog_filelist"]
 
     def add_port(
@@ -366,23 +1476,15 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation AddPort($module: String!, $port_name: String!, $direction: String!, $width: Int!) {
-                add_port(module: $module, port_name: $port_name, direction: $direction, width: $width) {
-                    success
-                    module
-                    port_name
-                    message
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(mutation, variable_values={
+        variables = {
             "module": module,
             "port_name": port_name,
             "direction": direction,
             "width": width
-        })
+        }
+        result = self._execute("add_port", variable_values=variables)
+        if result["add_port"]["success"]:
+            self._record("add_port", variables)
         return result["add_port"]
 
     def add_net(
@@ -405,26 +1507,134 @@ class Client:
         """
         self._ensure_connection()
 
-        mutation = gql("""
-            mutation AddNet($module: String!, $net_name: String!, $width: Int!, $net_type: String!) {
-                add_net(module: $module, net_name: $net_name, width: $width, net_type: $net_type) {
-                    success
-                    module
-                    net_name
-                    message
-                }
-            }
-        """)
-
-        result = self._gql_client.execute(mutation, variable_values={
+        variables = {
             "module": module,
             "net_name": net_name,
             "width": width,
             "net_type": net_type
-        })
+        }
+        result = self._execute("add_net", variable_values=variables)
+        if result["add_net"]["success"]:
+            self._record("add_net", variables)
         return result["add_net"]
 
-    def start_log_streaming(self, log_callback: Optional[Callable[[dict], None]] = None) -> None:
+    def _mutate_many(self, field: str, items: list[dict], name_key: str) -> list[dict]:
+        """Apply one mutation to many items, packing many per request.
+
+        Args:
+            field: Mutation field ("add_port" or "add_net")
+            items: Mutation arguments, one dict per item
+            name_key: Result key naming the item ("port_name" or "net_name")
+
+        Returns:
+            list[dict]: One result per item, in input order
+        """
+        self._ensure_connection()
+
+        arg_types, _ = _BULK_MUTATIONS[field]
+        max_size = settings.batch.max_size
+        results: list[dict] = []
+
+        for start in range(0, len(items), max_size):
+            chunk = items[start:start + max_size]
+            compiled = _get_generated_document(
+                ("bulk", field, len(chunk)), lambda: _build_bulk_mutation(field, len(chunk))
+            )
+
+            variables = {}
+            for i, item in enumerate(chunk):
+                for name in arg_types:
+                    variables[f"{name}_{i}"] = item[name]
+
+            try:
+                data = self._execute_document(compiled, variables)
+                errors: list[dict] = []
+            except TransportQueryError as e:
+                data = e.data or {}
+                errors = e.errors or []
+
+            # Mutations are not retried: ones that lost their result to another
+            # item's error may still have been applied by the server
+            for i, item in enumerate(chunk):
+                alias = f"m{i}"
+                alias_errors = [err for err in errors if (err.get("path") or [None])[0] == alias]
+                if data.get(alias) is not None:
+                    results.append(data[alias])
+                    if data[alias]["success"]:
+                        self._record(field, {name: item[name] for name in arg_types})
+                    continue
+
+                if alias_errors:
+                    message = alias_errors[0].get("message", str(alias_errors[0]))
+                else:
+                    reason = errors[0].get("message", str(errors[0])) if errors else "no data"
+                    message = f"Result unknown, the change may have been applied ({reason})"
+                results.append({
+                    "success": False,
+                    "module": item["module"],
+                    name_key: item[name_key],
+                    "message": message,
+                })
+
+        failed = sum(1 for result in results if not result["success"])
+        if failed:
+            logger.warning(f"{field}: {failed} of {len(results)} items failed")
+
+        return results
+
+    def add_ports(self, ports: Iterable[PortSpec]) -> list[AddPortResult]:
+        """Add many ports, packing many mutations into each request.
+
+        Args:
+            ports: Ports to add, each with module, port_name, direction and width
+
+        Returns:
+            list[AddPortResult]: One result per port, in input order. Failed
+                items have success=False and the error in message.
+        """
+        return self._mutate_many("add_port", list(ports), "port_name")
+
+    def add_nets(self, nets: Iterable[NetSpec]) -> list[AddNetResult]:
+        """Add many nets, packing many mutations into each request.
+
+        Args:
+            nets: Nets to add, each with module, net_name, width and an
+                optional net_type (default "wire")
+
+        Returns:
+            list[AddNetResult]: One result per net, in input order. Failed
+                items have success=False and the error in message.
+        """
+        return self._mutate_many(
+            "add_net", [{"net_type": "wire", **net} for net in nets], "net_name"
+        )
+
+    def apply_eco(self, spec: Union[str, Path, EcoSpec]) -> EcoResult:
+        """Apply an ECO spec of ports and nets in bulk.
+
+        Args:
+            spec: Path to a CSV or JSON ECO file (see :func:`rtllib.eco.load_eco`),
+                or an already loaded EcoSpec
+
+        Returns:
+            EcoResult: Per-item results for ports and nets
+        """
+        if not isinstance(spec, dict):
+            spec = load_eco(spec)
+
+        return {
+            "ports": self.add_ports(spec["ports"]),
+            "nets": self.add_nets(spec["nets"]),
+        }
+
+    def start_log_streaming(
+        self,
+        log_callback: Optional[Callable[[dict], None]] = None,
+        batch_callback: Optional[Callable[[list[dict]], None]] = None,
+        min_level: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> None:
         """Start streaming logs from the server in real-time.
 
         This runs in a background thread and does not block sync operations.
@@ -434,6 +1644,12 @@ class Client:
             log_callback: Optional callback function to handle log messages.
                          Function receives a dict with keys: level, message, timestamp.
                          If None, logs will be printed to stdout.
+            batch_callback: Optional callback receiving lists of log messages
+                         instead, to handle many messages per call. Pass a
+                         :class:`rtllib.FileLogSink` to archive logs to files.
+            min_level: Only stream messages at this level or above (e.g. "WARNING")
+            include: Only stream messages matching one of these regular expressions
+            exclude: Drop messages matching one of these regular expressions
 
         Example:
             >>> def my_log_handler(log_data):
@@ -452,6 +1668,11 @@ class Client:
             host=self.host,
             port=self.port,
             log_callback=log_callback,
+            uds=self.uds,
+            batch_callback=batch_callback,
+            min_level=min_level,
+            include=include,
+            exclude=exclude,
         )
         self._log_stream_client.start()
         logger.info("Log streaming started")
@@ -463,6 +1684,53 @@ class Client:
             self._log_stream_client = None
             logger.info("Log streaming stopped")
 
+    def logs(
+        self,
+        min_level: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> LogIterator:
+        """Iterate over the server's log messages as they arrive.
+
+        Works with ``for`` and with ``async for``; the async form runs on
+        the caller's event loop without a thread, and connects to (or
+        starts) the server on a worker thread. Each iteration opens its
+        own subscription, independent of :meth:`start_log_streaming`.
+        Breaking out of the loop ends it.
+
+        Args:
+            min_level: Only stream messages at this level or above (e.g. "WARNING")
+            include: Only stream messages matching one of these regular expressions
+            exclude: Drop messages matching one of these regular expressions
+
+        Returns:
+            LogIterator: Iterable of LogData, sync and async
+
+        Example:
+            >>> async for record in client.logs(min_level="WARNING"):
+            ...     print(f"[{record['level']}] {record['message']}")
+        """
+
+        def connect() -> dict:
+            self._ensure_connection()
+            return {"host": self.host, "port": self.port, "uds": self.uds}
+
+        return LogIterator(
+            connect=connect,
+            min_level=min_level,
+            include=include,
+            exclude=exclude,
+        )
+
+    def log_stream_stats(self) -> Optional[LogStreamStats]:
+        """Get counters of received, delivered and dropped log records and reconnects.
+
+        Returns:
+            Optional[LogStreamStats]: Counters of the active log stream,
+                None if log streaming is not active
+        """
+        return self._log_stream_client.stats() if self._log_stream_client is not None else None
+
     def is_log_streaming_active(self) -> bool:
         """Check if log streaming is currently active.
 
@@ -473,19 +1741,32 @@ class Client:
 
     def close(self) -> None:
         """Close the client and stop the server if managed."""
-        # Stop log streaming if active
+        # Stop log streaming if active, closing sinks such as FileLogSink
         if self._log_stream_client:
-            self.stop_log_streaming()
+            self._log_stream_client.stop(close_callbacks=True)
+            self._log_stream_client = None
 
         if self._gql_client:
+            if self._session is not None:
+                self._gql_client.close_sync()
+                self._session = None
             self._gql_client = None
 
-        if self._server_manager:
+        if self._pool is not None and self._server_manager is not None:
+            # Hand the server back, recycling it if this client changed the design
+            self._pool.checkin(self._server_manager, recycle=self._design_modified)
+            self._server_manager = None
+        elif self._server_manager:
             self._server_manager.stop()
 
     def __enter__(self):
-        """Context manager entry."""
-        self._ensure_connection()
+        """Context manager entry.
+
+        Connects right away, unless the server is starting in the
+        background, in which case the first call waits for it.
+        """
+        if self._start_future is None:
+            self._ensure_connection()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
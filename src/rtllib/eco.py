@@ -0,0 +1,112 @@
+"""ECO (engineering change order) spec loading.
+
+An ECO spec lists ports and nets to add to the design. It can be written
+as JSON::
+
+    {
+        "ports": [{"module": "cpu", "port_name": "dbg_en", "direction": "input", "width": 1}],
+        "nets": [{"module": "cpu", "net_name": "dbg_bus", "width": 32, "net_type": "wire"}]
+    }
+
+or as CSV with a header row, one port or net per line::
+
+    kind,module,name,direction,width,net_type
+    port,cpu,dbg_en,input,1,
+    net,cpu,dbg_bus,,32,wire
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Union
+
+from rtllib.types import EcoSpec, NetSpec, PortSpec
+
+_CSV_COLUMNS = {"kind", "module", "name", "width"}
+
+
+def load_eco(path: Union[str, Path]) -> EcoSpec:
+    """Load an ECO spec from a CSV or JSON file.
+
+    The format is chosen by file extension (``.csv`` or ``.json``).
+
+    Args:
+        path: Path to the ECO file
+
+    Returns:
+        EcoSpec: Ports and nets to add
+
+    Raises:
+        ValueError: If the file format or an entry is invalid
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".json":
+        return _load_json(path)
+    if suffix == ".csv":
+        return _load_csv(path)
+    raise ValueError(f"Unsupported ECO file format: {path.suffix} (expected .csv or .json)")
+
+
+def _port(entry: dict, where: str) -> PortSpec:
+    """Validate a port entry."""
+    try:
+        return {
+            "module": str(entry["module"]),
+            "port_name": str(entry["port_name"]),
+            "direction": str(entry["direction"]),
+            "width": int(entry["width"]),
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid port entry at {where}: {e}") from e
+
+
+def _net(entry: dict, where: str) -> NetSpec:
+    """Validate a net entry."""
+    try:
+        return {
+            "module": str(entry["module"]),
+            "net_name": str(entry["net_name"]),
+            "width": int(entry["width"]),
+            "net_type": str(entry.get("net_type") or "wire"),
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid net entry at {where}: {e}") from e
+
+
+def _load_json(path: Path) -> EcoSpec:
+    """Load a JSON ECO spec."""
+    with open(path) as f:
+        data = json.load(f)
+
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected an object with 'ports' and/or 'nets'")
+
+    return {
+        "ports": [_port(entry, f"{path}: ports[{i}]") for i, entry in enumerate(data.get("ports", []))],
+        "nets": [_net(entry, f"{path}: nets[{i}]") for i, entry in enumerate(data.get("nets", []))],
+    }
+
+
+def _load_csv(path: Path) -> EcoSpec:
+    """Load a CSV ECO spec."""
+    spec: EcoSpec = {"ports": [], "nets": []}
+
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        missing = _CSV_COLUMNS - set(reader.fieldnames or [])
+        if missing:
+            raise ValueError(f"{path}: missing CSV columns: {', '.join(sorted(missing))}")
+
+        for row in reader:
+            where = f"{path}:{reader.line_num}"
+            kind = (row["kind"] or "").strip().lower()
+            if kind == "port":
+                spec["ports"].append(_port({**row, "port_name": row["name"]}, where))
+            elif kind == "net":
+                spec["nets"].append(_net({**row, "net_name": row["name"]}, where))
+            else:
+                raise ValueError(f"Invalid kind at {where}: {row['kind']!r} (expected 'port' or 'net')")
+
+    return spec
@@ -0,0 +1,157 @@
+"""Verilog filelist (.f) parsing.
+
+Supports the common simulator filelist syntax::
+
+    // comment, # comment, /* block comment */
+    +incdir+rtl/include+rtl/common
+    +define+SYNTHESIS+WIDTH=32
+    +libext+.v+.sv
+    -v lib/cells.v
+    -y lib/cells
+    -f sub/block.f
+    -F sub/other.f
+    rtl/top.sv
+
+As with simulators, a filelist included with ``-f`` is found, and its
+relative paths resolved, against the working directory (or the
+``base_dir`` given to :func:`parse_filelist`). A filelist included with
+``-F`` is found relative to the filelist including it, and its relative
+paths are resolved against its own directory; the top-level filelist is
+read like one included with ``-F``. ``$VAR``/``${VAR}`` environment
+references are expanded.
+"""
+
+import logging
+import os
+import re
+import shlex
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from rtllib.types import Filelist
+
+logger = logging.getLogger(__name__)
+
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def parse_filelist(path: Union[str, Path], base_dir: Optional[Union[str, Path]] = None) -> Filelist:
+    """Parse a filelist, following nested ``-f``/``-F`` filelists.
+
+    Args:
+        path: Path to the filelist
+        base_dir: Directory relative ``-f`` paths are resolved against
+            (defaults to the working directory)
+
+    Returns:
+        Filelist: Source files in order (each once), plus include dirs,
+            defines and library options
+
+    Raises:
+        ValueError: If an option is missing its argument or filelists
+            include each other in a cycle
+        OSError: If a filelist cannot be read
+    """
+    result: Filelist = {
+        "files": [],
+        "incdirs": [],
+        "defines": {},
+        "library_files": [],
+        "library_dirs": [],
+        "libexts": [],
+    }
+    path = Path(path).resolve()
+    base_dir = Path(base_dir if base_dir is not None else os.getcwd()).resolve()
+    _parse(path, path.parent, base_dir, result, stack=())
+
+    # A file listed by several nested filelists is read once
+    for key in ("files", "incdirs", "library_files", "library_dirs", "libexts"):
+        result[key] = list(dict.fromkeys(result[key]))
+    return result
+
+
+def _tokens(path: Path) -> list[str]:
+    """Split a filelist into tokens, dropping comments."""
+    text = _BLOCK_COMMENT.sub(" ", path.read_text())
+    tokens = []
+    for line in text.splitlines():
+        line = line.split("//", 1)[0].strip()
+        if not line or line.startswith("#"):
+            continue
+        tokens.extend(shlex.split(line, comments=False, posix=True))
+    return tokens
+
+
+def _parse(path: Path, base: Path, base_dir: Path, result: Filelist, stack: tuple[Path, ...]) -> None:
+    """Parse one filelist into result.
+
+    Args:
+        path: Filelist to parse
+        base: Directory its relative paths are resolved against
+        base_dir: Directory of ``-f`` filelists and their paths
+        result: Filelist to add to
+        stack: Filelists including this one
+    """
+    if path in stack:
+        cycle = " -> ".join(str(p) for p in stack + (path,))
+        raise ValueError(f"Filelist include cycle: {cycle}")
+    stack = stack + (path,)
+
+    def resolve(token: str, relative_to: Path = base) -> str:
+        expanded = os.path.expanduser(os.path.expandvars(token))
+        return str((relative_to / expanded).resolve())
+
+    tokens = _tokens(path)
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+
+        if token in ("-f", "-F", "-v", "-y"):
+            if i >= len(tokens):
+                raise ValueError(f"{path}: {token} needs an argument")
+            argument = resolve(tokens[i], base_dir if token == "-f" else base)
+            i += 1
+            if token == "-f":
+                _parse(Path(argument), base_dir, base_dir, result, stack)
+            elif token == "-F":
+                _parse(Path(argument), Path(argument).parent, base_dir, result, stack)
+            elif token == "-v":
+                result["library_files"].append(argument)
+            else:
+                result["library_dirs"].append(argument)
+        elif token.startswith("+incdir+"):
+            result["incdirs"].extend(resolve(d) for d in token[len("+incdir+"):].split("+") if d)
+        elif token.startswith("+define+"):
+            for define in token[len("+define+"):].split("+"):
+                if define:
+                    name, _, value = define.partition("=")
+                    result["defines"][name] = value
+        elif token.startswith("+libext+"):
+            result["libexts"].extend(ext for ext in token[len("+libext+"):].split("+") if ext)
+        elif token.startswith(("-", "+")):
+            logger.warning(f"{path}: ignoring unsupported filelist option {token}")
+        else:
+            result["files"].append(resolve(token))
+
+
+def format_filelist(filelist: Filelist, files: Iterable[str]) -> str:
+    """Write a flat filelist with the options of ``filelist`` and the given files.
+
+    Args:
+        filelist: Parsed filelist providing include dirs, defines and
+            library options
+        files: Source files to list (absolute paths)
+
+    Returns:
+        str: Filelist text
+    """
+    lines = [f"+incdir+{d}" for d in filelist["incdirs"]]
+    for name, value in filelist["defines"].items():
+        lines.append(f"+define+{name}={value}" if value else f"+define+{name}")
+    if filelist["libexts"]:
+        lines.append("+libext+" + "+".join(filelist["libexts"]))
+    lines.extend(f"-v {f}" for f in filelist["library_files"])
+    lines.extend(f"-y {d}" for d in filelist["library_dirs"])
+    lines.extend(files)
+    return "\n".join(lines) + "\n"
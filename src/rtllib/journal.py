@@ -0,0 +1,80 @@
+"""Journal of design-changing client calls."""
+
+from typing import Any, Iterator
+
+# Operations that only change state the next identical call would rebuild
+_IDEMPOTENT = {"compile", "elaborate"}
+
+# Operations whose repeat with the same arguments adds nothing
+_ONCE = {"read_verilog", "read_verilog_filelist", "add_port", "add_net"}
+
+
+class MutationJournal:
+    """Compact, ordered record of the calls that built a server's design.
+
+    Replaying the journal onto a fresh server rebuilds the same design.
+    Redundant calls are dropped as they are recorded: a file or filelist
+    read twice, the same port or net added twice, and a compile or
+    elaborate repeated with nothing in between.
+    """
+
+    def __init__(self):
+        """Initialize an empty journal."""
+        self._entries: list[tuple[str, dict[str, Any]]] = []
+        self._seen: set[tuple[str, tuple]] = set()
+
+    def record(self, operation: str, variables: dict[str, Any]) -> None:
+        """Record a successful design-changing call.
+
+        Args:
+            operation: Client operation name (e.g. "read_verilog", "add_port")
+            variables: Arguments of the call
+        """
+        if operation in _IDEMPOTENT:
+            if self._entries and self._entries[-1][0] == operation:
+                return
+        elif operation in _ONCE:
+            key = (operation, tuple(sorted(variables.items())))
+            if key in self._seen:
+                return
+            self._seen.add(key)
+        else:
+            raise ValueError(f"Not a journaled operation: {operation}")
+
+        self._entries.append((operation, dict(variables)))
+
+    def groups(self) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+        """Iterate over runs of consecutive calls to the same operation.
+
+        Each run can be replayed as one batched request.
+
+        Yields:
+            tuple: (operation, list of call arguments)
+        """
+        run: list[dict[str, Any]] = []
+        current = None
+        for operation, variables in self._entries:
+            if operation != current and run:
+                yield current, run
+                run = []
+            current = operation
+            run.append(variables)
+        if run:
+            yield current, run
+
+    def entries(self) -> list[tuple[str, dict[str, Any]]]:
+        """Get the recorded calls.
+
+        Returns:
+            list[tuple]: (operation, arguments) pairs, in call order
+        """
+        return [(operation, dict(variables)) for operation, variables in self._entries]
+
+    def clear(self) -> None:
+        """Forget all recorded calls."""
+        self._entries.clear()
+        self._seen.clear()
+
+    def __len__(self) -> int:
+        """Number of recorded calls."""
+        return len(self._entries)
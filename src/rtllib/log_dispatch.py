@@ -0,0 +1,191 @@
+"""Bounded, batched hand-off of log records from the stream to callbacks."""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from rtllib.types import LogDispatchStats
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "sample")
+
+
+class LogDispatcher:
+    """Queue between the log stream's receive loop and the user's callback.
+
+    The receive loop only appends to a bounded queue; a worker thread
+    drains it and hands the callback batches of up to ``batch_size``
+    records. A slow callback therefore no longer stalls receiving.
+
+    When the queue is full, ``overflow`` decides what happens to a new
+    record:
+
+    - "block": the receive loop waits for room, which in turn makes the
+      server hold back (nothing is dropped); a receive loop running on an
+      event loop uses :meth:`put_async`, so the wait does not stall it
+    - "drop_oldest": the oldest queued record is dropped
+    - "sample": only every ``sample_every``-th record is queued (dropping
+      the oldest), the others are dropped, until the queue has room again
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[list[dict]], None],
+        max_size: int,
+        batch_size: int,
+        overflow: str = "block",
+        sample_every: int = 10,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            callback: Called on the worker thread with each batch of records
+            max_size: Maximum number of queued records
+            batch_size: Maximum number of records per callback call
+            overflow: "block", "drop_oldest" or "sample"
+            sample_every: With "sample", queue one in this many records
+                while the queue is full
+
+        Raises:
+            ValueError: If the overflow policy is unknown
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow} (expected one of {OVERFLOW_POLICIES})")
+
+        self.callback = callback
+        self.max_size = max(1, max_size)
+        self.batch_size = max(1, batch_size)
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+
+        self._queue: deque[dict] = deque()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._overflowed = 0
+
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._callback_errors = 0
+        self._max_queued = 0
+
+    def put(self, record: dict) -> None:
+        """Queue a record, applying the overflow policy when the queue is full.
+
+        Args:
+            record: Log record
+        """
+        with self._condition:
+            self._received += 1
+            if len(self._queue) >= self.max_size:
+                if self.overflow == "block":
+                    while len(self._queue) >= self.max_size and not self._stopping:
+                        self._condition.wait()
+                    if self._stopping:
+                        self._dropped += 1
+                        return
+                elif self.overflow == "sample":
+                    self._overflowed += 1
+                    if self._overflowed % self.sample_every:
+                        self._dropped += 1
+                        return
+                    self._queue.popleft()
+                    self._dropped += 1
+                else:
+                    self._queue.popleft()
+                    self._dropped += 1
+            else:
+                self._overflowed = 0
+
+            self._queue.append(record)
+            self._max_queued = max(self._max_queued, len(self._queue))
+            self._condition.notify_all()
+
+    async def put_async(self, record: dict) -> None:
+        """Queue a record from a coroutine.
+
+        With "block", waits for room on a worker thread, so the event loop
+        keeps running (e.g. answering websocket pings) meanwhile.
+
+        Args:
+            record: Log record
+        """
+        if self.overflow == "block":
+            with self._condition:
+                full = len(self._queue) >= self.max_size and not self._stopping
+            if full:
+                await asyncio.to_thread(self._wait_for_room)
+        self.put(record)
+
+    def _wait_for_room(self) -> None:
+        """Wait until the queue has room or the dispatcher stops."""
+        with self._condition:
+            while len(self._queue) >= self.max_size and not self._stopping:
+                self._condition.wait()
+
+    def _run(self) -> None:
+        """Worker loop: hand batches to the callback until stopped and drained."""
+        while True:
+            with self._condition:
+                while not self._queue and not self._stopping:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._condition.notify_all()
+
+            try:
+                self.callback(batch)
+            except Exception:
+                logger.exception("Log callback failed")
+                with self._condition:
+                    self._callback_errors += 1
+            else:
+                with self._condition:
+                    self._delivered += len(batch)
+
+    def start(self) -> None:
+        """Start the worker thread."""
+        if self._thread is not None:
+            return
+
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="rtllib-log-dispatch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Deliver the queued records, then stop the worker thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the queue to drain
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                logger.warning(f"Log callback still busy after {timeout}s, {len(self._queue)} records undelivered")
+            self._thread = None
+
+    def stats(self) -> LogDispatchStats:
+        """Get the dispatch counters.
+
+        Returns:
+            LogDispatchStats: Record counts since the dispatcher was created
+        """
+        with self._condition:
+            return {
+                "received": self._received,
+                "delivered": self._delivered,
+                "dropped": self._dropped,
+                "callback_errors": self._callback_errors,
+                "queued": len(self._queue),
+                "max_queued": self._max_queued,
+            }
@@ -0,0 +1,295 @@
+"""Archiving streamed server logs to rotating, compressed NDJSON files."""
+
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+from rtllib.config import settings
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIONS = ("gzip", "zstd", "none")
+
+
+class FileLogSink:
+    """Writes log records as NDJSON, one JSON object per line.
+
+    Pass it as the ``batch_callback`` of ``start_log_streaming``. Calls
+    only append the records to a buffer; a dedicated writer thread
+    serializes and writes them in large chunks. When the buffer holds
+    ``max_buffer`` records, calls wait for the writer, so the log
+    stream's overflow policy applies.
+
+    The file is rotated once it reaches ``max_bytes`` or is ``max_age``
+    seconds old. The rotated segment is renamed with a timestamp
+    (``run.ndjson`` becomes ``run.20240101-120000.ndjson.gz``) and
+    compressed on the writer thread.
+
+    Stopping the log stream flushes the sink: records received before
+    ``stop_log_streaming()`` returns are written and synced to disk.
+    Closing the client, or the sink itself (e.g. as a context manager),
+    closes it.
+
+    Write errors are logged and the affected records counted in
+    ``records_dropped``; the writer keeps going, so the log stream never
+    blocks on a failing disk.
+
+    Example:
+        >>> with FileLogSink("logs/regression.ndjson") as sink:
+        ...     client.start_log_streaming(batch_callback=sink)
+        ...     client.elaborate()
+        ...     client.stop_log_streaming()
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        max_age: Optional[float] = None,
+        compression: Optional[str] = None,
+        flush_interval: Optional[float] = None,
+        chunk_records: Optional[int] = None,
+        max_buffer: Optional[int] = None,
+        flush_timeout: Optional[float] = None,
+    ):
+        """Initialize the sink and start its writer thread.
+
+        Args:
+            path: File to write; rotated segments go next to it
+            max_bytes: Rotate once the file is this large, 0 for no size
+                limit (defaults to config)
+            max_age: Rotate once the file is this many seconds old, 0 for no
+                age limit (defaults to config)
+            compression: Compression of rotated segments: "gzip", "zstd"
+                (requires the "zstd" extra) or "none" (defaults to config)
+            flush_interval: Seconds buffered records may wait before they are
+                written (defaults to config)
+            chunk_records: Write as soon as this many records are buffered
+                (defaults to config)
+            max_buffer: Maximum number of buffered records before calls wait
+                for the writer (defaults to config)
+            flush_timeout: Default seconds flush() and close() wait for the
+                writer (defaults to config)
+
+        Raises:
+            ValueError: If the compression is unknown
+        """
+        config = settings.log_sink
+        self.path = Path(path)
+        self.max_bytes = max_bytes if max_bytes is not None else config.max_bytes
+        self.max_age = max_age if max_age is not None else config.max_age
+        self.flush_interval = flush_interval if flush_interval is not None else config.flush_interval
+        self.chunk_records = max(1, chunk_records if chunk_records is not None else config.chunk_records)
+        self.max_buffer = max(self.chunk_records, max_buffer if max_buffer is not None else config.max_buffer)
+        self.flush_timeout = flush_timeout if flush_timeout is not None else config.flush_timeout
+
+        compression = compression or config.compression
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression} (expected one of {COMPRESSIONS})")
+        if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            logger.warning("zstd compression requires the 'zstd' extra (zstandard package), using gzip")
+            compression = "gzip"
+        self.compression = compression
+
+        self.records_written = 0
+        self.records_dropped = 0
+        self.rotations = 0
+
+        self._buffer: list[dict] = []
+        self._condition = threading.Condition()
+        self._flush_requested = 0
+        self._flushed = 0
+        self._closing = False
+        self._error: Optional[Exception] = None
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[BinaryIO] = None
+        self._opened_at = 0.0
+        self._open()
+
+        self._thread = threading.Thread(target=self._run, name="rtllib-log-sink", daemon=True)
+        self._thread.start()
+
+    def __call__(self, batch: list[dict]) -> None:
+        """Buffer a batch of records for writing.
+
+        Args:
+            batch: Log records
+
+        Raises:
+            RuntimeError: If the sink is closed
+        """
+        with self._condition:
+            if self._closing:
+                raise RuntimeError("FileLogSink is closed")
+            while len(self._buffer) >= self.max_buffer and not self._closing and self._thread.is_alive():
+                self._condition.wait(0.5)
+            self._buffer.extend(batch)
+            if len(self._buffer) >= self.chunk_records:
+                self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Write all buffered records and sync the file to disk.
+
+        Called by ``stop_log_streaming()``.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to flush_timeout)
+
+        Raises:
+            TimeoutError: If the writer did not finish in time
+        """
+        timeout = timeout if timeout is not None else self.flush_timeout
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            if not self._thread.is_alive():
+                return
+            self._flush_requested += 1
+            ticket = self._flush_requested
+            self._condition.notify_all()
+            while self._flushed < ticket and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"Log sink flush did not finish in {timeout}s")
+                self._condition.wait(min(remaining, 0.5))
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write all buffered records and stop the writer thread.
+
+        The current file is left uncompressed.
+
+        Args:
+            timeout: Maximum seconds to wait (defaults to flush_timeout)
+        """
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify_all()
+
+        timeout = timeout if timeout is not None else self.flush_timeout
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"Log sink writer still busy after {timeout}s, {self.path} may be incomplete")
+
+    def _open(self) -> None:
+        """Open the current file for appending."""
+        self._file = open(self.path, "ab")
+        self._opened_at = time.monotonic()
+
+    def _run(self) -> None:
+        """Writer loop: write buffered records in chunks until closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: len(self._buffer) >= self.chunk_records
+                    or self._flush_requested > self._flushed
+                    or self._closing,
+                    self.flush_interval,
+                )
+                batch, self._buffer = self._buffer, []
+                flush_ticket = self._flush_requested
+                closing = self._closing
+                self._condition.notify_all()
+
+            written = False
+            try:
+                if self._file.closed:
+                    self._open()
+                if batch:
+                    self._write(batch)
+                written = True
+                if self._should_rotate():
+                    self._rotate()
+                if flush_ticket > self._flushed or closing:
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+                self._error = None
+            except Exception as e:
+                # Keep draining so callers never block on a broken disk
+                if batch and not written:
+                    self.records_dropped += len(batch)
+                if self._error is None:
+                    logger.error(f"Writing logs to {self.path} failed: {e}")
+                self._error = e
+
+            with self._condition:
+                self._flushed = flush_ticket
+                self._condition.notify_all()
+                if closing and not self._buffer:
+                    break
+
+        try:
+            self._file.close()
+        except OSError:
+            pass
+
+    def _write(self, batch: list[dict]) -> None:
+        """Serialize records to NDJSON and write them in one call."""
+        lines = [json.dumps(record, separators=(",", ":"), ensure_ascii=False) for record in batch]
+        self._file.write(("\n".join(lines) + "\n").encode())
+        self.records_written += len(batch)
+
+    def _should_rotate(self) -> bool:
+        """Check whether the current file reached its size or age limit."""
+        if self._file.tell() == 0:
+            return False
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            return True
+        return bool(self.max_age) and time.monotonic() - self._opened_at >= self.max_age
+
+    def _rotate(self) -> None:
+        """Move the current file aside, compress it and start a new one.
+
+        If the rename fails, writing continues in the current file.
+        """
+        self._file.close()
+        try:
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            segment = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+            n = 1
+            while segment.exists() or self._compressed_name(segment).exists():
+                segment = self.path.with_name(f"{self.path.stem}.{stamp}-{n}{self.path.suffix}")
+                n += 1
+            os.replace(self.path, segment)
+        finally:
+            self._open()
+        self.rotations += 1
+
+        if self.compression != "none":
+            self._compress(segment)
+
+    def _compressed_name(self, segment: Path) -> Path:
+        """Get the name of a segment once compressed."""
+        extension = {"gzip": ".gz", "zstd": ".zst"}.get(self.compression, "")
+        return segment.with_name(segment.name + extension)
+
+    def _compress(self, segment: Path) -> None:
+        """Compress a rotated segment and remove the uncompressed file."""
+        target = self._compressed_name(segment)
+        with open(segment, "rb") as source:
+            if self.compression == "zstd":
+                import zstandard
+
+                with open(target, "wb") as f:
+                    zstandard.ZstdCompressor().copy_stream(source, f)
+            else:
+                with gzip.open(target, "wb", compresslevel=6) as f:
+                    shutil.copyfileobj(source, f, 1 << 20)
+        os.unlink(segment)
+        logger.debug(f"Rotated log segment written to {target}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
@@ -2,35 +2,166 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable
+from contextlib import aclosing
+import queue
+import re
+from typing import AsyncIterator, Iterable, Iterator, Optional, Callable
 import threading
 
-from gql import gql, Client as GqlClient
+from gql import GraphQLRequest, Client as GqlClient
+from gql.client import AsyncClientSession
+from gql.transport.exceptions import TransportQueryError
 from gql.transport.websockets import WebsocketsTransport
 
+from rtllib.config import settings
+from rtllib.log_dispatch import LogDispatcher
+from rtllib.types import LogData, LogStreamStats
+
 logger = logging.getLogger(__name__)
 
+# Severity of the server's log levels, for min_level
+_LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "WARN": 30, "WARNING": 30, "ERROR": 40, "CRITICAL": 50, "FATAL": 50}
+
+
+# Subscription arguments and their types
+_ARGUMENT_TYPES = {
+    "min_level": "String!",
+    "include": "[String!]!",
+    "exclude": "[String!]!",
+    "after_seq": "Int!",
+}
+
+
+def _subscription_document(arguments: Iterable[str], seq: bool) -> str:
+    """Build the log_stream subscription.
+
+    Args:
+        arguments: Names of the arguments in use (keys of _ARGUMENT_TYPES)
+        seq: Select the records' sequence ids
+    """
+    arguments = list(arguments)
+    definitions = ", ".join(f"${name}: {_ARGUMENT_TYPES[name]}" for name in arguments)
+    call = ", ".join(f"{name}: ${name}" for name in arguments)
+    return f"""
+        subscription{f"({definitions})" if arguments else ""} {{
+            log_stream{f"({call})" if arguments else ""} {{
+                {"seq" if seq else ""}
+                level
+                message
+                timestamp
+            }}
+        }}
+    """
+
 
 class LogStreamClient:
-    """Client for receiving real-time log streams from the server."""
+    """Client for receiving real-time log streams from the server.
 
-    def __init__(self, host: str, port: int, log_callback: Optional[Callable[[dict], None]] = None):
+    Received records go through a bounded queue (see
+    :class:`rtllib.log_dispatch.LogDispatcher`), so the callbacks run on
+    their own thread and never stall receiving.
+
+    When the connection drops, the client reconnects with exponential
+    backoff. Records carry increasing sequence ids, and the new
+    subscription resumes after the last id seen, so records are neither
+    lost (as long as the server still holds them) nor duplicated.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: Optional[int],
+        log_callback: Optional[Callable[[dict], None]] = None,
+        uds: Optional[str] = None,
+        batch_callback: Optional[Callable[[list[dict]], None]] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        overflow: Optional[str] = None,
+        sample_every: Optional[int] = None,
+        min_level: Optional[str] = None,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        reconnect: Optional[bool] = None,
+    ):
         """Initialize the log stream client.
 
+        The filters are sent as subscription arguments so the server drops
+        unwanted records. Servers without filter support get the plain
+        subscription and the records are filtered here instead.
+
         Args:
             host: Server host
-            port: Server port
+            port: Server port (unused with uds)
             log_callback: Optional callback function to handle log messages.
                          If None, logs will be printed to stdout.
+            uds: Unix domain socket path of the server, None for TCP
+            batch_callback: Optional callback receiving lists of log messages,
+                         used instead of log_callback
+            queue_size: Maximum number of records waiting for the callback
+                (defaults to config)
+            batch_size: Maximum number of records per batch (defaults to config)
+            overflow: What to do when the queue is full: "block",
+                "drop_oldest" or "sample" (defaults to config)
+            sample_every: With "sample", keep one in this many records while
+                the queue is full (defaults to config)
+            min_level: Only stream records at this level or above
+                (e.g. "WARNING")
+            include: Only stream records whose message matches one of these
+                regular expressions
+            exclude: Drop records whose message matches one of these
+                regular expressions
+            reconnect: Reconnect and resume when the connection drops
+                (defaults to config)
+
+        Raises:
+            ValueError: If min_level is not a known level
         """
         self.host = host
         self.port = port
+        self.uds = uds
         self.log_callback = log_callback or self._default_log_handler
-        self._ws_url = f"ws://{host}:{port}/graphql"
+        self.batch_callback = batch_callback
+        config = settings.log_stream
+
+        if min_level is not None and min_level.upper() not in _LEVELS:
+            raise ValueError(f"Unknown log level: {min_level}")
+        self.min_level = min_level.upper() if min_level is not None else None
+        self.include = list(include) if include is not None else None
+        self.exclude = list(exclude) if exclude is not None else None
+        self._include_patterns = [re.compile(p) for p in self.include or ()]
+        self._exclude_patterns = [re.compile(p) for p in self.exclude or ()]
+        # Cleared once the server turns out not to support the filter arguments
+        self._server_filtering = True
+        # Cleared once the server turns out not to have sequence ids
+        self._server_seq = True
+
+        self.reconnect = reconnect if reconnect is not None else config.reconnect
+        self._reconnect_initial = config.reconnect_initial
+        self._reconnect_max = config.reconnect_max
+        self._task: Optional[asyncio.Task] = None
+
+        # Resume position and stream statistics
+        self._stats_lock = threading.Lock()
+        self._last_seq: Optional[int] = None
+        self._records_seen = 0
+        self._reconnects = 0
+        self._gaps = 0
+        self._missed = 0
+        self._duplicates = 0
+
+        self._ws_url = "ws://localhost/graphql" if uds else f"ws://{host}:{port}/graphql"
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        self._dispatcher = LogDispatcher(
+            batch_callback or self._dispatch_each,
+            max_size=queue_size if queue_size is not None else config.queue_size,
+            batch_size=batch_size if batch_size is not None else config.batch_size,
+            overflow=overflow or config.overflow,
+            sample_every=sample_every if sample_every is not None else config.sample_every,
+        )
+
     def _default_log_handler(self, log_data: dict) -> None:
         """Default log handler that prints to stdout.
 
@@ -42,59 +173,227 @@ class LogStreamClient:
         timestamp = log_data.get("timestamp", "")
         print(f"[{timestamp}] [{level}] {message}")
 
-    async def _stream_logs(self) -> None:
-        """Async function to stream logs from the server."""
-        transport = WebsocketsTransport(url=self._ws_url)
+    def _dispatch_each(self, batch: list[dict]) -> None:
+        """Hand a batch to the per-record log callback."""
+        for log_data in batch:
+            self.log_callback(log_data)
 
-        try:
-            async with GqlClient(
-                transport=transport,
-                fetch_schema_from_transport=False,
-            ) as session:
-                subscription = gql("""
-                    subscription {
-                        log_stream {
-                            level
-                            message
-                            timestamp
-                        }
-                    }
-                """)
+    def _accepts(self, log_data: dict) -> bool:
+        """Apply the filters client-side (for servers that do not filter).
+
+        Records with a level not in the known set are kept.
+        """
+        if self.min_level is not None:
+            level = _LEVELS.get(str(log_data.get("level", "")).upper())
+            if level is not None and level < _LEVELS[self.min_level]:
+                return False
+
+        message = log_data.get("message", "")
+        if self._include_patterns and not any(p.search(message) for p in self._include_patterns):
+            return False
+        return not any(p.search(message) for p in self._exclude_patterns)
+
+    def _track_seq(self, seq: Optional[int]) -> bool:
+        """Advance the resume position to a received record's sequence id.
+
+        Gaps are only counted without server-side filtering, which skips ids.
+
+        Returns:
+            bool: False if the record was already received
+        """
+        filtered = self._server_filtering and (
+            self.min_level is not None or self.include is not None or self.exclude is not None
+        )
+        with self._stats_lock:
+            self._records_seen += 1
+            if seq is None:
+                return True
+            if self._last_seq is not None:
+                if seq <= self._last_seq:
+                    self._duplicates += 1
+                    return False
+                if seq > self._last_seq + 1 and not filtered:
+                    self._gaps += 1
+                    self._missed += seq - self._last_seq - 1
+            self._last_seq = seq
+        return True
 
+    def _subscription(self) -> GraphQLRequest:
+        """Build the subscription request, with the arguments the server takes."""
+        variables = {}
+        if self._server_filtering:
+            if self.min_level is not None:
+                variables["min_level"] = self.min_level
+            if self.include is not None:
+                variables["include"] = self.include
+            if self.exclude is not None:
+                variables["exclude"] = self.exclude
+
+        if self._server_seq and self._last_seq is not None:
+            variables["after_seq"] = self._last_seq
+
+        document = _subscription_document(variables, seq=self._server_seq)
+        return GraphQLRequest(document, variable_values=variables or None)
+
+    async def _consume(self, session: AsyncClientSession) -> AsyncIterator[LogData]:
+        """Receive records from the subscription and yield those passing the filters."""
+        client_filtering = not self._server_filtering and (
+            self.min_level is not None or self.include is not None or self.exclude is not None
+        )
+
+        # Generators are closed explicitly all the way down, so a consumer
+        # leaving its loop ends the subscription right away
+        async with aclosing(session.subscribe(self._subscription())) as subscription:
+            async for result in subscription:
+                if not self._running:
+                    break
+
+                log_data = result.get("log_stream", {})
+                if not log_data or not self._track_seq(log_data.get("seq")):
+                    continue
+                if not client_filtering or self._accepts(log_data):
+                    yield log_data
+
+    async def _subscribe(self, session: AsyncClientSession) -> AsyncIterator[LogData]:
+        """Consume the subscription, dropping features an older server rejects.
+
+        Raises:
+            TransportQueryError: If the server rejects the plain subscription
+        """
+        while True:
+            try:
+                async with aclosing(self._consume(session)) as records:
+                    async for log_data in records:
+                        yield log_data
+                return
+            except TransportQueryError as e:
+                messages = [str(err.get("message", "")) for err in e.errors or []]
+                if self._server_seq and any("seq" in message for message in messages):
+                    logger.info("Server has no log sequence ids, reconnects cannot resume")
+                    self._server_seq = False
+                elif self._server_filtering and any("Unknown argument" in message for message in messages):
+                    logger.info("Server cannot filter log_stream, filtering records client-side")
+                    self._server_filtering = False
+                else:
+                    raise
+
+    async def _stream_once(self) -> AsyncIterator[LogData]:
+        """Connect and stream until the connection ends."""
+        connect_args = {"unix": True, "path": self.uds} if self.uds else None
+        transport = WebsocketsTransport(url=self._ws_url, connect_args=connect_args)
+
+        async with GqlClient(
+            transport=transport,
+            fetch_schema_from_transport=False,
+        ) as session:
+            if self._last_seq is None:
                 logger.info("Log streaming started")
+            else:
+                logger.info(f"Log stream reconnected, resuming after record {self._last_seq}")
+            async with aclosing(self._subscribe(session)) as records:
+                async for log_data in records:
+                    yield log_data
 
+    async def _stream_records(self) -> AsyncIterator[LogData]:
+        """Stream records from the server, reconnecting until stopped."""
+        delay = self._reconnect_initial
+        try:
+            while self._running:
+                seen = self._records_seen
                 try:
-                    async for result in session.subscribe(subscription):
-                        if not self._running:
-                            break
-
-                        log_data = result.get("log_stream", {})
-                        if log_data:
-                            # Call the callback in a thread-safe way
-                            self.log_callback(log_data)
+                    async with aclosing(self._stream_once()) as records:
+                        async for log_data in records:
+                            yield log_data
+                    if self._running:
+                        logger.warning("Log stream closed by the server")
                 except asyncio.CancelledError:
                     logger.info("Log streaming cancelled")
                     raise
+                except TransportQueryError as e:
+                    logger.error(f"Log stream rejected by the server: {e}")
+                    return
                 except Exception as e:
                     if self._running:  # Only log error if not intentionally stopped
-                        logger.error(f"Error in log streaming: {e}")
+                        logger.warning(f"Log stream disconnected: {e}")
+
+                if not self._running or not self.reconnect:
+                    return
+
+                # Back off from the initial delay again once a connection worked
+                if self._records_seen > seen:
+                    delay = self._reconnect_initial
+                logger.info(f"Reconnecting log stream in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._reconnect_max)
+                with self._stats_lock:
+                    self._reconnects += 1
         finally:
             logger.info("Log streaming stopped")
 
+    async def _stream_logs(self) -> None:
+        """Queue streamed records for the callbacks (background thread mode)."""
+        async with aclosing(self._stream_records()) as records:
+            async for log_data in records:
+                await self._dispatcher.put_async(log_data)
+
+    async def records(self) -> AsyncIterator[LogData]:
+        """Stream records on the running event loop, without a thread.
+
+        The callbacks and the dispatch queue are not used; records come
+        straight from the subscription, with the same filtering and
+        reconnects. Leaving the ``async for`` (or calling ``aclose()``)
+        ends the subscription.
+
+        Yields:
+            LogData: Log records, in order
+
+        Raises:
+            RuntimeError: If the stream is already running
+        """
+        if self._running:
+            raise RuntimeError("Log streaming already running")
+
+        self._running = True
+        try:
+            async with aclosing(self._stream_records()) as records:
+                async for log_data in records:
+                    yield log_data
+        finally:
+            self._running = False
+
+    @staticmethod
+    def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+        """Close the thread's event loop once its tasks have finished.
+
+        After a cancel, the websocket transport still has tasks closing the
+        connection; they are cancelled and awaited first, so none is
+        destroyed while pending.
+        """
+        try:
+            pending = asyncio.all_tasks(loop)
+            for task in pending:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        except Exception as e:
+            logger.debug(f"Error while cleaning up the log stream loop: {e}")
+        finally:
+            loop.close()
+
     def _run_in_thread(self) -> None:
         """Run the async log streaming in a separate event loop."""
         loop = asyncio.new_event_loop()
         self._loop = loop
         asyncio.set_event_loop(loop)
         try:
-            loop.run_until_complete(self._stream_logs())
+            self._task = loop.create_task(self._stream_logs())
+            loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
         finally:
-            # Clean up the loop
-            try:
-                loop.close()
-            except Exception:
-                pass  # Ignore errors during cleanup
+            self._close_loop(loop)
             self._loop = None
+            self._task = None
 
     def start(self) -> None:
         """Start the log streaming in a background thread."""
@@ -103,33 +402,91 @@ class LogStreamClient:
             return
 
         self._running = True
+        self._dispatcher.start()
         self._thread = threading.Thread(target=self._run_in_thread, daemon=True)
         self._thread.start()
         logger.info("Log streaming thread started")
 
-    def stop(self) -> None:
-        """Stop the log streaming."""
+    def _call_hook(self, name: str) -> None:
+        """Call a flush/close method of the callbacks, if they have one.
+
+        Lets sinks such as :class:`rtllib.FileLogSink` persist what they
+        received. Errors are logged, so stopping always completes.
+        """
+        for callback in {id(c): c for c in (self.batch_callback, self.log_callback) if c is not None}.values():
+            hook = getattr(callback, name, None)
+            if callable(hook):
+                try:
+                    hook()
+                except Exception as e:
+                    logger.warning(f"Log callback {name}() failed: {e}")
+
+    def stop(self, close_callbacks: bool = False) -> None:
+        """Stop the log streaming.
+
+        Records already received are delivered, then the callbacks'
+        ``flush()`` is called if they have one.
+
+        Args:
+            close_callbacks: Also call the callbacks' ``close()``, for a
+                final shutdown (done by ``Client.close()``)
+        """
         if not self._running:
             return
 
         logger.info("Stopping log streaming...")
         self._running = False
 
+        # Interrupt a receive or reconnect wait
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed
+
         # Wait for thread to finish gracefully
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=5.0)
             self._thread = None
 
         self._loop = None
+
+        # Deliver what was received before stopping
+        self._dispatcher.stop()
+        self._call_hook("flush")
+        if close_callbacks:
+            self._call_hook("close")
         logger.info("Log streaming stopped")
 
+    def stats(self) -> LogStreamStats:
+        """Get counters of received, delivered and dropped records.
+
+        Also counts reconnects, and the gaps in the sequence ids seen after
+        them (``missed`` records the server no longer had).
+
+        Returns:
+            LogStreamStats: Counts since the stream was created
+        """
+        stats = self._dispatcher.stats()
+        with self._stats_lock:
+            return {
+                **stats,
+                "reconnects": self._reconnects,
+                "gaps": self._gaps,
+                "missed": self._missed,
+                "duplicates": self._duplicates,
+                "last_seq": self._last_seq,
+            }
+
     def is_running(self) -> bool:
         """Check if log streaming is running.
 
         Returns:
             bool: True if streaming is active
         """
-        return self._running
+        # The background thread exits when the server rejects the stream
+        return self._running and (self._thread is None or self._thread.is_alive())
 
     def __enter__(self):
         """Context manager entry."""
@@ -139,3 +496,118 @@ class LogStreamClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.stop()
+
+
+class LogIterator:
+    """Streamed log records, for ``for`` and ``async for`` loops.
+
+    Returned by :meth:`rtllib.Client.logs`. ``async for`` runs the
+    subscription on the caller's event loop without a thread (connecting
+    first on a worker thread, so the loop is never blocked). ``for``
+    streams on a background thread (see :class:`LogStreamClient`) and
+    waits for each record. Breaking out of either loop ends the stream;
+    use the iterator as a (async) context manager to end it at a
+    well-defined point.
+
+    Example:
+        >>> async for record in client.logs(min_level="WARNING"):
+        ...     if record["level"] == "ERROR":
+        ...         break
+    """
+
+    def __init__(self, connect: Optional[Callable[[], dict]] = None, **options):
+        """Initialize the iterator.
+
+        Args:
+            connect: Called (blocking) when iteration starts, returning
+                further LogStreamClient arguments, e.g. the host and port of
+                a server it started
+            **options: LogStreamClient arguments (host, port, uds and filters)
+        """
+        self._connect = connect
+        self._options = options
+        self._iterator: Optional[Iterator[LogData]] = None
+        self._async_iterator: Optional[AsyncIterator[LogData]] = None
+
+    def __aiter__(self) -> AsyncIterator[LogData]:
+        """Start streaming on the running event loop."""
+        if self._async_iterator is None:
+            self._async_iterator = self._aiterate(self._options, self._connect)
+        return self._async_iterator
+
+    def __iter__(self) -> Iterator[LogData]:
+        """Start streaming on a background thread."""
+        if self._iterator is None:
+            # Not a bound method, so breaking out of a loop over a temporary
+            # LogIterator frees the generator (and ends the stream) at once
+            self._iterator = self._iterate(self._options, self._connect)
+        return self._iterator
+
+    @staticmethod
+    async def _aiterate(options: dict, connect: Optional[Callable[[], dict]]) -> AsyncIterator[LogData]:
+        """Yield the records of a subscription on the running event loop."""
+        if connect is not None:
+            options = {**options, **await asyncio.to_thread(connect)}
+        async with aclosing(LogStreamClient(**options).records()) as records:
+            async for log_data in records:
+                yield log_data
+
+    @staticmethod
+    def _iterate(options: dict, connect: Optional[Callable[[], dict]]) -> Iterator[LogData]:
+        """Yield the records a background LogStreamClient receives."""
+        if connect is not None:
+            options = {**options, **connect()}
+        records: queue.Queue[LogData] = queue.Queue(maxsize=settings.log_stream.queue_size)
+        closed = threading.Event()
+
+        def deliver(batch: list[dict]) -> None:
+            # Waits while the consumer is behind, so the overflow policy applies
+            for log_data in batch:
+                while not closed.is_set():
+                    try:
+                        records.put(log_data, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+
+        stream = LogStreamClient(batch_callback=deliver, **options)
+        stream.start()
+        try:
+            while True:
+                try:
+                    yield records.get(timeout=0.1)
+                except queue.Empty:
+                    # Done once the stream ended and every record was handed over
+                    stats = stream.stats()
+                    handed_over = stats["delivered"] + stats["dropped"] + stats["callback_errors"]
+                    if not stream.is_running() and handed_over == stats["received"] and records.empty():
+                        return
+        finally:
+            closed.set()
+            stream.stop()
+
+    def close(self) -> None:
+        """End a stream started with ``for``."""
+        if self._iterator is not None:
+            self._iterator.close()
+
+    async def aclose(self) -> None:
+        """End a stream started with ``async for``."""
+        if self._async_iterator is not None:
+            await self._async_iterator.aclose()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,173 @@
+"""Resource monitoring of server processes (Linux /proc)."""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from rtllib.types import ServerStats
+
+logger = logging.getLogger(__name__)
+
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+def _process_tree(pid: int) -> list[int]:
+    """Get a process and all its descendants.
+
+    Python-mode servers launched through ``uv run`` are a child of the
+    process we started, so the whole tree is measured.
+    """
+    pids = [pid]
+    i = 0
+    while i < len(pids):
+        task_dir = f"/proc/{pids[i]}/task"
+        try:
+            tasks = os.listdir(task_dir)
+        except OSError:
+            tasks = []
+        for task in tasks:
+            try:
+                with open(f"{task_dir}/{task}/children") as f:
+                    pids.extend(int(child) for child in f.read().split())
+            except OSError:
+                pass
+        i += 1
+    return pids
+
+
+def _read_process(pid: int) -> Optional[tuple[int, int, float, int]]:
+    """Read one process from /proc.
+
+    Returns:
+        Optional[tuple]: (rss_bytes, peak_rss_bytes, cpu_seconds, threads),
+            None if the process is gone
+    """
+    rss = peak = threads = 0
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss = int(line.split()[1]) * 1024
+                elif line.startswith("VmHWM:"):
+                    peak = int(line.split()[1]) * 1024
+                elif line.startswith("Threads:"):
+                    threads = int(line.split()[1])
+        with open(f"/proc/{pid}/stat") as f:
+            # The command name may contain spaces, fields start after its ")"
+            fields = f.read().rsplit(")", 1)[1].split()
+    except (OSError, IndexError, ValueError):
+        return None
+
+    # utime and stime are fields 14 and 15 of stat, 12 and 13 after the name
+    cpu = (int(fields[11]) + int(fields[12])) / _CLOCK_TICKS
+    return rss, peak, cpu, threads
+
+
+def read_process_stats(pid: int) -> Optional[ServerStats]:
+    """Measure a process tree once.
+
+    Args:
+        pid: Root process ID
+
+    Returns:
+        Optional[ServerStats]: Totals over the process and its descendants,
+            None if /proc is unavailable or the process is gone.
+            ``cpu_percent`` is left at 0.0, it needs two samples.
+    """
+    root = _read_process(pid)
+    if root is None:
+        return None
+
+    rss, peak, cpu, threads = root
+    processes = 1
+    for child in _process_tree(pid)[1:]:
+        sample = _read_process(child)
+        if sample is not None:
+            rss += sample[0]
+            peak += sample[1]
+            cpu += sample[2]
+            threads += sample[3]
+            processes += 1
+
+    return {
+        "pid": pid,
+        "rss_bytes": rss,
+        "peak_rss_bytes": peak,
+        "cpu_seconds": cpu,
+        "cpu_percent": 0.0,
+        "threads": threads,
+        "processes": processes,
+        "timestamp": time.time(),
+    }
+
+
+class ResourceSampler:
+    """Samples a process tree's memory and CPU on a background thread."""
+
+    def __init__(self, pid: int, interval: float):
+        """Initialize the sampler.
+
+        Args:
+            pid: Root process ID
+            interval: Seconds between samples
+        """
+        self.pid = pid
+        self.interval = interval
+        self._latest: Optional[ServerStats] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> Optional[ServerStats]:
+        """Take a sample now.
+
+        CPU percent is computed against the previous sample.
+
+        Returns:
+            Optional[ServerStats]: The new sample, None if the process is gone
+        """
+        stats = read_process_stats(self.pid)
+        with self._lock:
+            previous = self._latest
+            if stats is not None:
+                if previous is not None:
+                    elapsed = stats["timestamp"] - previous["timestamp"]
+                    if elapsed > 0:
+                        stats["cpu_percent"] = 100.0 * (stats["cpu_seconds"] - previous["cpu_seconds"]) / elapsed
+                self._latest = stats
+        return stats
+
+    def latest(self) -> Optional[ServerStats]:
+        """Get the most recent sample without measuring.
+
+        Returns:
+            Optional[ServerStats]: Latest sample, None before the first one
+        """
+        with self._lock:
+            return dict(self._latest) if self._latest is not None else None
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        self.sample()
+        if self.interval <= 0 or self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="rtllib-sampler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop_event.wait(self.interval):
+            if self.sample() is None:
+                logger.debug(f"Process {self.pid} is gone, sampler stopping")
+                return
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
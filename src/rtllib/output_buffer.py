@@ -0,0 +1,108 @@
+"""Bounded in-memory buffer for server output."""
+
+import logging
+import os
+import tempfile
+import threading
+from collections import deque
+from typing import Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class OutputBuffer:
+    """Ring buffer of the most recent server output lines.
+
+    Holds at most ``max_lines`` lines and ``max_bytes`` bytes of text;
+    older lines are dropped. With ``spill`` enabled, dropped lines are
+    appended to a temp file instead, so the full output is kept on disk
+    only once it outgrows the buffer.
+
+    Lines from stdout and stderr share one buffer to keep their order.
+    """
+
+    def __init__(self, max_lines: int, max_bytes: int, spill: bool = False):
+        """Initialize the buffer.
+
+        Args:
+            max_lines: Maximum number of buffered lines
+            max_bytes: Maximum total size of buffered lines
+            spill: Write lines dropped from the buffer to a temp file
+        """
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.spill_path: Optional[str] = None
+        self.dropped = 0
+
+        self._lines: deque[tuple[str, str]] = deque()
+        self._size = 0
+        self._spill_file: Optional[TextIO] = None
+        self._lock = threading.Lock()
+
+    def append(self, stream: str, line: str) -> None:
+        """Add a line, evicting the oldest lines beyond the bounds.
+
+        Args:
+            stream: Stream the line came from ("stdout" or "stderr")
+            line: Output line, including its newline
+        """
+        with self._lock:
+            self._lines.append((stream, line))
+            self._size += len(line)
+            while len(self._lines) > self.max_lines or (self._size > self.max_bytes and len(self._lines) > 1):
+                old_stream, old_line = self._lines.popleft()
+                self._size -= len(old_line)
+                self.dropped += 1
+                if self.spill:
+                    self._spill(old_stream, old_line)
+
+    def _spill(self, stream: str, line: str) -> None:
+        """Append an evicted line to the spill file. Must hold the lock."""
+        if self._spill_file is None:
+            self._spill_file = tempfile.NamedTemporaryFile(
+                mode="w",
+                prefix="rtllib_server_output_",
+                suffix=".log",
+                delete=False,
+            )
+            self.spill_path = self._spill_file.name
+            logger.info(f"Server output exceeds buffer, spilling to {self.spill_path}")
+        self._spill_file.write(f"[{stream}] {line}")
+
+    def tail(self, n: int = 50, stream: Optional[str] = None) -> list[str]:
+        """Get the last lines of output.
+
+        Args:
+            n: Maximum number of lines
+            stream: Only lines from "stdout" or "stderr" (default: both)
+
+        Returns:
+            list[str]: Lines without trailing newlines, oldest first
+        """
+        with self._lock:
+            lines = [line for s, line in self._lines if stream is None or s == stream]
+        return [line.rstrip("\n") for line in lines[-n:]] if n > 0 else []
+
+    def close(self, remove: bool = True) -> None:
+        """Close the spill file. Buffered lines stay available.
+
+        Args:
+            remove: Also delete the spill file
+        """
+        with self._lock:
+            # Late lines from a still-running reader must not reopen a file
+            self.spill = False
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+                if remove:
+                    try:
+                        os.unlink(self.spill_path)
+                    except OSError:
+                        pass
+                    self.spill_path = None
+
+    def __len__(self) -> int:
+        """Number of buffered lines."""
+        return len(self._lines)
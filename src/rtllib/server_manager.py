@@ -1,21 +1,74 @@
 """Server process management."""
 
+import hashlib
+import json
+import os
+import re
 import socket
 import subprocess
+import tempfile
 import time
 import logging
 import atexit
 import signal
 import sys
+import threading
+import uuid
+from concurrent.futures import Future
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 import httpx
 
 from rtllib.config import settings
+from rtllib.monitor import ResourceSampler
+from rtllib.output_buffer import OutputBuffer
+from rtllib.types import ServerStats
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
 
+def _runtime_dir() -> str:
+    """Get the directory for sockets and discovery files.
+
+    Uses ``$XDG_RUNTIME_DIR`` when set, the temp directory otherwise.
+    """
+    return os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+
+
+def _cache_dir() -> Path:
+    """Get the directory for persistent client caches.
+
+    Uses ``$XDG_CACHE_HOME`` when set, ``~/.cache`` otherwise.
+    """
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "rtllib"
+
+
+# Run inside the server environment to find its interpreter and entry point
+_RESOLVE_SCRIPT = """
+import json, sys
+from importlib.metadata import entry_points
+eps = [ep.value for ep in entry_points(group="console_scripts") if ep.name == "rtllib-server"]
+print(json.dumps({"python": sys.executable, "entry_point": eps[0] if eps else None}))
+"""
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
 class ServerManager:
     """Manages the RTL library server process."""
 
@@ -25,6 +78,9 @@ class ServerManager:
         binary_path: Optional[str] = None,
         host: Optional[str] = None,
         port: Optional[int] = None,
+        unix_socket: Optional[bool] = None,
+        shared: Optional[bool] = None,
+        max_rss: Optional[int] = None,
     ):
         """Initialize server manager.
 
@@ -33,14 +89,47 @@ class ServerManager:
             binary_path: Path to server binary (defaults to config)
             host: Host to bind server to (defaults to config)
             port: Port to bind server to, None for auto-assign (defaults to config)
+            unix_socket: Listen on a Unix domain socket instead of TCP
+                (defaults to config)
+            shared: Share one server between all processes on this machine
+                that use the same settings (defaults to config)
+            max_rss: Memory budget in bytes, see :meth:`over_budget`,
+                0 for none (defaults to config)
         """
         self.server_mode = server_mode or settings.server_mode
         self.binary_path = binary_path or settings.binary_path
         self.host = host or settings.server.host
         self.port = port if port is not None else getattr(settings.server, "port", None)
+        self._requested_port = self.port
+        self.unix_socket = (
+            unix_socket if unix_socket is not None else settings.server.get("unix_socket", False)
+        )
+        self.uds: Optional[str] = None
+        self.shared = shared if shared is not None else settings.server.get("shared", False)
+        if self.shared and fcntl is None:
+            logger.warning("Shared server mode needs fcntl (Unix only), starting a private server")
+            self.shared = False
+        self._shared_pid: Optional[int] = None
+        self.max_rss = (
+            max_rss if max_rss is not None else settings.monitor.max_rss_mb * 1024 * 1024
+        )
+        self._sampler: Optional[ResourceSampler] = None
+        self._shared_token = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Settings that affect the server, taken before start() assigns a port
+        key = f"{self.server_mode}|{self.binary_path}|{self.host}|{self.port}|{self.unix_socket}"
+        self._shared_key = hashlib.sha1(key.encode()).hexdigest()[:12]
 
         self.process: Optional[subprocess.Popen] = None
         self._started = False
+        self._start_lock = threading.Lock()
+        self._future_lock = threading.Lock()
+        self._start_future: Optional[Future] = None
+        self._start_thread: Optional[threading.Thread] = None
+        self._ready_event = threading.Event()
+        self._output_threads: list[threading.Thread] = []
+        self._output: Optional[OutputBuffer] = None
+        # Set when a start fails, so stop() keeps the spilled output
+        self._start_failed = False
 
         # Register cleanup handlers
         atexit.register(self.stop)
@@ -66,22 +155,137 @@ class ServerManager:
         logger.info(f"Found free port: {port}")
         return port
 
-    def start(self) -> tuple[str, int]:
+    def socket_path(self) -> str:
+        """Create a unique Unix domain socket path for the server.
+
+        Uses ``$XDG_RUNTIME_DIR`` when set, the temp directory otherwise.
+
+        Returns:
+            str: Socket path (not yet created)
+        """
+        path = os.path.join(_runtime_dir(), f"rtllib-{os.getpid()}-{uuid.uuid4().hex[:8]}.sock")
+        logger.info(f"Using Unix socket: {path}")
+        return path
+
+    def start(self) -> tuple[str, Optional[int]]:
         """Start the server process.
 
         Returns:
-            tuple: (host, port) where the server is running
+            tuple: (host, port) where the server is running. Port is None
+                when the server listens on a Unix socket (see ``uds``).
 
         Raises:
             RuntimeError: If server fails to start
         """
-        if self._started:
-            logger.warning("Server already started")
-            return self.host, self.port
+        with self._start_lock:
+            if self._started:
+                logger.warning("Server already started")
+                return self.host, self.port
+
+            if self.shared:
+                address = self._start_shared()
+            else:
+                address = self._start_process()
+
+            pid = self.process.pid if self.process else self._shared_pid
+            self._sampler = ResourceSampler(pid, settings.monitor.interval)
+            self._sampler.start()
+            return address
+
+    def stats(self) -> Optional[ServerStats]:
+        """Get the server's memory and CPU usage.
+
+        Sampled from /proc every ``monitor.interval`` seconds (or now, when
+        the interval is 0), summed over the server and its child processes.
+
+        Returns:
+            Optional[ServerStats]: Latest sample, None if the server is not
+                running or /proc is unavailable
+        """
+        if self._sampler is None or not self.is_running():
+            return None
+        if self._sampler.interval <= 0 or self._sampler.latest() is None:
+            self._sampler.sample()
+        return self._sampler.latest()
+
+    def over_budget(self) -> bool:
+        """Check whether the server exceeds its memory budget.
+
+        Clients restart such a server between operations. Shared servers
+        are never over budget, since other processes still use them.
+
+        Returns:
+            bool: True if max_rss is set and the server's RSS exceeds it
+        """
+        if self.max_rss <= 0 or self._shared_pid is not None:
+            return False
+        stats = self.stats()
+        return stats is not None and stats["rss_bytes"] > self.max_rss
+
+    def restart(self) -> tuple[str, Optional[int]]:
+        """Stop the server and start a fresh one.
+
+        The new server starts with an empty design.
+
+        Returns:
+            tuple: (host, port) where the new server is running
+        """
+        self.stop()
+        # An auto-assigned port is picked again
+        self.port = self._requested_port
+        return self.start()
+
+    def start_async(self) -> "Future[tuple[str, Optional[int]]]":
+        """Start the server on a background thread.
+
+        Lets the server boot while the caller does other work. Calling it
+        again while a start is in flight returns the same future.
+
+        Returns:
+            Future: Resolves to (host, port) like :meth:`start`, or raises
+                its RuntimeError
+        """
+        with self._future_lock:
+            if self._start_future is not None and not self._start_future.done():
+                return self._start_future
+
+            future: Future = Future()
+            future.set_running_or_notify_cancel()
+            self._start_future = future
+
+        def run() -> None:
+            try:
+                future.set_result(self.start())
+            except BaseException as e:
+                future.set_exception(e)
+
+        self._start_thread = threading.Thread(target=run, name="rtllib-server-start", daemon=True)
+        self._start_thread.start()
+        return future
+
+    def _start_process(self, detached: bool = False) -> tuple[str, Optional[int]]:
+        """Start a new server process and wait until it is ready.
+
+        Args:
+            detached: Run the server in its own session with output going
+                to the shared log file, so it can outlive this process
 
-        # Auto-assign port if not specified
-        if self.port is None:
-            self.port = self.find_free_port()
+        Returns:
+            tuple: (host, port) where the server is running
+
+        Raises:
+            RuntimeError: If server fails to start
+        """
+        if self.unix_socket:
+            # No port to allocate, so no race with other processes binding it
+            self.uds = self.socket_path()
+            self.port = None
+            listen_args = ["--uds", self.uds]
+        else:
+            # Auto-assign port if not specified
+            if self.port is None:
+                self.port = self.find_free_port()
+            listen_args = ["--host", self.host, "--port", str(self.port)]
 
         # Build command based on mode
         if self.server_mode == "python":
@@ -89,100 +293,459 @@ class ServerManager:
             # In development, we assume it's in a sibling directory
             server_path = Path(__file__).parent.parent.parent.parent / "rtllib-server"
             if server_path.exists():
-                cmd = [
-                    "uv",
-                    "run",
-                    "--directory",
-                    str(server_path),
-                    "rtllib-server",
-                    "--host",
-                    self.host,
-                    "--port",
-                    str(self.port),
-                    "--idle-timeout",
-                    "300",  # 5 minutes
-                ]
+                cmd = self._python_server_command(server_path)
             else:
                 # Try installed package
-                cmd = [
-                    "rtllib-server",
-                    "--host",
-                    self.host,
-                    "--port",
-                    str(self.port),
-                    "--idle-timeout",
-                    "300",  # 5 minutes
-                ]
+                cmd = ["rtllib-server"]
         elif self.server_mode == "binary":
-            cmd = [
-                self.binary_path,
-                "--host",
-                self.host,
-                "--port",
-                str(self.port),
-                "--idle-timeout",
-                "300",  # 5 minutes
-            ]
+            cmd = [self.binary_path]
         else:
             raise ValueError(f"Unknown server mode: {self.server_mode}")
 
+        cmd += listen_args + [
+            "--idle-timeout",
+            "300",  # 5 minutes
+        ]
+
         logger.info(f"Starting server: {' '.join(cmd)}")
 
+        if detached:
+            return self._start_detached(cmd)
+
         try:
-            # Create log files for debugging
-            import tempfile
-            self._stdout_file = tempfile.NamedTemporaryFile(
-                mode='w+',
-                prefix='rtllib_server_stdout_',
-                suffix='.log',
-                delete=False
+            # Keep recent output in memory for debugging
+            output_settings = settings.server_output
+            self._output = OutputBuffer(
+                max_lines=output_settings.max_lines,
+                max_bytes=output_settings.max_bytes,
+                spill=output_settings.spill,
             )
-            self._stderr_file = tempfile.NamedTemporaryFile(
-                mode='w+',
-                prefix='rtllib_server_stderr_',
-                suffix='.log',
-                delete=False
-            )
-
-            logger.info(f"Server stdout: {self._stdout_file.name}")
-            logger.info(f"Server stderr: {self._stderr_file.name}")
 
+            self._ready_event.clear()
+            self._start_failed = False
             self.process = subprocess.Popen(
                 cmd,
-                stdout=self._stdout_file,
-                stderr=self._stderr_file,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                errors="replace",
             )
             self._started = True
             logger.info(f"Server process started with PID: {self.process.pid}")
 
+            # Copy server output to the buffer, watching for the ready line
+            self._output_threads = [
+                threading.Thread(
+                    target=self._pump_output,
+                    args=(self.process.stdout, "stdout"),
+                    daemon=True,
+                ),
+                threading.Thread(
+                    target=self._pump_output,
+                    args=(self.process.stderr, "stderr"),
+                    daemon=True,
+                ),
+            ]
+            for thread in self._output_threads:
+                thread.start()
+
             # Wait for server to be ready
+            if not self._wait_for_ready():
+                self._start_failed = True
+                self.stop()
+                tail = "\n".join(self.last_output(settings.server_output.error_lines))
+                full = f" (full output in {self.spill_path})" if self.spill_path else ""
+                raise RuntimeError(
+                    f"Server failed to become ready{full}" + (f", last output:\n{tail}" if tail else "")
+                )
+
+            logger.info(f"Server ready at {self.uds or f'{self.host}:{self.port}'}")
+            return self.host, self.port
+
+        except Exception as e:
+            logger.error(f"Failed to start server: {e}")
+            raise RuntimeError(f"Failed to start server: {e}") from e
+
+    def _python_server_command(self, server_path: Path) -> list[str]:
+        """Get the command that runs the development server.
+
+        ``uv run`` re-resolves and syncs the environment on every launch.
+        Instead, the server's interpreter and entry point are resolved with
+        ``uv run`` once and cached under a key derived from the lockfile,
+        so later launches run the interpreter directly.
+
+        Args:
+            server_path: rtllib-server project directory
+
+        Returns:
+            list[str]: Server command line, without listen arguments
+        """
+        uv_cmd = ["uv", "run", "--directory", str(server_path), "rtllib-server"]
+        if not settings.startup.get("cache_resolution", True):
+            return uv_cmd
+
+        key = hashlib.sha256()
+        for name in ("uv.lock", "pyproject.toml"):
+            try:
+                key.update((server_path / name).read_bytes())
+            except OSError:
+                pass
+        key.update(str(server_path.resolve()).encode())
+        cache_path = _cache_dir() / f"server-{key.hexdigest()[:16]}.json"
+
+        try:
+            with open(cache_path) as f:
+                resolved = json.load(f)
+            if os.path.exists(resolved["python"]):
+                logger.debug(f"Using cached server resolution: {cache_path}")
+                return self._entry_point_command(resolved)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        logger.info("Resolving server environment with uv (cached for later launches)")
+        try:
+            output = subprocess.run(
+                ["uv", "run", "--directory", str(server_path), "python", "-c", _RESOLVE_SCRIPT],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=settings.timeouts.startup,
+            ).stdout
+            resolved = json.loads(output.strip().splitlines()[-1])
+        except (OSError, subprocess.SubprocessError, ValueError, IndexError) as e:
+            logger.warning(f"Could not resolve server environment, using uv run: {e}")
+            return uv_cmd
+
+        if not resolved.get("entry_point"):
+            logger.warning("rtllib-server entry point not found, using uv run")
+            return uv_cmd
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(resolved))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Could not cache server resolution: {e}")
+
+        return self._entry_point_command(resolved)
+
+    @staticmethod
+    def _entry_point_command(resolved: dict) -> list[str]:
+        """Build a command that calls a "module:function" entry point directly."""
+        module, _, func = resolved["entry_point"].partition(":")
+        return [
+            resolved["python"],
+            "-c",
+            f"import sys; from {module} import {func}; sys.argv[0] = 'rtllib-server'; sys.exit({func}())",
+        ]
+
+    def _start_detached(self, cmd: list[str]) -> tuple[str, Optional[int]]:
+        """Start a server that does not depend on this process staying alive.
+
+        Output goes straight to a log file instead of through pipes, since
+        pipes would break once this process exits. Readiness is detected
+        by health polling alone.
+
+        Args:
+            cmd: Server command line
+
+        Returns:
+            tuple: (host, port) where the server is running
+
+        Raises:
+            RuntimeError: If server fails to start
+        """
+        log_path = self._shared_path(".log")
+        logger.info(f"Server log: {log_path}")
+
+        try:
+            with open(log_path, "a") as log_file:
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT,
+                    start_new_session=True,
+                )
+            self._started = True
+            logger.info(f"Shared server process started with PID: {self.process.pid}")
+
             if not self._wait_for_ready():
                 self.stop()
-                raise RuntimeError("Server failed to become ready")
+                raise RuntimeError(f"Server failed to become ready (see {log_path})")
 
-            logger.info(f"Server ready at {self.host}:{self.port}")
             return self.host, self.port
 
         except Exception as e:
             logger.error(f"Failed to start server: {e}")
             raise RuntimeError(f"Failed to start server: {e}") from e
 
+    def _shared_path(self, suffix: str) -> str:
+        """Get a path for the shared server of these settings.
+
+        Processes share a server only if they would start the same one,
+        so the settings that affect it are part of the file name.
+
+        Args:
+            suffix: File suffix (".lock", ".json" or ".log")
+
+        Returns:
+            str: Path under the runtime directory
+        """
+        return os.path.join(_runtime_dir(), f"rtllib-shared-{self._shared_key}{suffix}")
+
+    @contextmanager
+    def _shared_lock(self) -> Iterator[None]:
+        """Hold the lockfile that serializes access to the discovery file."""
+        with open(self._shared_path(".lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_discovery(self) -> Optional[dict]:
+        """Read the discovery file of the shared server, if any."""
+        try:
+            with open(self._shared_path(".json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_discovery(self, info: Optional[dict]) -> None:
+        """Atomically replace (or remove, if info is None) the discovery file."""
+        path = self._shared_path(".json")
+        if info is None:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            return
+
+        tmp_path = f"{path}.{self._shared_token.replace(':', '-')}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _live_clients(info: dict) -> list[str]:
+        """Get the attached clients whose process still exists.
+
+        Clients are recorded as "pid:nonce" tokens, so crashed processes
+        that never detached are dropped from the reference count.
+        """
+        return [c for c in info.get("clients", []) if _pid_alive(int(c.split(":")[0]))]
+
+    def _start_shared(self) -> tuple[str, Optional[int]]:
+        """Attach to the shared server, starting it if none is running.
+
+        Returns:
+            tuple: (host, port) where the server is running
+
+        Raises:
+            RuntimeError: If server fails to start
+        """
+        with self._shared_lock():
+            info = self._read_discovery()
+            if info is not None and self._attach(info):
+                return self.host, self.port
+
+            # No usable server: start one that outlives this process
+            self._start_process(detached=True)
+            self._shared_pid = self.process.pid
+            self._write_discovery({
+                "host": self.host,
+                "port": self.port,
+                "uds": self.uds,
+                "pid": self.process.pid,
+                "clients": [self._shared_token],
+            })
+            return self.host, self.port
+
+    def _attach(self, info: dict) -> bool:
+        """Attach to a running shared server. Must hold the shared lock.
+
+        Args:
+            info: Discovery file contents
+
+        Returns:
+            bool: True if the server is alive and this manager attached to it
+        """
+        if not _pid_alive(info["pid"]):
+            return False
+
+        if info.get("uds"):
+            url = "http://localhost/health"
+            http = httpx.Client(transport=httpx.HTTPTransport(uds=info["uds"]), timeout=2.0)
+        else:
+            url = f"http://{info['host']}:{info['port']}/health"
+            http = httpx.Client(timeout=2.0)
+        try:
+            with http:
+                if http.get(url).status_code != 200:
+                    return False
+        except (httpx.TransportError, FileNotFoundError):
+            return False
+
+        info["clients"] = self._live_clients(info) + [self._shared_token]
+        self._write_discovery(info)
+
+        self.host, self.port, self.uds = info["host"], info["port"], info["uds"]
+        self._shared_pid = info["pid"]
+        self._started = True
+        logger.info(
+            f"Attached to shared server (PID: {self._shared_pid}, "
+            f"{len(info['clients'])} clients) at {self.uds or f'{self.host}:{self.port}'}"
+        )
+        return True
+
+    def _detach_shared(self) -> bool:
+        """Detach from the shared server, stopping it if this was the last client.
+
+        Returns:
+            bool: True if the caller must still stop ``self.process``, i.e.
+                this was the last client and this manager started the server
+        """
+        with self._shared_lock():
+            info = self._read_discovery()
+            clients = []
+            if info is not None and info["pid"] == self._shared_pid:
+                clients = [c for c in self._live_clients(info) if c != self._shared_token]
+                info["clients"] = clients
+                self._write_discovery(info if clients else None)
+
+            pid = self._shared_pid
+            self._shared_pid = None
+            if clients:
+                # Leave the server running for the other clients
+                logger.info(f"Detached from shared server ({len(clients)} clients remain)")
+            elif self.process is not None:
+                return True
+            elif info is not None and info["pid"] == pid:
+                # Last client of a server started by another process
+                self._terminate_pid(pid)
+                if self.uds:
+                    try:
+                        os.unlink(self.uds)
+                    except OSError:
+                        pass
+
+            self.process = None
+            self._started = False
+            self.uds = None
+            return False
+
+    def _terminate_pid(self, pid: int) -> None:
+        """Terminate a server process this manager did not start."""
+        logger.info(f"Stopping shared server (PID: {pid})")
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            return
+
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            try:
+                # Reap it if it happens to be our child
+                os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                pass
+            if not _pid_alive(pid):
+                return
+            time.sleep(0.05)
+
+        logger.warning("Shared server did not stop gracefully, killing...")
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    def _pump_output(self, stream: TextIO, name: str) -> None:
+        """Copy one server output stream to the output buffer until EOF.
+
+        Sets the ready event when a line matches the ready pattern.
+
+        Args:
+            stream: Server stdout or stderr pipe
+            name: Stream name recorded with each line
+        """
+        pattern = re.compile(settings.startup.ready_pattern)
+        output = self._output
+        try:
+            for line in stream:
+                output.append(name, line)
+                if not self._ready_event.is_set() and pattern.search(line):
+                    logger.debug(f"Server reported ready: {line.rstrip()}")
+                    self._ready_event.set()
+        except (OSError, ValueError):
+            # Pipe closed by stop()
+            pass
+
+    @property
+    def spill_path(self) -> Optional[str]:
+        """Path of the file holding server output evicted from the buffer.
+
+        Only set with ``server_output.spill`` enabled, once the output
+        outgrew the buffer. The file is deleted when the server stops,
+        unless it failed to start or crashed.
+        """
+        return self._output.spill_path if self._output is not None else None
+
+    def last_output(self, n: int = 50, stream: Optional[str] = None) -> list[str]:
+        """Get the last lines the server wrote to stdout and stderr.
+
+        Still available after the server stopped, e.g. to see why a start
+        failed. Servers shared across processes write to a log file instead.
+
+        Args:
+            n: Maximum number of lines
+            stream: Only lines from "stdout" or "stderr" (default: both)
+
+        Returns:
+            list[str]: Output lines, oldest first
+        """
+        if self._output is None:
+            return []
+        return self._output.tail(n, stream)
+
     def _wait_for_ready(self) -> bool:
         """Wait for server to be ready.
 
+        Polls the health endpoint with exponential backoff, starting at a
+        few milliseconds. A ready line in the server output cuts the current
+        backoff short and triggers the next health check immediately.
+
         Returns:
             bool: True if server is ready, False otherwise
         """
         timeout = settings.timeouts.startup
         start_time = time.time()
-        url = f"http://{self.host}:{self.port}/health"
+        if self.uds:
+            url = "http://localhost/health"
+            http = httpx.Client(transport=httpx.HTTPTransport(uds=self.uds), timeout=2.0)
+        else:
+            url = f"http://{self.host}:{self.port}/health"
+            http = httpx.Client(timeout=2.0)
 
         logger.info(f"Waiting for server to be ready at {url}")
 
-        # Give server time to initialize before first check
-        logger.info("Initial wait for server initialization (3 seconds)...")
-        time.sleep(3)
+        with http:
+            return self._poll_health(http, url, start_time, timeout)
+
+    def _poll_health(self, http: httpx.Client, url: str, start_time: float, timeout: float) -> bool:
+        """Poll the health endpoint until it answers or the timeout expires.
+
+        Args:
+            http: HTTP client connected to the server
+            url: Health check URL
+            start_time: Time the wait started
+            timeout: Startup timeout in seconds
 
+        Returns:
+            bool: True if server is ready, False otherwise
+        """
+        delay = settings.startup.poll_initial
         attempt = 0
         while time.time() - start_time < timeout:
             attempt += 1
@@ -190,30 +753,66 @@ class ServerManager:
             # Check if process is still running
             if self.process and self.process.poll() is not None:
                 logger.error("Server process terminated unexpectedly")
-                logger.error(f"Check logs: {getattr(self, '_stderr_file', None)}")
+                for line in self.last_output(settings.server_output.error_lines, "stderr"):
+                    logger.error(f"  {line}")
                 return False
 
             try:
                 logger.debug(f"Health check attempt {attempt}")
-                response = httpx.get(url, timeout=2.0)
+                response = http.get(url)
                 if response.status_code == 200:
-                    logger.info(f"Server is ready (after {attempt} attempts)")
+                    elapsed = time.time() - start_time
+                    logger.info(f"Server is ready (after {attempt} attempts, {elapsed:.3f}s)")
                     return True
-            except (httpx.ConnectError, httpx.TimeoutException) as e:
+            except (httpx.TransportError, FileNotFoundError) as e:
                 logger.debug(f"Attempt {attempt} failed: {e}")
                 pass
 
-            time.sleep(1.0)  # Increased from 0.5s to 1.0s
+            # Sleep until the next poll, or until the server says it is ready
+            if self._ready_event.wait(delay):
+                self._ready_event.clear()
+                delay = settings.startup.poll_initial
+            else:
+                delay = min(delay * 2, settings.startup.poll_max)
 
         logger.error(f"Server did not become ready within {timeout} seconds")
         return False
 
     def stop(self) -> None:
-        """Stop the server process."""
-        if not self._started or not self.process:
+        """Stop the server process.
+
+        A shared server is only stopped by its last client, the others
+        just detach from it.
+        """
+        # Let a background start finish first, so its process is not orphaned
+        future = self._start_future
+        if (
+            future is not None
+            and not future.done()
+            and threading.current_thread() is not self._start_thread
+        ):
+            try:
+                future.result(timeout=settings.timeouts.startup)
+            except Exception:
+                pass
+
+        if not self._started:
+            return
+
+        if self._sampler is not None:
+            self._sampler.stop()
+            self._sampler = None
+
+        if self._shared_pid is not None and not self._detach_shared():
+            return
+
+        if not self.process:
+            self._started = False
             return
 
         logger.info(f"Stopping server (PID: {self.process.pid})")
+        # Exited on its own with an error, rather than stopped here
+        crashed = self.process.poll() not in (None, 0)
 
         try:
             self.process.terminate()
@@ -228,22 +827,26 @@ class ServerManager:
             self.process = None
             self._started = False
 
-            # Clean up log files
-            if hasattr(self, '_stdout_file'):
-                try:
-                    self._stdout_file.close()
-                    import os
-                    os.unlink(self._stdout_file.name)
-                except Exception:
-                    pass
-
-            if hasattr(self, '_stderr_file'):
+            # Output pipes hit EOF once the process is gone
+            for thread in getattr(self, '_output_threads', []):
+                thread.join(timeout=1.0)
+            self._output_threads = []
+
+            # Buffered lines stay readable through last_output(), and the
+            # spill file is kept to debug a failed start or a crash
+            if self._output is not None:
+                keep = self._start_failed or crashed
+                self._output.close(remove=not keep)
+                if keep and self._output.spill_path:
+                    logger.warning(f"Server output kept in {self._output.spill_path}")
+
+            # Remove the Unix socket left behind by the server
+            if self.uds:
                 try:
-                    self._stderr_file.close()
-                    import os
-                    os.unlink(self._stderr_file.name)
-                except Exception:
+                    os.unlink(self.uds)
+                except OSError:
                     pass
+                self.uds = None
 
     def is_running(self) -> bool:
         """Check if server is running.
@@ -251,8 +854,26 @@ class ServerManager:
         Returns:
             bool: True if server is running
         """
+        if self._shared_pid is not None and self.process is None:
+            return self._started and _pid_alive(self._shared_pid)
         return self._started and self.process and self.process.poll() is None
 
+    def wait_exited(self, timeout: float) -> bool:
+        """Wait for the server process to exit on its own.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            bool: True if the server is no longer running
+        """
+        deadline = time.monotonic() + timeout
+        while self.is_running():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals.
 
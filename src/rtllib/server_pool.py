@@ -0,0 +1,227 @@
+"""Pool of pre-started servers."""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from rtllib.config import settings
+from rtllib.server_manager import ServerManager
+
+logger = logging.getLogger(__name__)
+
+
+class ServerPool:
+    """Keeps warm servers ready so clients skip the server cold start.
+
+    Servers are started in the background up to ``size`` idle ones. A
+    client checks one out on connect and returns it on close. Servers whose
+    design was changed are recycled (stopped and replaced) on return, since
+    the server has no way to reset its session state; untouched ones go
+    straight back to the pool.
+
+    Example:
+        >>> with ServerPool(size=4) as pool:
+        ...     for path in paths:
+        ...         with Client(pool=pool) as client:
+        ...             client.read_verilog(path)
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        server_mode: Optional[str] = None,
+        binary_path: Optional[str] = None,
+        host: Optional[str] = None,
+        unix_socket: Optional[bool] = None,
+        max_uses: Optional[int] = None,
+    ):
+        """Initialize the pool (no servers are started until :meth:`start`).
+
+        Args:
+            size: Number of idle servers to keep ready (defaults to config)
+            server_mode: "python" or "binary" (defaults to config)
+            binary_path: Path to server binary (defaults to config)
+            host: Host to bind servers to (defaults to config)
+            unix_socket: Servers listen on Unix domain sockets (defaults to config)
+            max_uses: Recycle a server after this many checkouts, 0 for no
+                limit (defaults to config)
+        """
+        self.size = size if size is not None else settings.pool.size
+        self.max_uses = max_uses if max_uses is not None else settings.pool.max_uses
+        self._manager_args = {
+            "server_mode": server_mode,
+            "binary_path": binary_path,
+            "host": host,
+            "unix_socket": unix_socket,
+            # Pooled servers are handed to one client at a time
+            "shared": False,
+        }
+
+        self._idle: deque[ServerManager] = deque()
+        self._uses: dict[int, int] = {}
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def start(self) -> None:
+        """Start filling the pool in the background."""
+        with self._condition:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(self.size, 1), thread_name_prefix="rtllib-pool"
+                )
+            self._closed = False
+            self._refill()
+
+    def _refill(self) -> None:
+        """Start servers until idle plus starting ones reach the pool size.
+
+        Must be called with the condition held.
+        """
+        while not self._closed and len(self._idle) + self._pending < self.size:
+            self._spawn()
+
+    def _spawn(self) -> None:
+        """Start one server in the background. Must be called with the condition held."""
+        self._pending += 1
+        self._executor.submit(self._start_server)
+
+    def _start_server(self) -> None:
+        """Start a server and add it to the idle servers."""
+        manager = ServerManager(**self._manager_args)
+        try:
+            manager.start()
+        except Exception as e:
+            logger.error(f"Pool failed to start a server: {e}")
+            manager = None
+
+        with self._condition:
+            self._pending -= 1
+            if manager is not None:
+                if self._closed:
+                    manager.stop()
+                else:
+                    self._uses[id(manager)] = 0
+                    self._idle.append(manager)
+            self._condition.notify_all()
+
+    def checkout(self, timeout: Optional[float] = None) -> ServerManager:
+        """Take a ready server out of the pool.
+
+        Returns immediately when an idle server is available, otherwise
+        waits for one to finish starting.
+
+        Args:
+            timeout: Maximum time to wait in seconds (defaults to the
+                startup timeout)
+
+        Returns:
+            ServerManager: Running server, owned by the caller until :meth:`checkin`
+
+        Raises:
+            RuntimeError: If the pool is closed or no server became ready in time
+        """
+        if timeout is None:
+            timeout = settings.timeouts.startup
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            if self._executor is None and not self._closed:
+                self.start()
+
+            while True:
+                if self._closed:
+                    raise RuntimeError("Server pool is closed")
+
+                while self._idle:
+                    manager = self._idle.popleft()
+                    if manager.is_running():
+                        self._uses[id(manager)] += 1
+                        self._refill()
+                        logger.debug(f"Checked out server at {manager.uds or f'{manager.host}:{manager.port}'}")
+                        return manager
+                    # Idle server died (e.g. idle timeout), drop it
+                    logger.info("Dropping dead server from pool")
+                    self._uses.pop(id(manager), None)
+                    manager.stop()
+
+                # Nothing idle: make sure one is on its way, then wait for it
+                if self._pending == 0:
+                    self._spawn()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError(f"No server became available within {timeout} seconds")
+                self._condition.wait(remaining)
+
+    def checkin(self, manager: ServerManager, recycle: bool = False) -> None:
+        """Return a server to the pool.
+
+        Args:
+            manager: Server previously returned by :meth:`checkout`
+            recycle: Stop the server instead of reusing it, e.g. because
+                its design was modified
+        """
+        with self._condition:
+            uses = self._uses.get(id(manager), 0)
+            reuse = (
+                not recycle
+                and not self._closed
+                and manager.is_running()
+                and not manager.over_budget()
+                and (self.max_uses <= 0 or uses < self.max_uses)
+                and len(self._idle) < self.size
+            )
+            if reuse:
+                self._idle.append(manager)
+                self._condition.notify_all()
+                return
+            self._uses.pop(id(manager), None)
+
+        # Stopping can take a while, keep it outside the lock
+        logger.debug("Recycling pooled server")
+        manager.stop()
+        with self._condition:
+            self._refill()
+
+    def idle_count(self) -> int:
+        """Get the number of servers ready for checkout.
+
+        Returns:
+            int: Number of idle servers
+        """
+        with self._condition:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """Stop all idle servers and any server still starting.
+
+        Servers checked out at this point are stopped when returned.
+        """
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            executor = self._executor
+            self._executor = None
+            self._condition.notify_all()
+
+        for manager in idle:
+            self._uses.pop(id(manager), None)
+            manager.stop()
+
+        # Servers that finish starting after close() stop themselves
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
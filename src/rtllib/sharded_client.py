@@ -0,0 +1,725 @@
+"""Client spreading per-module queries across several servers."""
+
+import itertools
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Union
+
+from rtllib.client import Client
+from rtllib.config import settings
+from rtllib.eco import load_eco
+from rtllib.filelist import format_filelist, parse_filelist
+from rtllib.types import (
+    AddNetResult,
+    AddPortResult,
+    EcoResult,
+    EcoSpec,
+    HealthCheckResult,
+    InstanceInfo,
+    ModuleInfo,
+    NetInfo,
+    NetSpec,
+    PortInfo,
+    PortSpec,
+    ReadFilelistResult,
+    ReadVerilogResult,
+    ReloadResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _endpoint_client(endpoint: Union[str, dict]) -> Client:
+    """Create a client for an external endpoint.
+
+    Args:
+        endpoint: "host:port", "unix:/path/to.sock", or a dict with
+            "host" and "port" or "uds"
+
+    Returns:
+        Client: Client for the endpoint (not yet connected)
+    """
+    if isinstance(endpoint, dict):
+        if endpoint.get("uds"):
+            return Client(uds=endpoint["uds"])
+        return Client(host=endpoint["host"], port=int(endpoint["port"]))
+
+    if endpoint.startswith("unix:"):
+        return Client(uds=endpoint[len("unix:"):])
+    host, sep, port = endpoint.rpartition(":")
+    if not sep or not host:
+        raise ValueError(f"Invalid endpoint {endpoint!r} (expected host:port or unix:/path)")
+    return Client(host=host, port=int(port))
+
+
+def _failed(result: Any) -> bool:
+    """Check whether a call result reports failure ("success" or "status")."""
+    if not isinstance(result, dict) or ("success" not in result and "status" not in result):
+        return False
+    return not result.get("success", result.get("status") == "success")
+
+
+def _merge_results(results: list[Any]) -> Any:
+    """Pick the result to report for a call made on several shards.
+
+    The first failure wins, its message naming the shard, so a failure on
+    any shard is not hidden behind the first shard's success.
+
+    Args:
+        results: One result per shard
+
+    Returns:
+        Any: The first failed result, otherwise the first result
+    """
+    for shard, result in enumerate(results):
+        if _failed(result):
+            if len(results) == 1:
+                return result
+            logger.warning(f"Call failed on shard {shard}: {result}")
+            return {**result, "message": f"shard {shard}: {result['message']}"} if "message" in result else result
+    return results[0]
+
+
+class ShardedClient:
+    """Client that loads one design on several servers and spreads queries.
+
+    Design-changing calls (reads, compile, elaborate, edits) go to every
+    shard, so all servers hold the same design; their result is the first
+    shard's, or the first failure on any shard. Queries for one module go
+    to any shard (round-robin). Queries for many modules (``get_*_many``)
+    are split into chunks that the shards work through in parallel; the
+    results have the same shape as from :class:`Client`.
+
+    Alternatively, ``read_verilog_filelist(path, partition=True)`` splits
+    the files of a filelist across the shards so they are parsed in
+    parallel. Each module then lives on one shard, and queries and edits
+    (single-module and ``get_*_many``) are routed to the shard that owns
+    the module. Which shard owns which module is looked up again after
+    every design-changing call, so modules that compile or elaborate
+    create are routed too.
+
+    Example:
+        >>> with ShardedClient(shards=4) as client:
+        ...     client.read_verilog_filelist("design.f")
+        ...     client.elaborate()
+        ...     names = [m["name"] for m in client.get_modules(include=())]
+        ...     ports = client.get_ports_many(names)
+    """
+
+    def __init__(
+        self,
+        shards: Optional[int] = None,
+        endpoints: Optional[list[Union[str, dict]]] = None,
+        server_mode: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """Initialize the shards.
+
+        Args:
+            shards: Number of servers to auto-start, ignored when endpoints
+                are given (defaults to config)
+            endpoints: External servers as "host:port" or "unix:/path"
+                strings (defaults to config; auto-start when empty)
+            server_mode: "python" or "binary" for auto-started servers
+                (defaults to config)
+            chunk_size: Modules per unit of work handed to a shard
+                (defaults to config)
+        """
+        if endpoints is None:
+            endpoints = list(settings.sharding.endpoints)
+        self.chunk_size = chunk_size if chunk_size is not None else settings.sharding.chunk_size
+
+        if endpoints:
+            self.clients = [_endpoint_client(endpoint) for endpoint in endpoints]
+        else:
+            count = shards if shards is not None else settings.sharding.shards
+            if count < 1:
+                raise ValueError(f"Need at least one shard, got {count}")
+            # Servers boot in parallel while the shards are set up
+            self.clients = [
+                Client(auto_start=True, server_mode=server_mode, start="background")
+                for _ in range(count)
+            ]
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.clients), thread_name_prefix="rtllib-shard"
+        )
+        self._next_shard = itertools.count()
+        self._next_lock = threading.Lock()
+        # Module name -> index of the shard holding it, after a partitioned
+        # load; None until looked up (again) after a design change
+        self._partitioned = False
+        self._owners: Optional[dict[str, int]] = None
+        self._owners_lock = threading.Lock()
+        # Generated filelists of partitioned loads, removed on close()
+        self._partition_filelists: list[str] = []
+
+    def _broadcast(self, call: Callable[[Client], Any]) -> Any:
+        """Run a call on every shard in parallel.
+
+        Args:
+            call: Function applied to each shard client
+
+        Returns:
+            Any: The first failed result (see _merge_results), otherwise
+                the first shard's result
+
+        Raises:
+            Exception: The first error raised by any shard
+        """
+        return _merge_results(self._broadcast_all(call))
+
+    def _any_shard(self) -> Client:
+        """Pick a shard round-robin for a single query."""
+        with self._next_lock:
+            return self.clients[next(self._next_shard) % len(self.clients)]
+
+    def _map_modules(
+        self,
+        method: str,
+        modules: Iterable[str],
+        filter: Optional[str],
+        hierarchical: bool,
+    ) -> dict[str, Any]:
+        """Spread a batched per-module query over the shards.
+
+        Modules are cut into chunks, and each shard takes the next chunk
+        as soon as it is done with its previous one, so slow modules do
+        not hold back the other shards.
+
+        Args:
+            method: Batched Client method ("get_ports_many", ...)
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: Include results from the sub-hierarchy
+
+        Returns:
+            dict: Result per module, in input order
+        """
+        modules = list(dict.fromkeys(modules))
+        results: list[Any] = [None] * len(modules)
+
+        # Work any shard can take, and per-shard work for partitioned designs
+        shared: list[list[int]] = []
+        owned: list[list[list[int]]] = [[] for _ in self.clients]
+        by_shard: dict[Optional[int], list[int]] = {}
+        for i, module in enumerate(modules):
+            by_shard.setdefault(self._owner(module), []).append(i)
+        for owner, indexes in by_shard.items():
+            chunks = [indexes[start:start + self.chunk_size] for start in range(0, len(indexes), self.chunk_size)]
+            (shared if owner is None else owned[owner]).extend(chunks)
+        shared.reverse()
+        lock = threading.Lock()
+
+        def work(shard: int) -> None:
+            client = self.clients[shard]
+            while True:
+                with lock:
+                    if owned[shard]:
+                        chunk = owned[shard].pop()
+                    elif shared:
+                        chunk = shared.pop()
+                    else:
+                        return
+                names = [modules[i] for i in chunk]
+                by_module = getattr(client, method)(names, filter=filter, hierarchical=hierarchical)
+                for i in chunk:
+                    results[i] = by_module[modules[i]]
+
+        busy = [shard for shard in range(len(self.clients)) if owned[shard] or shared]
+        futures = [self._executor.submit(work, shard) for shard in busy]
+        for future in futures:
+            future.result()
+        return dict(zip(modules, results))
+
+    def _module_shard(self, module: str) -> Client:
+        """Pick the shard for a single-module query: its owner, or any shard."""
+        owner = self._owner(module)
+        return self.clients[owner] if owner is not None else self._any_shard()
+
+    def _owner(self, module: str) -> Optional[int]:
+        """Get the shard holding a module, None if every shard has it."""
+        owners = self._ownership()
+        return owners.get(module) if owners is not None else None
+
+    def _ownership(self) -> Optional[dict[str, int]]:
+        """Get the shard holding each module, looking it up if needed.
+
+        Returns:
+            Optional[dict]: Module name -> shard index for the modules only
+                one shard holds, None if the design is not partitioned
+        """
+        if not self._partitioned:
+            return None
+        with self._owners_lock:
+            if self._owners is None:
+                self._owners, _ = self._find_owners()
+            return self._owners
+
+    def _find_owners(self) -> tuple[dict[str, int], int]:
+        """Ask every shard for its modules.
+
+        Returns:
+            tuple: (module name -> shard index for the modules only one shard
+                holds, number of distinct modules)
+        """
+        owners: dict[str, int] = {}
+        shared: set[str] = set()
+        for shard, modules in enumerate(self._broadcast_all(lambda c: c.get_modules(include=()))):
+            for module in modules:
+                name = module["name"]
+                if name in owners and owners[name] != shard:
+                    shared.add(name)
+                owners.setdefault(name, shard)
+        return {name: shard for name, shard in owners.items() if name not in shared}, len(owners)
+
+    def _design_changed(self) -> None:
+        """Forget the module owners, the shards may hold other modules now."""
+        with self._owners_lock:
+            self._owners = None
+
+    def _edit_many(self, method: str, items: list[dict]) -> list[Any]:
+        """Apply bulk edits on the shards holding the edited modules.
+
+        Args:
+            method: Bulk Client method ("add_ports" or "add_nets")
+            items: Edits, each with a "module" key
+
+        Returns:
+            list: One result per edit, in input order (for edits applied on
+                every shard, the first failure or the first shard's result)
+        """
+        groups: dict[Optional[int], list[int]] = {}
+        for i, item in enumerate(items):
+            groups.setdefault(self._owner(item["module"]), []).append(i)
+
+        submitted = []
+        for owner, indexes in groups.items():
+            batch = [items[i] for i in indexes]
+            targets = self.clients if owner is None else [self.clients[owner]]
+            futures = [self._executor.submit(getattr(client, method), batch) for client in targets]
+            submitted.append((indexes, futures))
+
+        results: list[Any] = [None] * len(items)
+        for indexes, futures in submitted:
+            shard_results = [future.result() for future in futures]
+            for position, i in enumerate(indexes):
+                results[i] = _merge_results([batch_results[position] for batch_results in shard_results])
+        return results
+
+    def health_check(self) -> list[HealthCheckResult]:
+        """Check the health of every shard.
+
+        Returns:
+            list[HealthCheckResult]: One result per shard
+        """
+        return self._broadcast_all(lambda client: client.health_check())
+
+    def read_verilog(self, path: str) -> ReadVerilogResult:
+        """Read and parse a Verilog file on every shard.
+
+        Args:
+            path: Path to the Verilog file
+
+        Returns:
+            ReadVerilogResult: Result of the operation (first shard, or the first failure)
+        """
+        try:
+            return self._broadcast(lambda client: client.read_verilog(path))
+        finally:
+            self._design_changed()
+
+    def read_verilog_filelist(
+        self,
+        filelist_path: str,
+        partition: bool = False,
+        common_files: Iterable[str] = (),
+    ) -> ReadFilelistResult:
+        """Read multiple Verilog files from a filelist.
+
+        By default every shard reads the whole filelist. With ``partition``,
+        the filelist is parsed here (see :func:`rtllib.filelist.parse_filelist`)
+        and its files are split across the shards, balanced by file size,
+        so they are parsed in parallel. Include dirs, defines and ``-v``/``-y``
+        libraries go to every shard. The files must form independent
+        compilation units: a module can only instantiate modules from its
+        own partition, from ``common_files`` or from the libraries.
+
+        Each shard reads its part from a generated filelist, kept until
+        :meth:`close` so the shard can replay and reload it.
+
+        Args:
+            filelist_path: Path to the filelist file
+            partition: Split the files across the shards
+            common_files: Files read by every shard, e.g. packages the other
+                files import (paths as listed in the filelist, or absolute)
+
+        Returns:
+            ReadFilelistResult: Result of the operation (first shard, or the
+                first failure), or with ``partition`` the counts merged over
+                all shards
+        """
+        if not partition:
+            try:
+                return self._broadcast(lambda client: client.read_verilog_filelist(filelist_path))
+            finally:
+                self._design_changed()
+
+        filelist = parse_filelist(filelist_path)
+        base = Path(filelist_path).resolve().parent
+        common = [str((base / f).resolve()) for f in common_files]
+        partitions = self._partition([f for f in filelist["files"] if f not in common])
+
+        # The shards journal and track these filelists, so they stay on disk
+        paths = []
+        for files in partitions:
+            with tempfile.NamedTemporaryFile(
+                mode="w", prefix="rtllib_shard_", suffix=".f", delete=False
+            ) as f:
+                f.write(format_filelist(filelist, common + files))
+                paths.append(f.name)
+        self._partition_filelists.extend(paths)
+
+        futures = [
+            self._executor.submit(client.read_verilog_filelist, path)
+            for client, path in zip(self.clients, paths)
+        ]
+        results = [future.result() for future in futures]
+
+        # Record which shard holds each module (common modules stay on all)
+        owners, module_count = self._find_owners()
+        with self._owners_lock:
+            self._partitioned = True
+            self._owners = owners
+
+        return {
+            "success": all(result["success"] for result in results),
+            "files_read": sum(result["files_read"] for result in results) - len(common) * (len(results) - 1),
+            "modules_found": module_count,
+            "message": "; ".join(f"shard {i}: {result['message']}" for i, result in enumerate(results)),
+        }
+
+    def reload(self) -> ReloadResult:
+        """Re-read the sources that changed on disk on every shard.
+
+        See :meth:`rtllib.Client.reload`; each shard re-reads the files it
+        loaded, so after a partitioned load only the shards holding an
+        edited file read it again.
+
+        Returns:
+            ReloadResult: Re-read files of all shards, and the compile and
+                elaborate results (first shard)
+
+        Raises:
+            RuntimeError: If re-reading a file or filelist fails on any shard
+        """
+        try:
+            results = self._broadcast_all(lambda client: client.reload())
+        finally:
+            self._design_changed()
+
+        return {
+            **results[0],
+            "changed": any(result["changed"] for result in results),
+            "files": list(dict.fromkeys(path for result in results for path in result["files"])),
+        }
+
+    def _partition(self, files: list[str]) -> list[list[str]]:
+        """Split files into one group per shard with similar total size.
+
+        Files keep their filelist order within a group.
+        """
+        def size(path: str) -> int:
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+
+        loads = [0] * len(self.clients)
+        groups: list[list[int]] = [[] for _ in self.clients]
+        for i in sorted(range(len(files)), key=lambda i: size(files[i]), reverse=True):
+            shard = loads.index(min(loads))
+            groups[shard].append(i)
+            loads[shard] += size(files[i]) or 1
+        return [[files[i] for i in sorted(group)] for group in groups]
+
+    def _broadcast_all(self, call: Callable[[Client], Any]) -> list[Any]:
+        """Run a call on every shard in parallel and return every result.
+
+        Raises:
+            Exception: The first error raised by any shard, once every shard
+                is done (the others are logged)
+        """
+        futures = [self._executor.submit(call, client) for client in self.clients]
+        results, errors = [], []
+        for shard, future in enumerate(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors.append((shard, e))
+        if errors:
+            for shard, error in errors[1:]:
+                logger.error(f"Call also failed on shard {shard}: {error}")
+            raise errors[0][1]
+        return results
+
+    def compile(self) -> str:
+        """Compile the loaded Verilog code on every shard.
+
+        Returns:
+            str: Result message (first shard)
+        """
+        try:
+            return self._broadcast(lambda client: client.compile())
+        finally:
+            self._design_changed()
+
+    def elaborate(self) -> str:
+        """Elaborate the compiled design on every shard.
+
+        Returns:
+            str: Result message (first shard)
+        """
+        try:
+            return self._broadcast(lambda client: client.elaborate())
+        finally:
+            self._design_changed()
+
+    def add_port(self, module: str, port_name: str, direction: str, width: int) -> AddPortResult:
+        """Add a port to a module on every shard (or the shard holding it).
+
+        Args:
+            module: Name of the module
+            port_name: Name of the port to add
+            direction: Port direction ("input", "output", "inout")
+            width: Bit width of the port
+
+        Returns:
+            AddPortResult: Result of the operation (first shard, or the first failure)
+        """
+        owner = self._owner(module)
+        if owner is not None:
+            return self.clients[owner].add_port(module, port_name, direction, width)
+        return self._broadcast(lambda client: client.add_port(module, port_name, direction, width))
+
+    def add_net(self, module: str, net_name: str, width: int, net_type: str = "wire") -> AddNetResult:
+        """Add a net/wire to a module on every shard (or the shard holding it).
+
+        Args:
+            module: Name of the module
+            net_name: Name of the net to add
+            width: Bit width of the net
+            net_type: Type of the net ("wire", "reg", "logic")
+
+        Returns:
+            AddNetResult: Result of the operation (first shard, or the first failure)
+        """
+        owner = self._owner(module)
+        if owner is not None:
+            return self.clients[owner].add_net(module, net_name, width, net_type)
+        return self._broadcast(lambda client: client.add_net(module, net_name, width, net_type))
+
+    def add_ports(self, ports: Iterable[PortSpec]) -> list[AddPortResult]:
+        """Add many ports on every shard (or the shards holding their modules).
+
+        Args:
+            ports: Ports to add, each with module, port_name, direction and width
+
+        Returns:
+            list[AddPortResult]: One result per port (first shard, or the first failure)
+        """
+        return self._edit_many("add_ports", list(ports))
+
+    def add_nets(self, nets: Iterable[NetSpec]) -> list[AddNetResult]:
+        """Add many nets on every shard (or the shards holding their modules).
+
+        Args:
+            nets: Nets to add, each with module, net_name, width and an
+                optional net_type (default "wire")
+
+        Returns:
+            list[AddNetResult]: One result per net (first shard, or the first failure)
+        """
+        return self._edit_many("add_nets", list(nets))
+
+    def apply_eco(self, spec: Union[str, Path, EcoSpec]) -> EcoResult:
+        """Apply an ECO spec on every shard (or the shards holding its modules).
+
+        Args:
+            spec: Path to a CSV or JSON ECO file, or an already loaded EcoSpec
+
+        Returns:
+            EcoResult: Per-item results (first shard, or the first failure)
+        """
+        if not isinstance(spec, dict):
+            spec = load_eco(spec)
+
+        return {
+            "ports": self.add_ports(spec["ports"]),
+            "nets": self.add_nets(spec["nets"]),
+        }
+
+    def get_modules(
+        self,
+        filter: Optional[str] = None,
+        hierarchical: bool = False,
+        include: Optional[Iterable[str]] = None,
+    ) -> list[ModuleInfo]:
+        """Get all modules in the design.
+
+        Comes from one shard, or from all shards after a partitioned load.
+
+        Args:
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include hierarchical instances as flat list with paths
+            include: Nested lists to fetch, any of "ports", "instances" and
+                "nets" (default: all)
+
+        Returns:
+            list[ModuleInfo]: List of module information
+        """
+        if not self._partitioned:
+            return self._any_shard().get_modules(filter, hierarchical, include)
+
+        modules: dict[str, ModuleInfo] = {}
+        for shard_modules in self._broadcast_all(lambda client: client.get_modules(filter, hierarchical, include)):
+            for module in shard_modules:
+                modules.setdefault(module["name"], module)
+        return list(modules.values())
+
+    def get_instances(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[InstanceInfo]:
+        """Get all instances in a specific module, from the shard holding it.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include instances from sub-hierarchy
+
+        Returns:
+            list[InstanceInfo]: List of instance information
+        """
+        return self._module_shard(module).get_instances(module, filter, hierarchical)
+
+    def get_ports(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[PortInfo]:
+        """Get all ports of a specific module, from the shard holding it.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include ports from sub-instances
+
+        Returns:
+            list[PortInfo]: List of port information
+        """
+        return self._module_shard(module).get_ports(module, filter, hierarchical)
+
+    def get_nets(
+        self,
+        module: str,
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> list[NetInfo]:
+        """Get all nets in a specific module, from the shard holding it.
+
+        Args:
+            module: Name of the module
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include nets from sub-instances
+
+        Returns:
+            list[NetInfo]: List of net information
+        """
+        return self._module_shard(module).get_nets(module, filter, hierarchical)
+
+    def get_instances_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[InstanceInfo]]:
+        """Get the instances of many modules, spread across the shards.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include instances from sub-hierarchy
+
+        Returns:
+            dict[str, list[InstanceInfo]]: Instance information per module
+        """
+        return self._map_modules("get_instances_many", modules, filter, hierarchical)
+
+    def get_ports_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[PortInfo]]:
+        """Get the ports of many modules, spread across the shards.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include ports from sub-instances
+
+        Returns:
+            dict[str, list[PortInfo]]: Port information per module
+        """
+        return self._map_modules("get_ports_many", modules, filter, hierarchical)
+
+    def get_nets_many(
+        self,
+        modules: Iterable[str],
+        filter: Optional[str] = None,
+        hierarchical: bool = False
+    ) -> dict[str, list[NetInfo]]:
+        """Get the nets of many modules, spread across the shards.
+
+        Args:
+            modules: Names of the modules
+            filter: Optional filter expression (backend-specific)
+            hierarchical: If True, include nets from sub-instances
+
+        Returns:
+            dict[str, list[NetInfo]]: Net information per module
+        """
+        return self._map_modules("get_nets_many", modules, filter, hierarchical)
+
+    def close(self) -> None:
+        """Close every shard, stopping the servers this client started."""
+        futures = [self._executor.submit(client.close) for client in self.clients]
+        for future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"Failed to close shard: {e}")
+        self._executor.shutdown(wait=True)
+
+        for path in self._partition_filelists:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._partition_filelists = []
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
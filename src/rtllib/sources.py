@@ -0,0 +1,142 @@
+"""Change tracking of the source files a client has loaded."""
+
+import hashlib
+import logging
+import os
+from typing import Optional
+
+from rtllib.filelist import parse_filelist
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size, sha256 of the content)
+_Fingerprint = tuple[int, int, str]
+
+
+def _fingerprint(path: str, previous: Optional[_Fingerprint] = None) -> Optional[_Fingerprint]:
+    """Fingerprint a file, hashing it only if its mtime or size changed.
+
+    Args:
+        path: File path
+        previous: Earlier fingerprint of the same file
+
+    Returns:
+        Optional[_Fingerprint]: Fingerprint, None if the file cannot be read
+    """
+    try:
+        stat = os.stat(path)
+        if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+            return previous
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, digest.hexdigest()
+
+
+class SourceTracker:
+    """Remembers the content of loaded source files to find edited ones.
+
+    A file counts as changed when its content hash differs from the one
+    recorded when it was loaded. The hash is only recomputed when the
+    file's mtime or size changed, so checking unchanged files is a stat
+    call each.
+
+    Files the client cannot see (e.g. paths local to a remote server) are
+    not tracked.
+    """
+
+    def __init__(self):
+        """Initialize an empty tracker."""
+        self._files: dict[str, _Fingerprint] = {}
+        # Filelist path -> fingerprint of the filelist itself
+        self._filelists: dict[str, _Fingerprint] = {}
+
+    def track(self, path: str) -> None:
+        """Record the current content of a loaded Verilog file.
+
+        Args:
+            path: Path the file was loaded from
+        """
+        fingerprint = _fingerprint(path)
+        if fingerprint is None:
+            logger.debug(f"Cannot read {path} locally, not tracking it")
+            return
+        self._files[path] = fingerprint
+
+    def track_filelist(self, filelist_path: str) -> None:
+        """Record the current content of a loaded filelist and its files.
+
+        Args:
+            filelist_path: Path the filelist was loaded from
+        """
+        fingerprint = _fingerprint(filelist_path)
+        try:
+            files = parse_filelist(filelist_path)["files"]
+        except (OSError, ValueError) as e:
+            logger.debug(f"Cannot parse {filelist_path} locally, not tracking it: {e}")
+            return
+
+        if fingerprint is not None:
+            self._filelists[filelist_path] = fingerprint
+        for path in files:
+            self.track(path)
+
+    def changed_filelists(self) -> tuple[list[str], list[str]]:
+        """Get the loaded filelists that were edited or deleted since they were tracked.
+
+        Returns:
+            tuple: (changed paths, deleted paths), in load order
+        """
+        changed, deleted = [], []
+        for path, fingerprint in self._filelists.items():
+            current = _fingerprint(path, fingerprint)
+            if current is None:
+                deleted.append(path)
+            elif current[2] != fingerprint[2]:
+                changed.append(path)
+            elif current != fingerprint:
+                # Touched but not edited, skip the hash next time
+                self._filelists[path] = current
+        return changed, deleted
+
+    def changed_files(self) -> tuple[list[str], list[str]]:
+        """Get the loaded files that were edited or deleted since they were tracked.
+
+        Returns:
+            tuple: (changed paths, deleted paths), in load order
+        """
+        changed, deleted = [], []
+        for path, fingerprint in self._files.items():
+            current = _fingerprint(path, fingerprint)
+            if current is None:
+                deleted.append(path)
+            elif current[2] != fingerprint[2]:
+                changed.append(path)
+            elif current != fingerprint:
+                # Touched but not edited, skip the hash next time
+                self._files[path] = current
+        return changed, deleted
+
+    def forget(self, path: str) -> None:
+        """Stop tracking a file or filelist.
+
+        The files a forgotten filelist listed stay tracked.
+
+        Args:
+            path: File or filelist path
+        """
+        self._files.pop(path, None)
+        self._filelists.pop(path, None)
+
+    def clear(self) -> None:
+        """Stop tracking all files."""
+        self._files.clear()
+        self._filelists.clear()
+
+    def __len__(self) -> int:
+        """Number of tracked files."""
+        return len(self._files)
@@ -1,6 +1,6 @@
 """Type definitions for RTL library client."""
 
-from typing import TypedDict
+from typing import Optional, TypedDict
 from typing_extensions import NotRequired
 
 
@@ -32,13 +32,16 @@ class NetInfo(TypedDict):
 
 
 class ModuleInfo(TypedDict):
-    """Information about a Verilog module with nested objects."""
+    """Information about a Verilog module with nested objects.
+
+    The nested lists are only present when selected with ``include``.
+    """
 
     name: str
     file: str
-    ports: list[PortInfo]
-    instances: list[InstanceInfo]
-    nets: list[NetInfo]
+    ports: NotRequired[list[PortInfo]]
+    instances: NotRequired[list[InstanceInfo]]
+    nets: NotRequired[list[NetInfo]]
     path: NotRequired[str]
 
 
@@ -59,6 +62,17 @@ class ReadFilelistResult(TypedDict):
     message: str
 
 
+class Filelist(TypedDict):
+    """Contents of a parsed Verilog filelist."""
+
+    files: list[str]
+    incdirs: list[str]
+    defines: dict[str, str]
+    library_files: list[str]
+    library_dirs: list[str]
+    libexts: list[str]
+
+
 class AddPortResult(TypedDict):
     """Result of adding a port to a module."""
 
@@ -77,6 +91,47 @@ class AddNetResult(TypedDict):
     message: str
 
 
+class PortSpec(TypedDict):
+    """A port to add to a module."""
+
+    module: str
+    port_name: str
+    direction: str
+    width: int
+
+
+class NetSpec(TypedDict):
+    """A net to add to a module."""
+
+    module: str
+    net_name: str
+    width: int
+    net_type: NotRequired[str]
+
+
+class EcoSpec(TypedDict):
+    """Ports and nets to add in one ECO."""
+
+    ports: list[PortSpec]
+    nets: list[NetSpec]
+
+
+class EcoResult(TypedDict):
+    """Per-item results of applying an ECO."""
+
+    ports: list[AddPortResult]
+    nets: list[AddNetResult]
+
+
+class ReloadResult(TypedDict):
+    """Result of reloading changed source files."""
+
+    changed: bool
+    files: list[str]
+    compile: Optional[str]
+    elaborate: Optional[str]
+
+
 class HealthCheckResult(TypedDict):
     """Health check result."""
 
@@ -84,9 +139,55 @@ class HealthCheckResult(TypedDict):
     backend_type: str
 
 
+class CacheInfo(TypedDict):
+    """Statistics of the client-side response cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    design_epoch: int
+
+
+class ServerStats(TypedDict):
+    """Resource usage of a server process and its descendants."""
+
+    pid: int
+    rss_bytes: int
+    peak_rss_bytes: int
+    cpu_seconds: float
+    cpu_percent: float
+    threads: int
+    processes: int
+    timestamp: float
+
+
+class LogDispatchStats(TypedDict):
+    """Counters of the log stream's record queue."""
+
+    received: int
+    delivered: int
+    dropped: int
+    callback_errors: int
+    queued: int
+    max_queued: int
+
+
+class LogStreamStats(LogDispatchStats):
+    """Counters of a log stream: its record queue, reconnects and gaps."""
+
+    reconnects: int
+    gaps: int
+    missed: int
+    duplicates: int
+    last_seq: Optional[int]
+
+
 class LogData(TypedDict):
     """Log data from server log streaming."""
 
     level: str
     message: str
     timestamp: str
+    seq: NotRequired[int]
@@ -0,0 +1,119 @@
+"""AsyncClient tests."""
+import asyncio
+from contextlib import aclosing
+
+import pytest
+import pytest_asyncio
+from rtllib import AsyncClient
+from rtllib.log_stream import LogStreamClient
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client connected to external server.
+
+    Requires: rtllib-server running on port 9000
+    Run: uv run --directory rtllib-server rtllib-server --port 9000
+    """
+    client = AsyncClient(host="127.0.0.1", port=9000)
+    await client._ensure_connection()
+    yield client
+    await client.close()
+
+
+class TestAsyncClientOperations:
+    """Test async client operations."""
+
+    @pytest.mark.asyncio
+    async def test_health_check(self, async_client):
+        """Test health check returns correct snake_case fields."""
+        health = await async_client.health_check()
+
+        assert isinstance(health, dict)
+        assert health['status'] == 'ok'
+        assert 'backend_type' in health
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_ports(self, async_client):
+        """Test many get_ports calls can run concurrently on one session."""
+        await async_client.read_verilog("/test.v")
+        await async_client.compile()
+        await async_client.elaborate()
+
+        modules = await async_client.get_modules()
+        names = [m['name'] for m in modules]
+
+        results = await asyncio.gather(*(async_client.get_ports(name) for name in names))
+
+        assert len(results) == len(names)
+        for module, ports in zip(modules, results):
+            assert isinstance(ports, list)
+            assert [p['name'] for p in ports] == [p['name'] for p in module['ports']]
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self):
+        """Test max_concurrency bounds the number of in-flight requests."""
+        client = AsyncClient(host="127.0.0.1", port=9000, max_concurrency=2)
+        try:
+            await client._ensure_connection()
+            in_flight = 0
+            peak = 0
+            execute = client._session.execute
+
+            async def tracking_execute(request):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await execute(request)
+                finally:
+                    in_flight -= 1
+
+            client._session.execute = tracking_execute
+            await asyncio.gather(*(client.health_check() for _ in range(10)))
+
+            assert peak == 2
+        finally:
+            await client.close()
+
+
+class TestAsyncClientContextManager:
+    """Test async client context manager."""
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self):
+        """Test client can be used as async context manager."""
+        async with AsyncClient(host="127.0.0.1", port=9000) as client:
+            health = await client.health_check()
+            assert health['status'] == 'ok'
+
+        assert client._session is None
+
+
+class TestAsyncClientLogs:
+    """Test iterating over log records."""
+
+    @pytest.mark.asyncio
+    async def test_logs(self, async_client, monkeypatch):
+        """Test logs() yields records and ends the subscription on break."""
+        closed = []
+
+        async def stream_once(self):
+            try:
+                for seq in range(1, 6):
+                    await asyncio.sleep(0)
+                    yield {"level": "INFO", "message": f"line {seq}", "timestamp": "", "seq": seq}
+            finally:
+                closed.append(True)
+
+        monkeypatch.setattr(LogStreamClient, "_stream_once", stream_once)
+        seqs = []
+        async with aclosing(async_client.logs()) as logs:
+            async for record in logs:
+                seqs.append(record["seq"])
+                if len(seqs) == 3:
+                    break
+
+        assert seqs == [1, 2, 3]
+        assert closed == [True]
@@ -0,0 +1,49 @@
+"""Response cache tests."""
+from rtllib.cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test the byte-bounded LRU response cache."""
+
+    def test_get_returns_copy(self):
+        """Test hits return a fresh copy of the stored response."""
+        cache = ResponseCache(max_bytes=1024)
+        cache.put("k", {"ports": [1, 2]})
+
+        value = cache.get("k")
+        value["ports"].append(3)
+
+        assert cache.get("k") == {"ports": [1, 2]}
+        assert cache.info()["hits"] == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test entries are evicted LRU-first to stay under max_bytes."""
+        cache = ResponseCache(max_bytes=30)
+        cache.put("a", "x" * 10)
+        cache.put("b", "y" * 10)
+        cache.get("a")
+        cache.put("c", "z" * 10)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+        assert cache.info()["size_bytes"] <= 30
+
+    def test_oversized_response_not_stored(self):
+        """Test responses larger than the cache are skipped."""
+        cache = ResponseCache(max_bytes=8)
+        cache.put("k", "x" * 100)
+
+        assert len(cache) == 0
+
+    def test_invalidate_starts_new_epoch(self):
+        """Test invalidate clears entries and drops stale puts."""
+        cache = ResponseCache(max_bytes=1024)
+        cache.put("k", 1)
+        epoch = cache.design_epoch
+
+        cache.invalidate()
+        cache.put("stale", 2, epoch)
+
+        assert len(cache) == 0
+        assert cache.design_epoch == epoch + 1
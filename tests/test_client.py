@@ -1,4 +1,9 @@
 """Client tests."""
+import contextlib
+import json
+import socket
+import threading
+
 import pytest
 from rtllib import Client
 from rtllib.types import (
@@ -112,6 +117,40 @@ class TestClientQueryOperations:
             assert isinstance(module['instances'], list)
             assert isinstance(module['nets'], list)
 
+    def test_get_modules_include(self):
+        """Test get_modules(include=...) only returns the requested lists."""
+        full = self.client.get_modules()
+        modules = self.client.get_modules(include={"instances"})
+
+        assert [m['name'] for m in modules] == [m['name'] for m in full]
+        for module, full_module in zip(modules, full):
+            assert module['instances'] == full_module['instances']
+            assert 'ports' not in module
+            assert 'nets' not in module
+
+    def test_get_modules_include_unknown_field(self):
+        """Test get_modules rejects unknown include fields."""
+        with pytest.raises(ValueError):
+            self.client.get_modules(include={"wires"})
+
+    def test_iter_modules(self):
+        """Test iter_modules yields the same modules as get_modules."""
+        modules = self.client.get_modules()
+        iterated = list(self.client.iter_modules(page_size=2))
+
+        assert [m['name'] for m in iterated] == [m['name'] for m in modules]
+
+    def test_iter_instances_and_nets(self):
+        """Test iter_instances and iter_nets match the list methods."""
+        modules = self.client.get_modules()
+
+        if len(modules) > 0:
+            module_name = modules[0]['name']
+            assert list(self.client.iter_instances(module_name, page_size=1)) == \
+                self.client.get_instances(module_name)
+            assert list(self.client.iter_nets(module_name, page_size=3)) == \
+                self.client.get_nets(module_name)
+
     def test_get_ports(self):
         """Test get_ports returns correct structure."""
         modules = self.client.get_modules()
@@ -236,6 +275,428 @@ class TestClientQueryOperations:
             assert isinstance(result['message'], str)
 
 
+class TestClientBatchOperations:
+    """Test batched multi-module queries."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, external_client):
+        """Setup for batch tests."""
+        self.client = external_client
+        self.client.read_verilog("/test.v")
+        self.client.compile()
+        self.client.elaborate()
+        self.modules = [m['name'] for m in self.client.get_modules()]
+
+    def test_get_ports_many(self):
+        """Test get_ports_many matches per-module get_ports."""
+        result = self.client.get_ports_many(self.modules)
+
+        assert list(result) == self.modules
+        for name in self.modules:
+            assert result[name] == self.client.get_ports(name)
+
+    def test_get_nets_and_instances_many(self):
+        """Test get_nets_many and get_instances_many match per-module calls."""
+        nets = self.client.get_nets_many(self.modules)
+        instances = self.client.get_instances_many(self.modules)
+
+        for name in self.modules:
+            assert nets[name] == self.client.get_nets(name)
+            assert instances[name] == self.client.get_instances(name)
+
+    def test_batch_context_splits_documents(self):
+        """Test batch() resolves mixed calls across size-capped documents."""
+        with self.client.batch(max_size=2) as batch:
+            ports = [batch.get_ports(name) for name in self.modules]
+            nets = [batch.get_nets(name) for name in self.modules]
+            assert not ports[0].done()
+
+        for name, port_result, net_result in zip(self.modules, ports, nets):
+            assert port_result.result() == self.client.get_ports(name)
+            assert net_result.result() == self.client.get_nets(name)
+
+    def test_batch_documents_shared_across_call_order(self):
+        """Test batches of the same calls in another order reuse one document."""
+        from rtllib.client import _DOCUMENT_CACHE
+
+        name = self.modules[0]
+        with self.client.batch() as batch:
+            first = [batch.get_nets(name), batch.get_ports(name), batch.get_nets(name)]
+        cached = len(_DOCUMENT_CACHE)
+        with self.client.batch() as batch:
+            second = [batch.get_ports(name), batch.get_nets(name), batch.get_nets(name)]
+
+        assert len(_DOCUMENT_CACHE) == cached
+        assert [r.result() for r in first] == [self.client.get_nets(name), self.client.get_ports(name), self.client.get_nets(name)]
+        assert [r.result() for r in second] == [self.client.get_ports(name)] + [self.client.get_nets(name)] * 2
+
+    def test_batch_reports_per_call_errors(self):
+        """Test an error for one module does not fail the others."""
+        with self.client.batch() as batch:
+            good = batch.get_ports(self.modules[0])
+            bad = batch.get_ports("no_such_module")
+
+        assert isinstance(good.result(), list)
+        with pytest.raises(Exception):
+            bad.result()
+
+
+class TestClientBulkModification:
+    """Test bulk design-modification mutations."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, external_client):
+        """Setup for bulk modification tests."""
+        self.client = external_client
+        self.client.read_verilog("/test.v")
+        self.client.compile()
+        self.client.elaborate()
+        self.module = self.client.get_modules()[0]['name']
+
+    def test_add_ports(self):
+        """Test add_ports returns one AddPortResult per port, in order."""
+        ports = [
+            {"module": self.module, "port_name": f"bulk_port_{i}", "direction": "input", "width": i + 1}
+            for i in range(5)
+        ]
+        results = self.client.add_ports(ports)
+
+        assert [r['port_name'] for r in results] == [p['port_name'] for p in ports]
+        for result in results:
+            assert result['success'] is True
+            assert result['module'] == self.module
+
+    def test_add_nets(self):
+        """Test add_nets defaults net_type and returns per-net results."""
+        nets = [{"module": self.module, "net_name": f"bulk_net_{i}", "width": 8} for i in range(3)]
+        results = self.client.add_nets(nets)
+
+        assert [r['net_name'] for r in results] == [n['net_name'] for n in nets]
+        assert all(r['success'] for r in results)
+
+    def test_add_ports_partial_failure(self):
+        """Test a failing item is reported without hiding the others."""
+        results = self.client.add_ports([
+            {"module": self.module, "port_name": "ok_port", "direction": "input", "width": 1},
+            {"module": "no_such_module", "port_name": "bad_port", "direction": "input", "width": 1},
+        ])
+
+        assert len(results) == 2
+        assert results[0]['port_name'] == "ok_port"
+        assert results[1]['port_name'] == "bad_port"
+        assert results[1]['success'] is False
+        assert isinstance(results[1]['message'], str)
+
+    def test_apply_eco(self, tmp_path):
+        """Test apply_eco loads a CSV spec and applies it."""
+        eco = tmp_path / "eco.csv"
+        eco.write_text(
+            "kind,module,name,direction,width,net_type\n"
+            f"port,{self.module},eco_port,output,4,\n"
+            f"net,{self.module},eco_net,,4,wire\n"
+        )
+        result = self.client.apply_eco(eco)
+
+        assert [r['port_name'] for r in result['ports']] == ["eco_port"]
+        assert [r['net_name'] for r in result['nets']] == ["eco_net"]
+
+
+class TestClientResponseCache:
+    """Test the opt-in client-side response cache."""
+
+    @pytest.fixture
+    def cached_client(self):
+        """Create a client with the response cache enabled."""
+        client = Client(host="127.0.0.1", port=9000, cache_max_bytes=1 << 20)
+        client.read_verilog("/test.v")
+        client.compile()
+        client.elaborate()
+        yield client
+        client.close()
+
+    def test_repeat_query_hits_cache(self, cached_client):
+        """Test a repeated query is answered from the cache."""
+        module_name = cached_client.get_modules()[0]['name']
+        first = cached_client.get_ports(module_name)
+        second = cached_client.get_ports(module_name)
+
+        assert first == second
+        assert first is not second
+        assert cached_client.cache_info()['hits'] >= 1
+
+    def test_mutation_invalidates_cache(self, cached_client):
+        """Test a design mutation clears the cache."""
+        module_name = cached_client.get_modules()[0]['name']
+        before = cached_client.get_ports(module_name)
+        epoch = cached_client.cache_info()['design_epoch']
+
+        cached_client.add_port(module_name, "cache_test_port", "input", 1)
+
+        assert cached_client.cache_info()['design_epoch'] > epoch
+        after = cached_client.get_ports(module_name)
+        assert len(after) == len(before) + 1
+
+    def test_explicit_invalidate(self, cached_client):
+        """Test invalidate() empties the cache."""
+        cached_client.get_modules()
+        assert cached_client.cache_info()['entries'] > 0
+
+        cached_client.invalidate()
+
+        assert cached_client.cache_info()['entries'] == 0
+
+    def test_cache_disabled_by_default(self, external_client):
+        """Test the cache is opt-in."""
+        assert external_client.cache_info() is None
+
+
+class TestClientConnection:
+    """Test the persistent client session."""
+
+    def test_session_reused_across_calls(self, external_client):
+        """Test all calls share one pooled HTTP session."""
+        http_client = external_client._gql_client.transport.client
+        assert http_client is not None
+
+        external_client.health_check()
+        external_client.health_check()
+
+        assert external_client._gql_client.transport.client is http_client
+
+    def test_close_releases_session(self):
+        """Test close() closes the pooled session."""
+        client = Client(host="127.0.0.1", port=9000)
+        client.health_check()
+        transport = client._gql_client.transport
+
+        client.close()
+
+        assert transport.client is None
+        assert client._session is None
+
+
+    def test_http2_prior_knowledge(self, monkeypatch):
+        """Test http2 talks h2c to a cleartext server."""
+        pytest.importorskip("h2")
+        import httpx
+        from rtllib.config import settings
+
+        monkeypatch.setitem(settings.server, "http2", True)
+        with _h2c_server() as port:
+            with httpx.Client(**Client._transport_options()) as http:
+                response = http.post(f"http://127.0.0.1:{port}/graphql", json={"query": "{ health_check { status } }"})
+
+        assert response.http_version == "HTTP/2"
+        assert response.json() == {"data": {"health_check": {"status": "ok"}}}
+
+
+@contextlib.contextmanager
+def _h2c_server():
+    """Serve one h2c connection answering every request with a health check."""
+    import h2.config
+    import h2.connection
+    import h2.events
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def serve():
+        sock, _ = listener.accept()
+        with sock:
+            conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+            conn.initiate_connection()
+            sock.sendall(conn.data_to_send())
+            while data := sock.recv(65535):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.StreamEnded):
+                        body = json.dumps({"data": {"health_check": {"status": "ok"}}}).encode()
+                        conn.send_headers(event.stream_id, [
+                            (":status", "200"),
+                            ("content-type", "application/json"),
+                            ("content-length", str(len(body))),
+                        ])
+                        conn.send_data(event.stream_id, body, end_stream=True)
+                sock.sendall(conn.data_to_send())
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        yield listener.getsockname()[1]
+    finally:
+        listener.close()
+
+
+class TestDocumentCache:
+    """Test the compiled GraphQL document registry."""
+
+    def test_documents_parsed_once(self, external_client):
+        """Test repeated calls reuse the same compiled document."""
+        from rtllib.client import _DOCUMENT_CACHE
+
+        external_client.health_check()
+        compiled = _DOCUMENT_CACHE["health_check"]
+        external_client.health_check()
+
+        assert _DOCUMENT_CACHE["health_check"] is compiled
+
+
+class TestClientJournal:
+    """Test the journal of design-changing calls."""
+
+    def test_records_successful_mutations(self, external_client):
+        """Test reads, compile and edits are journaled, queries are not."""
+        external_client.journal.clear()
+        external_client.read_verilog("/test.v")
+        external_client.compile()
+        external_client.get_modules()
+
+        operations = [op for op, _ in external_client.journal.entries()]
+        assert operations == ["read_verilog", "compile"]
+
+    def test_replay(self, external_client):
+        """Test the journal can be replayed onto the server."""
+        external_client.journal.clear()
+        external_client.read_verilog("/test.v")
+        external_client.read_verilog("/test.v")
+        external_client.compile()
+
+        external_client.replay()
+
+        assert len(external_client.journal) == 2
+
+    def test_empty_journal_replayed_on_restart(self, monkeypatch):
+        """Test an enabled but empty journal is still replayed, not treated as disabled."""
+        class Manager:
+            uds = None
+
+            def restart(self):
+                return "127.0.0.1", 9000
+
+            def is_running(self):
+                return True
+
+            def over_budget(self):
+                return False
+
+        client = Client(host="127.0.0.1", port=9000)
+        client._server_manager = Manager()
+        replays = []
+        monkeypatch.setattr(client, "replay", lambda: replays.append(len(client.journal)))
+        try:
+            client._replace_server("test")
+        finally:
+            client._server_manager = None
+            client.close()
+
+        assert replays == [0]
+
+    def test_design_over_budget_not_restarted_again(self):
+        """Test a design over the memory budget right after replay stops budget restarts."""
+        class Manager:
+            uds = None
+            max_rss = 100 * 2**20
+            restarts = 0
+
+            def restart(self):
+                self.restarts += 1
+                return "127.0.0.1", 9000
+
+            def is_running(self):
+                return True
+
+            def over_budget(self):
+                return True
+
+            def stats(self):
+                return {"rss_bytes": 200 * 2**20}
+
+        client = Client(host="127.0.0.1", port=9000)
+        try:
+            client.read_verilog("/test.v")
+            manager = client._server_manager = Manager()
+
+            client.health_check()
+            client.health_check()
+            assert manager.restarts == 1
+
+            # New work may have grown the server, so the budget applies again
+            client.compile()
+            client.health_check()
+            assert manager.restarts == 2
+        finally:
+            client._server_manager = None
+            client.close()
+
+    def test_resuming_log_stream_skips_budget_check(self, monkeypatch):
+        """Test resuming log streaming after a budget restart does not restart again."""
+        class Manager:
+            uds = None
+            max_rss = 100 * 2**20
+            restarts = 0
+
+            def restart(self):
+                self.restarts += 1
+                return "127.0.0.1", 9000
+
+            def is_running(self):
+                return True
+
+            def over_budget(self):
+                return True
+
+            def stats(self):
+                return {"rss_bytes": 200 * 2**20}
+
+        class Stream:
+            log_callback = batch_callback = min_level = include = exclude = None
+
+            def stop(self):
+                pass
+
+        client = Client(host="127.0.0.1", port=9000)
+        resumed = []
+
+        def start_log_streaming(*args):
+            client._ensure_connection()
+            resumed.append(args)
+
+        monkeypatch.setattr(client, "start_log_streaming", start_log_streaming)
+        try:
+            client.health_check()
+            manager = client._server_manager = Manager()
+            client._log_stream_client = Stream()
+
+            client.health_check()
+
+            assert manager.restarts == 1
+            assert len(resumed) == 1
+        finally:
+            client._server_manager = None
+            client._log_stream_client = None
+            client.close()
+
+    def test_disabled(self):
+        """Test the journal can be turned off."""
+        client = Client(host="127.0.0.1", port=9000, journal=False)
+        assert client.journal is None
+        with pytest.raises(RuntimeError):
+            client.replay()
+        client.close()
+
+
+class TestClientUnixSocket:
+    """Test connecting over a Unix domain socket."""
+
+    def test_uds_client_is_external(self):
+        """Test a socket path selects an external server over the socket."""
+        client = Client(uds="/tmp/rtllib-test.sock")
+
+        assert client._server_manager is None
+        assert client.uds == "/tmp/rtllib-test.sock"
+        assert client._base_url() == "http://localhost"
+
+
 class TestClientContextManager:
     """Test client context manager."""
 
@@ -247,3 +708,62 @@ class TestClientContextManager:
 
         # Client should be closed after exiting context
         assert client._gql_client is None
+
+
+class TestClientReload:
+    """Test reloading changed source files."""
+
+    def test_nothing_changed(self, external_client, tmp_path):
+        """Test an unchanged design returns the last results without a request."""
+        path = tmp_path / "a.v"
+        path.write_text("module a; endmodule\n")
+        external_client.read_verilog(str(path))
+        compiled = external_client.compile()
+        elaborated = external_client.elaborate()
+
+        external_client._session = None  # any request would fail
+        result = external_client.reload()
+
+        assert result == {"changed": False, "files": [], "compile": compiled, "elaborate": elaborated}
+
+    def test_changed_file(self, external_client, tmp_path):
+        """Test only the edited file is read again before recompiling."""
+        paths = [tmp_path / "a.v", tmp_path / "b.v"]
+        for path in paths:
+            path.write_text("module m; endmodule\n")
+            external_client.read_verilog(str(path))
+        external_client.compile()
+
+        paths[1].write_text("module m(input x); endmodule\n")
+        result = external_client.reload()
+
+        assert result["files"] == [str(paths[1])]
+        assert isinstance(result["compile"], str)
+        assert result["elaborate"] is None
+        assert external_client.reload()["changed"] is False
+
+    def test_changed_filelist(self, external_client, tmp_path):
+        """Test an edited filelist is read again."""
+        (tmp_path / "a.v").write_text("module a; endmodule\n")
+        filelist = tmp_path / "top.f"
+        filelist.write_text("a.v\n")
+        external_client.read_verilog_filelist(str(filelist))
+
+        filelist.write_text("a.v\nb.v\n")
+        result = external_client.reload()
+
+        assert result["files"] == [str(filelist)]
+        assert result["compile"] is None
+
+    def test_deleted_filelist(self, external_client, tmp_path):
+        """Test a deleted filelist is forgotten instead of failing the reload."""
+        (tmp_path / "a.v").write_text("module a; endmodule\n")
+        filelist = tmp_path / "top.f"
+        filelist.write_text("a.v\n")
+        external_client.read_verilog_filelist(str(filelist))
+
+        filelist.unlink()
+        result = external_client.reload()
+
+        assert result["changed"] is False
+        assert external_client._sources.changed_filelists() == ([], [])
@@ -0,0 +1,52 @@
+"""ECO spec loader tests."""
+import json
+
+import pytest
+from rtllib.eco import load_eco
+
+
+class TestLoadEco:
+    """Test loading ECO specs from CSV and JSON."""
+
+    def test_load_json(self, tmp_path):
+        """Test JSON specs load ports and nets with defaults."""
+        path = tmp_path / "eco.json"
+        path.write_text(json.dumps({
+            "ports": [{"module": "cpu", "port_name": "dbg_en", "direction": "input", "width": 1}],
+            "nets": [{"module": "cpu", "net_name": "dbg_bus", "width": "32"}],
+        }))
+
+        spec = load_eco(path)
+
+        assert spec["ports"] == [{"module": "cpu", "port_name": "dbg_en", "direction": "input", "width": 1}]
+        assert spec["nets"] == [{"module": "cpu", "net_name": "dbg_bus", "width": 32, "net_type": "wire"}]
+
+    def test_load_csv(self, tmp_path):
+        """Test CSV specs split rows into ports and nets."""
+        path = tmp_path / "eco.csv"
+        path.write_text(
+            "kind,module,name,direction,width,net_type\n"
+            "port,cpu,dbg_en,input,1,\n"
+            "net,cpu,dbg_bus,,32,reg\n"
+        )
+
+        spec = load_eco(path)
+
+        assert spec["ports"] == [{"module": "cpu", "port_name": "dbg_en", "direction": "input", "width": 1}]
+        assert spec["nets"] == [{"module": "cpu", "net_name": "dbg_bus", "width": 32, "net_type": "reg"}]
+
+    def test_invalid_entry_reports_location(self, tmp_path):
+        """Test invalid rows raise ValueError naming the line."""
+        path = tmp_path / "eco.csv"
+        path.write_text(
+            "kind,module,name,direction,width,net_type\n"
+            "port,cpu,dbg_en,input,wide,\n"
+        )
+
+        with pytest.raises(ValueError, match="eco.csv:2"):
+            load_eco(path)
+
+    def test_unsupported_format(self, tmp_path):
+        """Test unknown file extensions are rejected."""
+        with pytest.raises(ValueError, match="Unsupported ECO file format"):
+            load_eco(tmp_path / "eco.yaml")
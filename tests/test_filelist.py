@@ -0,0 +1,101 @@
+"""Filelist parser tests."""
+import pytest
+
+from rtllib.filelist import format_filelist, parse_filelist
+
+
+def test_files_and_options(tmp_path):
+    """Test files, include dirs, defines and libraries are collected."""
+    (tmp_path / "top.f").write_text(
+        "// top-level filelist\n"
+        "# another comment\n"
+        "+incdir+inc+inc2\n"
+        "+define+SYNTHESIS+WIDTH=32\n"
+        "+libext+.v+.sv\n"
+        "-v lib/cells.v\n"
+        "-y lib\n"
+        "/* block\n   comment */ a.sv\n"
+        "b.sv // trailing comment\n"
+    )
+
+    filelist = parse_filelist(tmp_path / "top.f")
+
+    assert filelist["files"] == [str(tmp_path / "a.sv"), str(tmp_path / "b.sv")]
+    assert filelist["incdirs"] == [str(tmp_path / "inc"), str(tmp_path / "inc2")]
+    assert filelist["defines"] == {"SYNTHESIS": "", "WIDTH": "32"}
+    assert filelist["libexts"] == [".v", ".sv"]
+    assert filelist["library_files"] == [str(tmp_path / "lib" / "cells.v")]
+    assert filelist["library_dirs"] == [str(tmp_path / "lib")]
+
+
+def test_nested_filelists(tmp_path):
+    """Test -F paths resolve relative to the filelist they appear in."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "block.f").write_text("block.sv\n../common.sv\n")
+    (tmp_path / "top.f").write_text("common.sv\n-F sub/block.f\ntop.sv\n")
+
+    filelist = parse_filelist(tmp_path / "top.f")
+
+    assert filelist["files"] == [
+        str(tmp_path / "common.sv"),
+        str(tmp_path / "sub" / "block.sv"),
+        str(tmp_path / "top.sv"),
+    ]
+
+
+def test_nested_f_relative_to_base_dir(tmp_path, monkeypatch):
+    """Test -f filelists and their paths resolve against the base directory."""
+    (tmp_path / "proj" / "ip").mkdir(parents=True)
+    (tmp_path / "proj" / "ip" / "ip.f").write_text("ip/core.sv\n-F ip/sub.f\n")
+    (tmp_path / "proj" / "ip" / "sub.f").write_text("sub.sv\n")
+    (tmp_path / "proj" / "top.f").write_text("-f ip/ip.f\n")
+    (tmp_path / "run").mkdir()
+
+    expected = [str(tmp_path / "proj" / "ip" / "core.sv"), str(tmp_path / "proj" / "ip" / "sub.sv")]
+    assert parse_filelist(tmp_path / "proj" / "top.f", base_dir=tmp_path / "proj")["files"] == expected
+
+    # Without base_dir, -f is relative to the working directory
+    monkeypatch.chdir(tmp_path / "proj")
+    assert parse_filelist("top.f")["files"] == expected
+    monkeypatch.chdir(tmp_path / "run")
+    with pytest.raises(OSError):
+        parse_filelist(tmp_path / "proj" / "top.f")
+
+
+def test_environment_variables(tmp_path, monkeypatch):
+    """Test $VAR references are expanded."""
+    monkeypatch.setenv("RTL_ROOT", str(tmp_path / "rtl"))
+    (tmp_path / "top.f").write_text("${RTL_ROOT}/a.sv\n")
+
+    assert parse_filelist(tmp_path / "top.f")["files"] == [str(tmp_path / "rtl" / "a.sv")]
+
+
+def test_include_cycle(tmp_path):
+    """Test filelists including each other are rejected."""
+    (tmp_path / "a.f").write_text("-F b.f\n")
+    (tmp_path / "b.f").write_text("-F a.f\n")
+
+    with pytest.raises(ValueError, match="cycle"):
+        parse_filelist(tmp_path / "a.f")
+
+
+def test_missing_argument(tmp_path):
+    """Test an option at the end of a filelist needs its argument."""
+    (tmp_path / "top.f").write_text("a.sv\n-v\n")
+
+    with pytest.raises(ValueError):
+        parse_filelist(tmp_path / "top.f")
+
+
+def test_format_round_trip(tmp_path):
+    """Test a formatted filelist parses back to the same options."""
+    (tmp_path / "top.f").write_text("+incdir+inc\n+define+A=1\n-y lib\na.sv\nb.sv\n")
+    filelist = parse_filelist(tmp_path / "top.f")
+
+    (tmp_path / "part.f").write_text(format_filelist(filelist, filelist["files"][1:]))
+    part = parse_filelist(tmp_path / "part.f")
+
+    assert part["files"] == [str(tmp_path / "b.sv")]
+    assert part["incdirs"] == filelist["incdirs"]
+    assert part["defines"] == filelist["defines"]
+    assert part["library_dirs"] == filelist["library_dirs"]
@@ -0,0 +1,67 @@
+"""Mutation journal tests."""
+import pytest
+
+from rtllib.journal import MutationJournal
+
+
+class TestMutationJournal:
+    """Test recording and compaction of design-changing calls."""
+
+    def test_records_in_order(self):
+        """Test calls are kept in call order."""
+        journal = MutationJournal()
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.record("compile", {})
+        journal.record("add_port", {"module": "top", "port_name": "p", "direction": "input", "width": 1})
+
+        assert [op for op, _ in journal.entries()] == ["read_verilog", "compile", "add_port"]
+
+    def test_drops_repeated_reads_and_edits(self):
+        """Test the same read or edit is only recorded once."""
+        journal = MutationJournal()
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.record("read_verilog", {"path": "/b.v"})
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.record("add_net", {"module": "top", "net_name": "n", "width": 1, "net_type": "wire"})
+        journal.record("add_net", {"module": "top", "net_name": "n", "width": 1, "net_type": "wire"})
+
+        assert len(journal) == 3
+
+    def test_collapses_repeated_compile(self):
+        """Test back-to-back compiles or elaborates are recorded once."""
+        journal = MutationJournal()
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.record("compile", {})
+        journal.record("compile", {})
+        journal.record("elaborate", {})
+        journal.record("elaborate", {})
+        journal.record("compile", {})
+
+        assert [op for op, _ in journal.entries()] == ["read_verilog", "compile", "elaborate", "compile"]
+
+    def test_groups_consecutive_calls(self):
+        """Test runs of the same operation are grouped for batched replay."""
+        journal = MutationJournal()
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.record("read_verilog", {"path": "/b.v"})
+        journal.record("compile", {})
+        for name in ("p0", "p1"):
+            journal.record("add_port", {"module": "top", "port_name": name, "direction": "input", "width": 1})
+
+        groups = list(journal.groups())
+
+        assert [(op, len(calls)) for op, calls in groups] == [("read_verilog", 2), ("compile", 1), ("add_port", 2)]
+
+    def test_rejects_queries(self):
+        """Test only design-changing operations can be recorded."""
+        with pytest.raises(ValueError):
+            MutationJournal().record("get_modules", {})
+
+    def test_clear(self):
+        """Test clear forgets recorded calls, including for deduplication."""
+        journal = MutationJournal()
+        journal.record("read_verilog", {"path": "/a.v"})
+        journal.clear()
+        journal.record("read_verilog", {"path": "/a.v"})
+
+        assert len(journal) == 1
@@ -0,0 +1,129 @@
+"""Log dispatch queue tests."""
+import asyncio
+import threading
+
+import pytest
+
+from rtllib.log_dispatch import LogDispatcher
+
+
+def records(n):
+    """Make n numbered log records."""
+    return [{"level": "INFO", "message": str(i), "timestamp": ""} for i in range(n)]
+
+
+def test_batches_in_order():
+    """Test records reach the callback in order, in bounded batches."""
+    batches = []
+    dispatcher = LogDispatcher(batches.append, max_size=100, batch_size=4)
+    dispatcher.start()
+    for record in records(10):
+        dispatcher.put(record)
+    dispatcher.stop()
+
+    assert all(len(batch) <= 4 for batch in batches)
+    assert [r["message"] for batch in batches for r in batch] == [str(i) for i in range(10)]
+    stats = dispatcher.stats()
+    assert (stats["received"], stats["delivered"], stats["dropped"], stats["queued"]) == (10, 10, 0, 0)
+
+
+def test_drop_oldest():
+    """Test a full queue drops its oldest records."""
+    delivered = []
+    dispatcher = LogDispatcher(delivered.extend, max_size=3, batch_size=10, overflow="drop_oldest")
+    for record in records(5):
+        dispatcher.put(record)
+    dispatcher.start()
+    dispatcher.stop()
+
+    assert [r["message"] for r in delivered] == ["2", "3", "4"]
+    assert dispatcher.stats()["dropped"] == 2
+
+
+def test_sample():
+    """Test a full queue keeps one in sample_every records."""
+    delivered = []
+    dispatcher = LogDispatcher(delivered.extend, max_size=2, batch_size=10, overflow="sample", sample_every=3)
+    for record in records(8):
+        dispatcher.put(record)
+    dispatcher.start()
+    dispatcher.stop()
+
+    # 2 fill the queue; of the 6 overflowing records, the 3rd and 6th are kept
+    assert [r["message"] for r in delivered] == ["4", "7"]
+    assert dispatcher.stats()["dropped"] == 6
+
+
+def test_block_waits_for_room():
+    """Test a full queue blocks the producer until the callback catches up."""
+    release = threading.Event()
+    delivered = []
+
+    def slow(batch):
+        release.wait()
+        delivered.extend(batch)
+
+    dispatcher = LogDispatcher(slow, max_size=1, batch_size=1, overflow="block")
+    dispatcher.start()
+    producer = threading.Thread(target=lambda: [dispatcher.put(r) for r in records(3)])
+    producer.start()
+    producer.join(timeout=0.2)
+    assert producer.is_alive()
+
+    release.set()
+    producer.join(timeout=5)
+    dispatcher.stop()
+    assert len(delivered) == 3
+    assert dispatcher.stats()["dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_block_keeps_event_loop_running():
+    """Test waiting for room from a coroutine does not stall the event loop."""
+    release = threading.Event()
+    delivered = []
+
+    def slow(batch):
+        release.wait()
+        delivered.extend(batch)
+
+    dispatcher = LogDispatcher(slow, max_size=1, batch_size=1, overflow="block")
+    dispatcher.start()
+
+    async def produce():
+        for record in records(3):
+            await dispatcher.put_async(record)
+
+    producer = asyncio.create_task(produce())
+    ticks = 0
+    for _ in range(10):
+        await asyncio.sleep(0.01)
+        ticks += 1
+    assert not producer.done()
+    assert ticks == 10
+
+    release.set()
+    await asyncio.wait_for(producer, timeout=5)
+    dispatcher.stop()
+    assert len(delivered) == 3
+    assert dispatcher.stats()["dropped"] == 0
+
+
+def test_callback_errors_counted():
+    """Test a failing callback does not stop dispatching."""
+    def fail(batch):
+        raise RuntimeError("boom")
+
+    dispatcher = LogDispatcher(fail, max_size=10, batch_size=1)
+    dispatcher.start()
+    for record in records(2):
+        dispatcher.put(record)
+    dispatcher.stop()
+
+    assert dispatcher.stats()["callback_errors"] == 2
+
+
+def test_unknown_policy():
+    """Test an unknown overflow policy is rejected."""
+    with pytest.raises(ValueError):
+        LogDispatcher(print, max_size=1, batch_size=1, overflow="spill")
@@ -0,0 +1,111 @@
+"""FileLogSink tests."""
+import gzip
+import json
+import time
+
+import pytest
+
+from rtllib import FileLogSink
+
+
+def records(n, start=0):
+    """Make n numbered log records."""
+    return [{"level": "INFO", "message": f"line {i}", "timestamp": "", "seq": i} for i in range(start, start + n)]
+
+
+def read_ndjson(path):
+    """Read the records of a (possibly gzipped) NDJSON file."""
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_flush_writes_ndjson(tmp_path):
+    """Test flushed records are on disk as one JSON object per line."""
+    path = tmp_path / "run.ndjson"
+    with FileLogSink(path, flush_interval=60, chunk_records=1000) as sink:
+        sink(records(3))
+        sink.flush()
+
+        assert read_ndjson(path) == records(3)
+
+
+def test_close_writes_everything(tmp_path):
+    """Test closing writes the buffered records and rejects new ones."""
+    path = tmp_path / "run.ndjson"
+    sink = FileLogSink(path, flush_interval=60)
+    sink(records(5))
+    sink.close()
+
+    assert read_ndjson(path) == records(5)
+    with pytest.raises(RuntimeError):
+        sink(records(1))
+
+
+def test_rotates_by_size_and_compresses(tmp_path):
+    """Test full files are rotated into gzipped segments."""
+    path = tmp_path / "run.ndjson"
+    with FileLogSink(path, max_bytes=200, compression="gzip", chunk_records=1, flush_interval=60) as sink:
+        for i in range(20):
+            sink(records(1, start=i))
+            sink.flush()
+
+    segments = sorted(tmp_path.glob("run.*.ndjson.gz"))
+    assert len(segments) == sink.rotations > 1
+    # Rotated names share a timestamp, so sort by the records they hold
+    written = sorted((r for segment in segments for r in read_ndjson(segment)), key=lambda r: r["seq"])
+    assert written + read_ndjson(path) == records(20)
+
+
+def test_rotates_by_age(tmp_path):
+    """Test an old file is rotated even without new records."""
+    path = tmp_path / "run.ndjson"
+    with FileLogSink(path, max_age=0.05, compression="none", flush_interval=0.01) as sink:
+        sink(records(2))
+        sink.flush()
+        deadline = time.monotonic() + 5
+        while not sink.rotations and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    assert sink.rotations == 1
+    [segment] = tmp_path.glob("run.*.ndjson")
+    assert read_ndjson(segment) == records(2)
+
+
+def test_unknown_compression(tmp_path):
+    """Test an unknown compression is rejected."""
+    with pytest.raises(ValueError):
+        FileLogSink(tmp_path / "run.ndjson", compression="lz4")
+
+
+def test_failed_rotation_keeps_writing(tmp_path, monkeypatch):
+    """Test the writer survives a failed rename and flush still returns."""
+    path = tmp_path / "run.ndjson"
+
+    def replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("rtllib.log_sink.os.replace", replace)
+    with FileLogSink(path, max_bytes=50, chunk_records=1, flush_interval=60, flush_timeout=5) as sink:
+        sink(records(2))
+        sink.flush()
+        sink(records(2, start=2))
+        sink.flush()
+
+    assert sink.rotations == 0
+    assert read_ndjson(path) == records(4)
+
+
+def test_write_error_drops_records(tmp_path, monkeypatch):
+    """Test records failing to write are counted and later ones still written."""
+    path = tmp_path / "run.ndjson"
+    with FileLogSink(path, flush_interval=60) as sink:
+        monkeypatch.setattr(sink, "_write", lambda batch: 1 / 0)
+        sink(records(2))
+        sink.flush()
+        monkeypatch.undo()
+        sink(records(1, start=2))
+        sink.flush()
+
+    assert sink.records_dropped == 2
+    assert read_ndjson(path) == records(1, start=2)
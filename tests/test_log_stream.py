@@ -0,0 +1,216 @@
+"""LogStreamClient tests."""
+import asyncio
+import threading
+import time
+
+import pytest
+from graphql import parse
+
+from rtllib.log_stream import LogIterator, LogStreamClient
+
+
+def record(level, message):
+    """Make a log record."""
+    return {"level": level, "message": message, "timestamp": ""}
+
+
+def test_subscription_arguments():
+    """Test only the filters in use become subscription arguments."""
+    stream = LogStreamClient("127.0.0.1", 9000, min_level="warning", exclude=["^progress"])
+    request = stream._subscription()
+
+    assert request.variable_values == {"min_level": "WARNING", "exclude": ["^progress"]}
+    parse(request.document.loc.source.body)
+    assert "include" not in request.document.loc.source.body
+
+
+def test_plain_subscription_without_filters():
+    """Test a stream without filters uses the plain subscription."""
+    request = LogStreamClient("127.0.0.1", 9000)._subscription()
+
+    assert request.variable_values is None
+    assert "(" not in request.document.loc.source.body
+
+
+def test_client_side_fallback():
+    """Test the subscription drops its arguments once the server rejects them."""
+    stream = LogStreamClient("127.0.0.1", 9000, min_level="INFO")
+    stream._server_filtering = False
+
+    assert stream._subscription().variable_values is None
+
+
+def test_min_level():
+    """Test records below min_level are dropped, unknown levels kept."""
+    stream = LogStreamClient("127.0.0.1", 9000, min_level="WARNING")
+
+    assert not stream._accepts(record("INFO", "x"))
+    assert stream._accepts(record("WARNING", "x"))
+    assert stream._accepts(record("ERROR", "x"))
+    assert stream._accepts(record("NOTICE", "x"))
+
+
+def test_include_exclude():
+    """Test include and exclude patterns match the message."""
+    stream = LogStreamClient("127.0.0.1", 9000, include=["^elab", "^compile"], exclude=["progress"])
+
+    assert stream._accepts(record("INFO", "elaborating top"))
+    assert not stream._accepts(record("INFO", "parsing a.v"))
+    assert not stream._accepts(record("INFO", "compile progress 50%"))
+
+
+def test_unknown_level():
+    """Test an unknown min_level is rejected."""
+    with pytest.raises(ValueError):
+        LogStreamClient("127.0.0.1", 9000, min_level="LOUD")
+
+
+def test_resume_after_last_seq():
+    """Test a resubscription resumes after the last record seen."""
+    stream = LogStreamClient("127.0.0.1", 9000)
+    stream._track_seq(7)
+    request = stream._subscription()
+
+    assert request.variable_values == {"after_seq": 7}
+    assert "seq" in request.document.loc.source.body
+
+
+def test_duplicates_and_gaps():
+    """Test repeated ids are dropped and skipped ids counted."""
+    stream = LogStreamClient("127.0.0.1", 9000)
+
+    assert [stream._track_seq(seq) for seq in (1, 2, 2, 5, 3, 6)] == [True, True, False, True, False, True]
+    stats = stream.stats()
+    assert (stats["duplicates"], stats["gaps"], stats["missed"], stats["last_seq"]) == (2, 1, 2, 6)
+
+
+def test_reconnects_with_backoff():
+    """Test a dropped connection is retried with growing delays until stopped."""
+    stream = LogStreamClient("127.0.0.1", 9000, batch_callback=lambda batch: None)
+    stream._reconnect_initial = 0.01
+    stream._reconnect_max = 0.04
+    attempts = []
+
+    async def drop():
+        attempts.append(time.monotonic())
+        raise OSError("connection reset")
+        yield
+
+    stream._stream_once = drop
+    stream.start()
+    deadline = time.monotonic() + 5
+    while len(attempts) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stream.stop()
+
+    assert stream.stats()["reconnects"] >= 4
+    delays = [b - a for a, b in zip(attempts, attempts[1:])]
+    assert delays[0] < delays[2]
+    assert not stream._thread
+
+
+@pytest.fixture
+def fake_connection(monkeypatch):
+    """Replace the websocket connection with one yielding numbered records."""
+    closed = []
+
+    async def stream_once(self, count=5):
+        try:
+            for seq in range(1, count + 1):
+                await asyncio.sleep(0)
+                yield {"level": "INFO", "message": f"line {seq}", "timestamp": "", "seq": seq}
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(LogStreamClient, "_stream_once", stream_once)
+    return closed
+
+
+def test_sync_iteration(fake_connection):
+    """Test a for loop gets every record and ends with the stream."""
+    records = list(LogIterator(host="127.0.0.1", port=9000, reconnect=False))
+
+    assert [r["seq"] for r in records] == [1, 2, 3, 4, 5]
+    assert fake_connection == [True]
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_break(fake_connection):
+    """Test leaving an async for loop closes the connection."""
+    seqs = []
+    async with LogIterator(host="127.0.0.1", port=9000, reconnect=False) as logs:
+        async for record in logs:
+            seqs.append(record["seq"])
+            if len(seqs) == 2:
+                break
+
+    assert seqs == [1, 2]
+    assert fake_connection == [True]
+
+
+def test_stop_flushes_callbacks(fake_connection):
+    """Test stopping calls the callback's flush, and close on shutdown."""
+
+    class Sink:
+        def __init__(self):
+            self.records, self.calls = [], []
+
+        def __call__(self, batch):
+            self.records.extend(batch)
+
+        def flush(self):
+            self.calls.append("flush")
+
+        def close(self):
+            self.calls.append("close")
+
+    sink = Sink()
+    stream = LogStreamClient(host="127.0.0.1", port=9000, batch_callback=sink, reconnect=False)
+    stream.start()
+    stream.stop(close_callbacks=True)
+
+    assert sink.calls == ["flush", "close"]
+
+
+def test_stop_leaves_no_pending_tasks(fake_connection):
+    """Test stopping the thread awaits the loop's tasks before closing it."""
+    leftover = []
+
+    async def closing_task():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            leftover.append("cancelled")
+            raise
+
+    async def stream_once(self):
+        asyncio.get_running_loop().create_task(closing_task())
+        while True:
+            await asyncio.sleep(0.01)
+            yield {"level": "INFO", "message": "line", "timestamp": ""}
+
+    stream = LogStreamClient(host="127.0.0.1", port=9000, batch_callback=lambda batch: None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(LogStreamClient, "_stream_once", stream_once)
+        stream.start()
+        time.sleep(0.1)
+        stream.stop()
+
+    assert leftover == ["cancelled"]
+    assert stream._loop is None
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_connects_off_loop(fake_connection):
+    """Test async for runs the blocking connect on a worker thread."""
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def connect():
+        threads.append(threading.get_ident())
+        return {"host": "127.0.0.1", "port": 9000}
+
+    seqs = [record["seq"] async for record in LogIterator(connect=connect, reconnect=False)]
+
+    assert seqs == [1, 2, 3, 4, 5]
+    assert threads and threads[0] != loop_thread
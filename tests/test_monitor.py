@@ -0,0 +1,52 @@
+"""Resource monitor tests."""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from rtllib.monitor import ResourceSampler, read_process_stats
+
+pytestmark = pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs Linux /proc")
+
+
+class TestResourceMonitor:
+    """Test /proc sampling of server processes."""
+
+    def test_reads_own_process(self):
+        """Test RSS, peak RSS, CPU and threads are read."""
+        stats = read_process_stats(os.getpid())
+
+        assert stats["pid"] == os.getpid()
+        assert stats["rss_bytes"] > 0
+        assert stats["peak_rss_bytes"] >= stats["rss_bytes"]
+        assert stats["cpu_seconds"] > 0
+        assert stats["threads"] >= 1
+
+    def test_includes_child_processes(self):
+        """Test a process tree (e.g. uv run and the server) is summed."""
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            stats = read_process_stats(os.getpid())
+            assert stats["processes"] >= 2
+            assert stats["rss_bytes"] > read_process_stats(child.pid)["rss_bytes"]
+        finally:
+            child.kill()
+            child.wait()
+
+    def test_missing_process(self):
+        """Test a vanished process yields None."""
+        child = subprocess.Popen([sys.executable, "-c", "pass"])
+        child.wait()
+
+        assert read_process_stats(child.pid) is None
+
+    def test_sampler_cpu_percent(self):
+        """Test CPU percent is computed between two samples."""
+        sampler = ResourceSampler(os.getpid(), interval=0)
+        sampler.sample()
+        sum(i * i for i in range(300000))
+        stats = sampler.sample()
+
+        assert stats["cpu_percent"] > 0
+        assert sampler.latest() == stats
@@ -0,0 +1,70 @@
+"""Server output buffer tests."""
+import os
+
+from rtllib.output_buffer import OutputBuffer
+
+
+class TestOutputBuffer:
+    """Test the bounded server output ring buffer."""
+
+    def test_keeps_last_lines(self):
+        """Test only the most recent max_lines lines are kept."""
+        buffer = OutputBuffer(max_lines=3, max_bytes=1024)
+        for i in range(5):
+            buffer.append("stdout", f"line {i}\n")
+
+        assert buffer.tail() == ["line 2", "line 3", "line 4"]
+        assert buffer.dropped == 2
+
+    def test_bounded_in_bytes(self):
+        """Test old lines are dropped to stay under max_bytes."""
+        buffer = OutputBuffer(max_lines=100, max_bytes=20)
+        for i in range(10):
+            buffer.append("stdout", f"{i:09d}\n")
+
+        assert len(buffer) == 2
+        assert buffer.tail(1) == ["000000009"]
+
+    def test_tail_by_stream(self):
+        """Test tail can select one stream, keeping the interleaved order."""
+        buffer = OutputBuffer(max_lines=10, max_bytes=1024)
+        buffer.append("stdout", "a\n")
+        buffer.append("stderr", "b\n")
+        buffer.append("stdout", "c\n")
+
+        assert buffer.tail() == ["a", "b", "c"]
+        assert buffer.tail(stream="stdout") == ["a", "c"]
+        assert buffer.tail(1, stream="stderr") == ["b"]
+        assert buffer.tail(0) == []
+
+    def test_spill_to_file(self):
+        """Test evicted lines go to the spill file, removed on close."""
+        buffer = OutputBuffer(max_lines=2, max_bytes=1024, spill=True)
+        for i in range(4):
+            buffer.append("stderr", f"line {i}\n")
+
+        path = buffer.spill_path
+        buffer.close(remove=False)
+        with open(path) as f:
+            assert f.read() == "[stderr] line 0\n[stderr] line 1\n"
+        assert buffer.tail() == ["line 2", "line 3"]
+        os.unlink(path)
+
+    def test_close_removes_spill_file(self):
+        """Test close deletes the spill file by default."""
+        buffer = OutputBuffer(max_lines=1, max_bytes=1024, spill=True)
+        buffer.append("stdout", "a\n")
+        buffer.append("stdout", "b\n")
+        path = buffer.spill_path
+
+        buffer.close()
+
+        assert not os.path.exists(path)
+        assert buffer.spill_path is None
+
+    def test_no_spill_file_until_needed(self):
+        """Test the spill file is only created once the buffer overflows."""
+        buffer = OutputBuffer(max_lines=10, max_bytes=1024, spill=True)
+        buffer.append("stdout", "hello\n")
+
+        assert buffer.spill_path is None
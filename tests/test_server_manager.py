@@ -0,0 +1,324 @@
+"""ServerManager tests."""
+import io
+import os
+import subprocess
+import sys
+import threading
+
+import httpx
+import pytest
+
+from rtllib import Client, ServerManager
+from rtllib.output_buffer import OutputBuffer
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    """Keep discovery and lock files in a temporary runtime directory."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def dummy_server():
+    """A process standing in for a running shared server."""
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    yield process
+    process.kill()
+    process.wait()
+
+
+def attached(server_pid):
+    """Create a manager marked as attached to a shared server."""
+    manager = ServerManager(server_mode="binary", binary_path="rtllib-server", shared=True)
+    manager._shared_pid = server_pid
+    manager._started = True
+    return manager
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shared servers need fcntl")
+class TestSharedServer:
+    """Test shared server discovery and reference counting."""
+
+    def test_shared_path_is_stable(self, runtime_dir):
+        """Test the discovery file does not move when start() assigns a port."""
+        manager = ServerManager(server_mode="binary", shared=True)
+        before = manager._shared_path(".json")
+        manager.port = 12345
+
+        assert manager._shared_path(".json") == before
+        assert before.startswith(str(runtime_dir))
+
+    def test_detach_keeps_server_for_other_clients(self, runtime_dir, dummy_server):
+        """Test detaching leaves the server running while clients remain."""
+        first = attached(dummy_server.pid)
+        second = attached(dummy_server.pid)
+        first._write_discovery({
+            "host": "127.0.0.1",
+            "port": 9999,
+            "uds": None,
+            "pid": dummy_server.pid,
+            "clients": [first._shared_token, second._shared_token],
+        })
+
+        first.stop()
+
+        assert not first.is_running()
+        assert dummy_server.poll() is None
+        assert first._read_discovery()["clients"] == [second._shared_token]
+
+    def test_last_detach_stops_server(self, runtime_dir, dummy_server):
+        """Test the last client to detach stops the server and removes discovery."""
+        manager = attached(dummy_server.pid)
+        manager._write_discovery({
+            "host": "127.0.0.1",
+            "port": 9999,
+            "uds": None,
+            "pid": dummy_server.pid,
+            # A client that crashed without detaching
+            "clients": [manager._shared_token, "999999999:deadbeef"],
+        })
+
+        manager.stop()
+
+        assert dummy_server.wait(timeout=5) is not None
+        assert manager._read_discovery() is None
+
+
+class TestPythonServerResolution:
+    """Test caching of the python-mode server interpreter resolution."""
+
+    @pytest.fixture
+    def server_dir(self, tmp_path, monkeypatch):
+        """A server project directory and an empty resolution cache."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        server_dir = tmp_path / "rtllib-server"
+        server_dir.mkdir()
+        (server_dir / "uv.lock").write_text("version = 1\n")
+        return server_dir
+
+    def fake_uv(self, monkeypatch):
+        """Make `uv run` resolve to this interpreter, counting the calls."""
+        calls = []
+
+        def run(cmd, **kwargs):
+            calls.append(cmd)
+            stdout = '{"python": "%s", "entry_point": "rtllib_server.main:main"}\n' % sys.executable
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", run)
+        return calls
+
+    def test_resolves_once(self, server_dir, monkeypatch):
+        """Test uv is only consulted on the first launch."""
+        calls = self.fake_uv(monkeypatch)
+        manager = ServerManager(server_mode="python")
+
+        first = manager._python_server_command(server_dir)
+        second = manager._python_server_command(server_dir)
+
+        assert len(calls) == 1
+        assert first == second
+        assert first[0] == sys.executable
+        assert "from rtllib_server.main import main" in first[2]
+
+    def test_lockfile_change_resolves_again(self, server_dir, monkeypatch):
+        """Test a changed lockfile invalidates the cached resolution."""
+        calls = self.fake_uv(monkeypatch)
+        manager = ServerManager(server_mode="python")
+
+        manager._python_server_command(server_dir)
+        (server_dir / "uv.lock").write_text("version = 2\n")
+        manager._python_server_command(server_dir)
+
+        assert len(calls) == 2
+
+    def test_falls_back_to_uv_run(self, server_dir, monkeypatch):
+        """Test a failed resolution launches through uv run."""
+        def run(cmd, **kwargs):
+            raise FileNotFoundError("uv")
+
+        monkeypatch.setattr(subprocess, "run", run)
+        cmd = ServerManager(server_mode="python")._python_server_command(server_dir)
+
+        assert cmd[:2] == ["uv", "run"]
+
+
+class TestBackgroundStart:
+    """Test starting the server on a background thread."""
+
+    def test_start_async_resolves(self, monkeypatch):
+        """Test the future resolves to the start() result."""
+        started = threading.Event()
+
+        def start_process(self):
+            started.wait(5)
+            self._started = True
+            return "127.0.0.1", 12345
+
+        monkeypatch.setattr(ServerManager, "_start_process", start_process)
+        manager = ServerManager(server_mode="binary", shared=False)
+
+        future = manager.start_async()
+        assert manager.start_async() is future
+        assert not future.done()
+
+        started.set()
+        assert future.result(timeout=5) == ("127.0.0.1", 12345)
+
+    def test_start_async_failure(self, monkeypatch):
+        """Test a failed start surfaces through the future."""
+        def start_process(self):
+            raise RuntimeError("Failed to start server: boom")
+
+        monkeypatch.setattr(ServerManager, "_start_process", start_process)
+        future = ServerManager(server_mode="binary", shared=False).start_async()
+
+        with pytest.raises(RuntimeError, match="boom"):
+            future.result(timeout=5)
+
+    def test_client_rejects_unknown_start_mode(self):
+        """Test Client validates the start mode."""
+        with pytest.raises(ValueError):
+            Client(auto_start=False, start="eager")
+
+
+class TestMemoryBudget:
+    """Test the max_rss recycling policy."""
+
+    def test_over_budget(self, monkeypatch):
+        """Test the budget compares against the sampled RSS."""
+        manager = ServerManager(server_mode="binary", shared=False, max_rss=100 * 2**20)
+        monkeypatch.setattr(manager, "stats", lambda: {"rss_bytes": 200 * 2**20})
+        assert manager.over_budget()
+
+        monkeypatch.setattr(manager, "stats", lambda: {"rss_bytes": 50 * 2**20})
+        assert not manager.over_budget()
+
+    def test_no_budget(self, monkeypatch):
+        """Test max_rss=0 disables the policy."""
+        manager = ServerManager(server_mode="binary", shared=False, max_rss=0)
+        monkeypatch.setattr(manager, "stats", lambda: {"rss_bytes": 2**40})
+
+        assert not manager.over_budget()
+
+    def test_stats_when_stopped(self):
+        """Test stats are unavailable without a running server."""
+        assert ServerManager(server_mode="binary", shared=False).stats() is None
+
+
+class TestFailedStartOutput:
+    """Test the server output of a failed start stays available."""
+
+    def test_spill_file_kept(self, tmp_path, monkeypatch):
+        """Test the spill file survives a server that exits during startup."""
+        from rtllib.config import settings
+
+        server = tmp_path / "server"
+        server.write_text(
+            f"#!{sys.executable}\n"
+            "import sys\n"
+            "for i in range(20):\n"
+            "    print(f'line {i}', file=sys.stderr)\n"
+            "sys.exit(1)\n"
+        )
+        server.chmod(0o755)
+        monkeypatch.setitem(settings.server_output, "spill", True)
+        monkeypatch.setitem(settings.server_output, "max_lines", 5)
+
+        manager = ServerManager(server_mode="binary", binary_path=str(server), shared=False)
+        with pytest.raises(RuntimeError, match="full output in"):
+            manager.start()
+
+        assert manager.spill_path is not None
+        with open(manager.spill_path) as f:
+            assert "line 0" in f.read()
+        os.unlink(manager.spill_path)
+
+
+class TestReadiness:
+    """Test waiting for a started server to become ready."""
+
+    class Clock:
+        """Fake time.time() advanced by the waits between health checks."""
+
+        def __init__(self):
+            self.now = 1000.0
+            self.delays = []
+
+        def time(self):
+            return self.now
+
+        def wait(self, delay):
+            self.delays.append(delay)
+            self.now += delay
+            return False
+
+    class DownServer:
+        """HTTP client whose health checks never connect."""
+
+        def get(self, url):
+            raise httpx.ConnectError("connection refused")
+
+    def test_ready_line_sets_event(self):
+        """Test a ready line in the output is detected and buffered."""
+        manager = ServerManager(server_mode="binary", shared=False)
+        manager._output = OutputBuffer(max_lines=10, max_bytes=1024)
+
+        manager._pump_output(io.StringIO("loading design\n"), "stderr")
+        assert not manager._ready_event.is_set()
+
+        manager._pump_output(io.StringIO("INFO: Uvicorn running on http://127.0.0.1:9000\n"), "stderr")
+        assert manager._ready_event.is_set()
+        assert manager.last_output(2) == ["loading design", "INFO: Uvicorn running on http://127.0.0.1:9000"]
+
+    def test_backoff_doubles_up_to_cap(self, monkeypatch):
+        """Test health polls back off exponentially, capped at poll_max."""
+        from rtllib.config import settings
+
+        clock = self.Clock()
+        monkeypatch.setattr("rtllib.server_manager.time.time", clock.time)
+        monkeypatch.setitem(settings.startup, "poll_initial", 0.01)
+        monkeypatch.setitem(settings.startup, "poll_max", 0.08)
+        manager = ServerManager(server_mode="binary", shared=False)
+        monkeypatch.setattr(manager._ready_event, "wait", clock.wait)
+
+        assert not manager._poll_health(self.DownServer(), "http://x/health", clock.now, timeout=1.0)
+
+        assert clock.delays[:6] == [0.01, 0.02, 0.04, 0.08, 0.08, 0.08]
+        assert clock.now - 1000.0 >= 1.0
+
+    def test_ready_line_resets_backoff(self, monkeypatch):
+        """Test a ready line cuts the wait short and restarts the backoff."""
+        from rtllib.config import settings
+
+        clock = self.Clock()
+        monkeypatch.setattr("rtllib.server_manager.time.time", clock.time)
+        monkeypatch.setitem(settings.startup, "poll_initial", 0.01)
+        monkeypatch.setitem(settings.startup, "poll_max", 0.08)
+        manager = ServerManager(server_mode="binary", shared=False)
+
+        def wait(delay):
+            clock.wait(delay)
+            return len(clock.delays) == 3
+
+        monkeypatch.setattr(manager._ready_event, "wait", wait)
+        manager._poll_health(self.DownServer(), "http://x/health", clock.now, timeout=0.2)
+
+        assert clock.delays[:5] == [0.01, 0.02, 0.04, 0.01, 0.02]
+
+    def test_startup_timeout(self, tmp_path, monkeypatch):
+        """Test a server that never answers fails the start and is stopped."""
+        from rtllib.config import settings
+
+        server = tmp_path / "server"
+        server.write_text(f"#!{sys.executable}\nimport time\nprint('booting', flush=True)\ntime.sleep(30)\n")
+        server.chmod(0o755)
+        monkeypatch.setitem(settings.timeouts, "startup", 0.3)
+
+        manager = ServerManager(server_mode="binary", binary_path=str(server), unix_socket=True, shared=False)
+        with pytest.raises(RuntimeError, match="(?s)failed to become ready.*booting"):
+            manager.start()
+
+        assert manager.process is None
+        assert not manager.is_running()
@@ -0,0 +1,126 @@
+"""ServerPool tests."""
+import threading
+
+import pytest
+
+from rtllib import server_pool
+from rtllib.server_pool import ServerPool
+
+
+class FakeServerManager:
+    """Stands in for ServerManager without starting a process."""
+
+    started = 0
+
+    def __init__(self, **kwargs):
+        self.host = "127.0.0.1"
+        self.port = None
+        self.uds = None
+        self._running = False
+
+    def start(self):
+        FakeServerManager.started += 1
+        self.port = 10000 + FakeServerManager.started
+        self._running = True
+        return self.host, self.port
+
+    def stop(self):
+        self._running = False
+
+    def is_running(self):
+        return self._running
+
+    def over_budget(self):
+        return False
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Pool of two fake servers."""
+    monkeypatch.setattr(server_pool, "ServerManager", FakeServerManager)
+    FakeServerManager.started = 0
+    pool = ServerPool(size=2, max_uses=0)
+    pool.start()
+    yield pool
+    pool.close()
+
+
+def wait_for_idle(pool, count):
+    """Wait until the pool has ``count`` idle servers."""
+    with pool._condition:
+        assert pool._condition.wait_for(lambda: len(pool._idle) >= count, timeout=5)
+
+
+class TestServerPool:
+    """Test warm server checkout and return."""
+
+    def test_prestarts_servers(self, pool):
+        """Test the pool fills up to its size in the background."""
+        wait_for_idle(pool, 2)
+        assert pool.idle_count() == 2
+        assert FakeServerManager.started == 2
+
+    def test_checkout_refills(self, pool):
+        """Test a checkout hands out a running server and starts a replacement."""
+        wait_for_idle(pool, 2)
+        manager = pool.checkout()
+
+        assert manager.is_running()
+        wait_for_idle(pool, 2)
+        assert FakeServerManager.started == 3
+        pool.checkin(manager, recycle=True)
+
+    def test_checkin_reuses_clean_server(self, pool):
+        """Test an unmodified server goes back to the pool."""
+        wait_for_idle(pool, 2)
+        manager = pool.checkout()
+        pool._idle.clear()
+        pool.checkin(manager)
+
+        assert manager.is_running()
+        assert pool.checkout() is manager
+
+    def test_checkin_recycles_modified_server(self, pool):
+        """Test a server with a modified design is stopped on return."""
+        wait_for_idle(pool, 2)
+        manager = pool.checkout()
+        pool.checkin(manager, recycle=True)
+
+        assert not manager.is_running()
+        assert manager not in pool._idle
+
+    def test_dead_idle_server_is_skipped(self, pool):
+        """Test checkout drops idle servers that exited."""
+        wait_for_idle(pool, 2)
+        dead = pool._idle[0]
+        dead.stop()
+
+        assert pool.checkout() is not dead
+
+    def test_concurrent_checkouts(self, pool):
+        """Test concurrent checkouts get distinct servers."""
+        managers = []
+        lock = threading.Lock()
+
+        def take():
+            manager = pool.checkout(timeout=5)
+            with lock:
+                managers.append(manager)
+
+        threads = [threading.Thread(target=take) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(m) for m in managers}) == 6
+
+    def test_close_stops_idle_servers(self, pool):
+        """Test closing the pool stops idle servers and rejects checkouts."""
+        wait_for_idle(pool, 2)
+        idle = list(pool._idle)
+        pool.close()
+
+        assert not any(m.is_running() for m in idle)
+        with pytest.raises(RuntimeError):
+            pool.checkout(timeout=0.1)
@@ -0,0 +1,251 @@
+"""ShardedClient tests."""
+from pathlib import Path
+
+import pytest
+
+from rtllib import ShardedClient
+from rtllib.sharded_client import _endpoint_client
+
+
+@pytest.fixture
+def sharded_client():
+    """Create a sharded client whose shards share the external server.
+
+    Requires: rtllib-server running on port 9000
+    """
+    client = ShardedClient(endpoints=["127.0.0.1:9000", "127.0.0.1:9000", "127.0.0.1:9000"], chunk_size=2)
+    client.read_verilog("/test.v")
+    yield client
+    client.close()
+
+
+class TestShardedClient:
+    """Test spreading per-module queries across shards."""
+
+    def test_results_in_input_order(self, sharded_client):
+        """Test results line up with the requested modules."""
+        modules = [m["name"] for m in sharded_client.get_modules(include=())]
+        requested = (modules * 3)[:7]
+
+        ports = sharded_client.get_ports_many(requested)
+        expected = sharded_client.clients[0].get_ports_many(set(requested))
+
+        assert list(ports) == list(dict.fromkeys(requested))
+        assert ports == expected
+
+    def test_single_module_queries(self, sharded_client):
+        """Test single-module queries match the Client's."""
+        module = sharded_client.get_modules(include=())[0]["name"]
+        client = sharded_client.clients[0]
+
+        assert sharded_client.get_ports(module) == client.get_ports(module)
+        assert sharded_client.get_nets(module) == client.get_nets(module)
+        assert sharded_client.get_instances(module) == client.get_instances(module)
+
+    def test_nets_and_instances(self, sharded_client):
+        """Test nets and instances are spread the same way."""
+        modules = [m["name"] for m in sharded_client.get_modules(include=())]
+
+        assert sharded_client.get_nets_many(modules).keys() == set(modules)
+        assert sharded_client.get_instances_many(modules).keys() == set(modules)
+
+    def test_empty_module_list(self, sharded_client):
+        """Test no modules give no results."""
+        assert sharded_client.get_ports_many([]) == {}
+
+    def test_health_check_per_shard(self, sharded_client):
+        """Test health is reported for every shard."""
+        health = sharded_client.health_check()
+
+        assert len(health) == 3
+        assert all(h["status"] == "ok" for h in health)
+
+    def test_broadcast_compile(self, sharded_client):
+        """Test design-changing calls reach every shard."""
+        result = sharded_client.compile()
+
+        assert isinstance(result, str)
+        assert all(len(client.journal) >= 2 for client in sharded_client.clients)
+
+
+class FakeShard:
+    """Stands in for a shard client; each file defines a module named after it."""
+
+    def __init__(self, index):
+        self.index = index
+        self.files = []
+        self.elaborated = []
+        self.added = []
+
+    def read_verilog_filelist(self, path):
+        lines = Path(path).read_text().splitlines()
+        self.files = [line for line in lines if not line.startswith(("+", "-"))]
+        return {"success": True, "files_read": len(self.files), "modules_found": len(self.files), "message": "ok"}
+
+    def elaborate(self):
+        # Specializes the modules this shard owns
+        self.elaborated = [f"{Path(f).stem}_w8" for f in self.files if Path(f).stem != "pkg"]
+        return "ok"
+
+    def get_modules(self, filter=None, hierarchical=False, include=None):
+        return [{"name": Path(f).stem} for f in self.files] + [{"name": name} for name in self.elaborated]
+
+    def get_ports_many(self, modules, filter=None, hierarchical=False):
+        names = {module["name"] for module in self.get_modules()}
+        return {module: self.index if module in names else None for module in modules}
+
+    def get_ports(self, module, filter=None, hierarchical=False):
+        return self.get_ports_many([module])[module]
+
+    def close(self):
+        pass
+
+    def add_ports(self, ports):
+        self.added.extend(port["module"] for port in ports)
+        return [{"success": port.get("fail") != self.index, "shard": self.index, "message": "ok"} for port in ports]
+
+
+@pytest.fixture
+def partitioned(tmp_path):
+    """Create a sharded client over fake shards with a partitioned filelist."""
+    for name, size in [("pkg", 10), ("a", 400), ("b", 300), ("c", 200), ("d", 100)]:
+        (tmp_path / f"{name}.sv").write_text("x" * size)
+    (tmp_path / "top.f").write_text("+incdir+inc\npkg.sv\na.sv\nb.sv\nc.sv\nd.sv\n")
+
+    client = ShardedClient(endpoints=["127.0.0.1:1", "127.0.0.1:2"])
+    client.clients = [FakeShard(0), FakeShard(1)]
+    result = client.read_verilog_filelist(str(tmp_path / "top.f"), partition=True, common_files=["pkg.sv"])
+    yield client, result
+    client.close()
+
+
+class TestPartitionedLoad:
+    """Test splitting a filelist across shards."""
+
+    def test_balanced_by_size(self, partitioned):
+        """Test files are split by size, keeping order and common files."""
+        client, _ = partitioned
+        stems = [[Path(f).stem for f in shard.files] for shard in client.clients]
+
+        assert stems == [["pkg", "a", "d"], ["pkg", "b", "c"]]
+
+    def test_merged_result(self, partitioned):
+        """Test the per-shard results are merged."""
+        _, result = partitioned
+
+        assert result["success"] is True
+        assert result["files_read"] == 5
+        assert result["modules_found"] == 5
+
+    def test_queries_routed_to_owner(self, partitioned):
+        """Test per-module queries go to the shard holding the module."""
+        client, _ = partitioned
+
+        assert client.get_ports_many(["a", "b", "c", "d"]) == {"a": 0, "b": 1, "c": 1, "d": 0}
+        assert [client.get_ports(module) for module in "abcd"] == [0, 1, 1, 0]
+        assert sorted(m["name"] for m in client.get_modules()) == ["a", "b", "c", "d", "pkg"]
+
+    def test_modules_created_by_elaboration(self, partitioned):
+        """Test modules that appear after elaboration are routed to their shard."""
+        client, _ = partitioned
+        client.get_ports_many(["a"])
+
+        client.elaborate()
+
+        assert client.get_ports_many(["a_w8", "b_w8", "c_w8", "d_w8"]) == {"a_w8": 0, "b_w8": 1, "c_w8": 1, "d_w8": 0}
+
+    def test_edits_routed_to_owner(self, partitioned):
+        """Test edits go to the owning shard, edits to common modules to all."""
+        client, _ = partitioned
+
+        results = client.add_ports([{"module": "c"}, {"module": "pkg"}, {"module": "a"}])
+
+        assert [result["shard"] for result in results] == [1, 0, 0]
+        assert sorted(client.clients[0].added) == ["a", "pkg"]
+        assert sorted(client.clients[1].added) == ["c", "pkg"]
+
+
+    def test_failure_on_any_shard_reported(self, partitioned):
+        """Test an edit failing on a later shard is not hidden by the first."""
+        client, _ = partitioned
+
+        [result] = client.add_ports([{"module": "pkg", "fail": 1}])
+
+        assert result["success"] is False
+        assert result["message"] == "shard 1: ok"
+
+    def test_broadcast_error_from_any_shard(self, partitioned):
+        """Test an error raised by a later shard is raised."""
+        client, _ = partitioned
+
+        def elaborate():
+            raise RuntimeError("elaboration failed")
+
+        client.clients[1].elaborate = elaborate
+
+        with pytest.raises(RuntimeError, match="elaboration failed"):
+            client.elaborate()
+
+
+class TestPartitionedShards:
+    """Test partitioned loads on real shards."""
+
+    def test_restart_and_reload(self, tmp_path):
+        """Test a shard replays its part after a restart, and reload() works.
+
+        Requires: rtllib-server running on port 9000
+        """
+        class Manager:
+            uds = None
+
+            def restart(self):
+                return "127.0.0.1", 9000
+
+            def is_running(self):
+                return True
+
+            def over_budget(self):
+                return False
+
+        for name in ("a", "b"):
+            (tmp_path / f"{name}.sv").write_text(f"module {name}; endmodule\n")
+        (tmp_path / "top.f").write_text("a.sv\nb.sv\n")
+
+        client = ShardedClient(endpoints=["127.0.0.1:9000", "127.0.0.1:9000"])
+        try:
+            assert client.read_verilog_filelist(str(tmp_path / "top.f"), partition=True)["success"]
+            generated = list(client._partition_filelists)
+
+            shard = client.clients[0]
+            shard._server_manager = Manager()
+            try:
+                shard._replace_server("test")
+            finally:
+                shard._server_manager = None
+
+            assert client.reload()["changed"] is False
+            (tmp_path / "b.sv").write_text("module b; wire w; endmodule\n")
+            assert client.reload()["files"] == [str(tmp_path / "b.sv")]
+        finally:
+            client.close()
+
+        assert not any(Path(path).exists() for path in generated)
+
+
+class TestEndpoints:
+    """Test endpoint parsing."""
+
+    def test_host_port(self):
+        """Test host:port endpoints."""
+        client = _endpoint_client("10.0.0.1:9100")
+        assert (client.host, client.port, client.uds) == ("10.0.0.1", 9100, None)
+
+    def test_unix_socket(self):
+        """Test unix:/path endpoints."""
+        client = _endpoint_client("unix:/run/rtllib.sock")
+        assert client.uds == "/run/rtllib.sock"
+
+    def test_invalid(self):
+        """Test endpoints without a port are rejected."""
+        with pytest.raises(ValueError):
+            _endpoint_client("localhost")
@@ -0,0 +1,85 @@
+"""Source change tracking tests."""
+import os
+
+from rtllib.sources import SourceTracker
+
+
+def test_edit_detected(tmp_path):
+    """Test an edited file is reported as changed."""
+    path = tmp_path / "a.v"
+    path.write_text("module a; endmodule\n")
+    tracker = SourceTracker()
+    tracker.track(str(path))
+
+    assert tracker.changed_files() == ([], [])
+    path.write_text("module a(input x); endmodule\n")
+    assert tracker.changed_files() == ([str(path)], [])
+
+
+def test_touch_is_not_a_change(tmp_path):
+    """Test a new mtime with the same content is not a change."""
+    path = tmp_path / "a.v"
+    path.write_text("module a; endmodule\n")
+    tracker = SourceTracker()
+    tracker.track(str(path))
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert tracker.changed_files() == ([], [])
+
+
+def test_deleted_and_unreadable(tmp_path):
+    """Test deleted files are reported and missing files are not tracked."""
+    path = tmp_path / "a.v"
+    path.write_text("module a; endmodule\n")
+    tracker = SourceTracker()
+    tracker.track(str(path))
+    tracker.track(str(tmp_path / "missing.v"))
+
+    assert len(tracker) == 1
+    path.unlink()
+    assert tracker.changed_files() == ([], [str(path)])
+
+
+def test_filelist(tmp_path):
+    """Test a filelist's files are tracked and edits to it are reported."""
+    (tmp_path / "a.v").write_text("module a; endmodule\n")
+    filelist = tmp_path / "top.f"
+    filelist.write_text("a.v\n")
+    tracker = SourceTracker()
+    tracker.track_filelist(str(filelist))
+
+    assert len(tracker) == 1
+    assert tracker.changed_filelists() == ([], [])
+    filelist.write_text("a.v\nb.v\n")
+    assert tracker.changed_filelists() == ([str(filelist)], [])
+
+
+def test_touched_filelist_is_not_a_change(tmp_path):
+    """Test a new mtime on a filelist with the same content is not a change."""
+    filelist = tmp_path / "top.f"
+    filelist.write_text("a.v\n")
+    tracker = SourceTracker()
+    tracker.track_filelist(str(filelist))
+
+    stat = filelist.stat()
+    os.utime(filelist, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert tracker.changed_filelists() == ([], [])
+
+
+def test_deleted_filelist(tmp_path):
+    """Test a deleted filelist is reported separately and can be forgotten."""
+    (tmp_path / "a.v").write_text("module a; endmodule\n")
+    filelist = tmp_path / "top.f"
+    filelist.write_text("a.v\n")
+    tracker = SourceTracker()
+    tracker.track_filelist(str(filelist))
+
+    filelist.unlink()
+    assert tracker.changed_filelists() == ([], [str(filelist)])
+
+    tracker.forget(str(filelist))
+    assert tracker.changed_filelists() == ([], [])
+    assert len(tracker) == 1
@@ -24,7 +24,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from rtllib.server_manager import ServerManager
 import socket
 import time
-import os
 import tempfile
 
 
@@ -80,19 +79,16 @@ def main():
         print(f"✅ 프로세스 ID: {manager.process.pid}")
         print(f"✅ 프로세스 상태: {'실행 중' if manager.process.poll() is None else '종료됨'}")
 
-    # 로그 파일 위치
-    if hasattr(manager, '_stdout_file'):
-        print(f"✅ stdout 로그: {manager._stdout_file.name}")
-    if hasattr(manager, '_stderr_file'):
-        print(f"✅ stderr 로그: {manager._stderr_file.name}")
+    # 서버 출력은 임시 파일 대신 메모리 링 버퍼에 보관됨
+    print(f"✅ 버퍼된 출력: {len(manager.last_output(n=10000))}줄 (manager.last_output()으로 조회)")
 
     # Step 4: 헬스체크 메커니즘
     print("\n[Step 4] 헬스체크 메커니즘")
     print("-" * 40)
     print("헬스체크 과정:")
-    print("1. 초기 3초 대기 (서버 부팅 시간)")
-    print("2. HTTP GET /health 또는 GraphQL healthCheck")
-    print("3. 최대 30회 재시도 (1초 간격)")
+    print("1. HTTP GET /health 를 5ms 간격부터 지수 백오프로 폴링 (최대 250ms)")
+    print("2. 서버 출력에 준비 완료 로그가 보이면 즉시 다시 확인")
+    print("3. startup 타임아웃까지 재시도")
 
     # 수동 헬스체크
     for i in range(5):
@@ -107,16 +103,14 @@ def main():
     print("\n[Step 5] 서버 로그 확인")
     print("-" * 40)
 
-    if hasattr(manager, '_stdout_file'):
-        # stdout 로그 읽기
-        with open(manager._stdout_file.name, 'r') as f:
-            logs = f.readlines()
-            if logs:
-                print("최근 서버 로그 (최대 5줄):")
-                for line in logs[-5:]:
-                    print(f"  > {line.strip()}")
-            else:
-                print("로그가 비어있습니다.")
+    # 최근 stdout/stderr 출력 읽기
+    logs = manager.last_output(n=5)
+    if logs:
+        print("최근 서버 로그 (최대 5줄):")
+        for line in logs:
+            print(f"  > {line}")
+    else:
+        print("로그가 비어있습니다.")
 
     # Step 6: 여러 ServerManager 인스턴스 관리
     print("\n[Step 6] 다중 서버 관리")
@@ -139,13 +133,8 @@ def main():
 
     print("✅ 서버 프로세스 종료")
 
-    # 로그 파일 정리 확인
-    if hasattr(manager, '_stdout_file'):
-        log_file = manager._stdout_file.name
-        if not os.path.exists(log_file):
-            print("✅ 로그 파일 자동 삭제됨")
-        else:
-            print(f"⚠️  로그 파일이 남아있음: {log_file}")
+    # 종료 후에도 마지막 출력은 조회 가능 (시작 실패 원인 확인용)
+    print(f"✅ 종료 후 마지막 출력: {manager.last_output(n=1)}")
 
     # Step 8: Context Manager 패턴
     print("\n[Step 8] Context Manager 사용")